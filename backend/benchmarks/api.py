@@ -0,0 +1,226 @@
+"""
+Latency and query counts for the main API endpoints.
+
+Seeds a SQLite database with posts, tags, categories, likes and comments,
+then drives the app in-process and reports p50/p95/p99 latency and
+queries per request for each scenario. Results are written as JSON so
+runs can be compared across commits.
+
+Usage: poetry run python benchmarks/api.py [--posts 10k] [--requests 200]
+       [--database bench.db] [--output results.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+from sqlmodel import Session, create_engine, select
+
+import backend.config.database as database
+from backend.config.data_generator import WORDS, BulkDataGenerator, parse_count
+from backend.config.database import get_session
+from backend.main import app
+from backend.middleware.query_counter import track_queries
+from backend.models import Category, Post, PostTag, Tag
+
+PASSWORD = "benchmark-password"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def seed(engine, posts: int, seed_value: int) -> None:
+    """Seed the database with `posts` posts and related rows."""
+    # Schema, roles, settings and extensions, printing suppressed
+    with contextlib.redirect_stdout(io.StringIO()):
+        database.create_db_and_tables()
+        database.create_extensions()
+        database.create_default_settings()
+        BulkDataGenerator(engine, posts=posts, seed=seed_value).generate()
+
+
+def use_database(path: str, posts: int, seed_value: int):
+    """Point the app at a benchmark database, seeding it if it is empty."""
+    engine = database.configure_sqlite(
+        create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    )
+
+    # Modules that imported the engine by name (view counter, sweeper) must
+    # write to the benchmark database too
+    original = database.engine
+    for module in list(sys.modules.values()):
+        if getattr(module, "__name__", "").startswith("backend") and getattr(module, "engine", None) is original:
+            module.engine = engine
+
+    def get_benchmark_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_benchmark_session
+
+    with Session(engine) as session:
+        try:
+            existing = session.exec(select(func.count(Post.id))).one()
+        except Exception:
+            existing = 0
+    if not existing:
+        start = time.perf_counter()
+        seed(engine, posts, seed_value)
+        print(f"Seeded {posts} posts in {time.perf_counter() - start:.1f}s")
+    else:
+        print(f"Using existing database with {existing} posts")
+    return engine
+
+
+def run_scenario(call: Callable[[int], object], requests: int, warmup: int = 5) -> Dict:
+    """Time `requests` calls of call(i) and count their queries."""
+    for i in range(warmup):
+        call(-1 - i)
+
+    latencies, queries, errors = [], [], 0
+    for i in range(requests):
+        with track_queries() as stats:
+            start = time.perf_counter()
+            response = call(i)
+            latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(stats.count)
+        if response.status_code >= 400:
+            errors += 1
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "queries_per_request": round(sum(queries) / len(queries), 2),
+    }
+
+
+def git_commit() -> str:
+    """Current commit, for comparing results across commits."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--posts", type=parse_count, default="10k", help="Posts to seed: 10k, 100k, 1m, ...")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=20, help="Measured logins (bcrypt bound)")
+    parser.add_argument("--database", help="SQLite file to seed or reuse (default: temporary file)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for data and request order")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    tmpdir = None
+    path = args.database
+    if not path:
+        tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmpdir.name, "bench.db")
+    engine = use_database(path, args.posts, args.seed)
+
+    rng = random.Random(args.seed)
+    with Session(engine) as session:
+        slugs = session.exec(select(Post.slug)).all()
+        post_ids = session.exec(select(Post.id)).all()
+        popular_tag = session.exec(
+            select(Tag.slug).join(PostTag).group_by(Tag.id).order_by(func.count().desc())
+        ).first()
+        category = session.exec(select(Category.slug)).first()
+
+    client = TestClient(app)
+    username = f"bench-client-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/auth/register",
+        json={"username": username, "email": f"{username}@example.com", "password": PASSWORD},
+    )
+    token = client.post(
+        "/auth/login", json={"username": username, "password": PASSWORD}
+    ).json()["session_token"]
+    client.cookies.clear()
+    auth = {"session_token": token}
+    liked = rng.sample(post_ids, min(len(post_ids), args.requests + 5))
+    commented = rng.choices(post_ids, k=args.requests + 5)
+
+    scenarios = {
+        "list_posts": lambda i: client.get("/posts"),
+        "list_posts_tag": lambda i: client.get("/posts", params={"tag": popular_tag}),
+        "list_posts_category": lambda i: client.get("/posts", params={"category": category}),
+        "search_posts": lambda i: client.get("/posts", params={"search": rng.choice(WORDS)}),
+        "get_post": lambda i: client.get(f"/posts/{rng.choice(slugs)}"),
+        "site_info": lambda i: client.get("/site/info"),
+        "like": lambda i: client.post(
+            f"/posts/{liked[i]}/likes", json={"post_id": str(liked[i])}, cookies=auth
+        ),
+        "unlike": lambda i: client.delete(f"/posts/{liked[i]}/likes", cookies=auth),
+        "create_comment": lambda i: client.post(
+            f"/posts/{commented[i]}/comments",
+            json={"post_id": str(commented[i]), "content": "Benchmark comment"},
+            cookies=auth,
+        ),
+    }
+
+    results = {}
+    for name, call in scenarios.items():
+        # like/unlike pair up on the same posts, so neither gets a warmup
+        warmup = 0 if name in ("like", "unlike") else 5
+        results[name] = run_scenario(call, args.requests, warmup)
+    results["login"] = run_scenario(
+        lambda i: client.post("/auth/login", json={"username": username, "password": PASSWORD}),
+        args.login_requests,
+        warmup=1,
+    )
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "posts": args.posts,
+            "requests": args.requests,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    print(f"{'scenario':<22}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>10}{'errors':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:<22}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['queries_per_request']:>10.1f}{result['errors']:>8}"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if tmpdir:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
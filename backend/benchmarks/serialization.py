@@ -0,0 +1,114 @@
+"""
+Per-page serialization cost of GET /posts.
+
+Compares FastAPI's response_model path (re-validate every PostRead,
+jsonable_encoder, stdlib JSONResponse) with the prevalidated fast path
+(pydantic-core dumps the already-built models straight to bytes).
+
+Usage: poetry run python benchmarks/serialization.py [--page-size 100] [--rounds 200]
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import sys
+import time
+import uuid
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from backend.main import app
+from backend.models.post import PostRead
+from backend.utils.responses import prevalidated_response
+
+
+def build_page(page_size: int) -> List[PostRead]:
+    """Build a page of posts shaped like real list_posts output."""
+    now = datetime.datetime.utcnow()
+    return [
+        PostRead(
+            id=uuid.uuid4(),
+            author_id=uuid.uuid4(),
+            author_name="Benchmark Author",
+            feather_type="text",
+            slug=f"benchmark-post-{i}",
+            title=f"Benchmark post {i}",
+            status="published",
+            published_at=now,
+            is_private=False,
+            view_count=i * 7,
+            created_at=now,
+            updated_at=now,
+            categories=[{"id": 1, "name": "Technology", "slug": "technology"}],
+            tags=[
+                {"id": 1, "name": "Python", "slug": "python"},
+                {"id": 2, "name": "Web Development", "slug": "web-development"},
+            ],
+            likes_count=i,
+            comments_count=i // 2,
+            content="Lorem ipsum dolor sit amet. " * 40,
+            excerpt="Lorem ipsum dolor sit amet. " * 4,
+        )
+        for i in range(page_size)
+    ]
+
+
+async def response_model_path(route: APIRoute, posts: List[PostRead]) -> bytes:
+    """What FastAPI does with a returned List[PostRead] and response_model."""
+    content = await serialize_response(field=route.response_field, response_content=posts)
+    return JSONResponse(content).body
+
+
+def fast_path(posts: List[PostRead]) -> bytes:
+    """What list_posts does now."""
+    return prevalidated_response(posts, List[PostRead]).body
+
+
+def time_per_call(fn, rounds: int) -> float:
+    """Best-of-three mean time per call, in milliseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        best = min(best, (time.perf_counter() - start) / rounds)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    route = next(
+        r for r in app.routes
+        if isinstance(r, APIRoute) and r.path == "/posts" and "GET" in r.methods
+    )
+    posts = build_page(args.page_size)
+    loop = asyncio.new_event_loop()
+
+    # Both paths must produce the same document
+    assert json.loads(loop.run_until_complete(response_model_path(route, posts))) == json.loads(
+        fast_path(posts)
+    )
+
+    before = time_per_call(
+        lambda: loop.run_until_complete(response_model_path(route, posts)), args.rounds
+    )
+    after = time_per_call(lambda: fast_path(posts), args.rounds)
+    loop.close()
+
+    print(f"Page of {args.page_size} posts, {len(fast_path(posts))} bytes")
+    print(f"  response_model path: {before:8.3f} ms/page")
+    print(f"  prevalidated path:   {after:8.3f} ms/page")
+    print(f"  speedup:             {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
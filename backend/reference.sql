@@ -46,6 +46,26 @@ CREATE TABLE role_permissions (
     PRIMARY KEY (role_id, permission_id)
 );
 
+CREATE TABLE user_sessions (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    session_token VARCHAR(255) UNIQUE NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_user_sessions_user_id ON user_sessions (user_id);
+
+CREATE INDEX idx_user_sessions_expires_at ON user_sessions (expires_at);
+
+-- Signed session tokens issued at or before not_before are revoked
+CREATE TABLE token_revocations (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    not_before TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE INDEX idx_token_revocations_not_before ON token_revocations (not_before);
+
 --
 -- 2. Core Blog Content (Posts & Feathers)
 --
@@ -60,7 +80,9 @@ CREATE TABLE posts (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     is_private BOOLEAN DEFAULT FALSE,
-    view_count INT DEFAULT 0
+    view_count INT DEFAULT 0,
+    likes_count INT DEFAULT 0 NOT NULL,
+    comments_count INT DEFAULT 0 NOT NULL
 );
 
 CREATE INDEX idx_posts_author_id ON posts (author_id);
@@ -69,12 +91,17 @@ CREATE INDEX idx_posts_status_published_at ON posts (status, published_at DESC);
 
 CREATE INDEX idx_posts_feather_type ON posts (feather_type);
 
+CREATE INDEX idx_posts_created_at_id ON posts (created_at DESC, id DESC);
+
 CREATE TABLE post_data (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     post_id UUID UNIQUE NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
     content TEXT,
     markdown_content TEXT,
     raw_markup TEXT,
+    rendered_html TEXT,
+    excerpt TEXT,
+    content_hash CHAR(64),
     media_url VARCHAR(255),
     media_thumbnail_url VARCHAR(255),
     media_type VARCHAR(50),
@@ -92,6 +119,15 @@ CREATE TABLE post_data (
     )
 );
 
+-- Full-text search document per post (Postgres tsvector, maintained by the app)
+CREATE TABLE post_search (
+    post_id UUID PRIMARY KEY REFERENCES posts(id) ON DELETE CASCADE,
+    body TEXT,
+    document TSVECTOR NOT NULL
+);
+
+CREATE INDEX idx_post_search_document ON post_search USING GIN (document);
+
 CREATE TABLE post_files (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     post_id UUID NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
@@ -99,6 +135,7 @@ CREATE TABLE post_files (
     filename VARCHAR(255) NOT NULL,
     file_type VARCHAR(100),
     file_size INT,
+    content_hash CHAR(64),
     description TEXT,
     uploaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -133,6 +170,13 @@ CREATE TABLE post_tags (
     PRIMARY KEY (post_id, tag_id)
 );
 
+-- Bumped when categories or tags change how posts render; part of post ETags
+CREATE TABLE taxonomy_version (
+    id INT PRIMARY KEY DEFAULT 1,
+    version INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE comments (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     post_id UUID NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
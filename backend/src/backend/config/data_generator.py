@@ -0,0 +1,319 @@
+"""
+Reproducible bulk data for capacity testing and benchmarks.
+
+Writes users, categories, tags, posts, post data, likes and comments with
+Core insert() executemany batches (no ORM objects, no per-row refresh),
+so a million-post corpus takes minutes instead of hours. Likes, comments
+and tag usage follow a Zipf distribution: a few posts and tags get most
+of the activity, like on a real blog. The same seed always produces the
+same rows.
+
+Usage: poetry run python -m backend.config.data_generator --posts 100k [--seed 1]
+"""
+import argparse
+import bisect
+import itertools
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
+
+from ..models import (
+    Category, Comment, CommentStatus, Like, Post, PostCategory, PostData,
+    PostStatus, PostTag, Role, Tag, User,
+)
+from ..utils.auth import hash_password
+from ..utils.rendering import content_hash, make_excerpt, render_markdown
+
+WORDS = (
+    "api async backend benchmark cache cloud code data database debug deploy "
+    "design docker engine fastapi feature frontend index latency library linux "
+    "markdown migration model network performance postgres python query react "
+    "release request schema security server session sqlite stack test theme "
+    "tutorial update web workflow"
+).split()
+
+# Generated timestamps end here, so the same seed gives the same rows on any day
+EPOCH = datetime(2025, 1, 1)
+
+
+def parse_count(value: str) -> int:
+    """Parse counts like 10000, 10k or 1m."""
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    return int(float(value.rstrip("km")) * multiplier)
+
+
+def zipf_weights(n: int, exponent: float) -> List[float]:
+    """Cumulative Zipf weights for ranks 1..n, for random.choices(cum_weights=...)."""
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, n + 1)))
+
+
+class BulkDataGenerator:
+    """
+    Seeded generator of a blog corpus.
+
+    Post popularity is a random permutation of Zipf ranks; a post's likes
+    and comments are its share of the totals (`likes_per_post` and
+    `comments_per_post` on average), capped by the number of users. Tags
+    are drawn with Zipf weights too. Posts are spread over the `days`
+    before `epoch`. Denormalized like/comment counters are written with
+    the posts, and the search index is rebuilt at the end.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        posts: int,
+        seed: int = 1,
+        users: Optional[int] = None,
+        categories: int = 20,
+        tags: int = 200,
+        likes_per_post: float = 2.0,
+        comments_per_post: float = 0.5,
+        zipf_exponent: float = 1.1,
+        batch_size: int = 5000,
+        render: bool = True,
+        password: str = "password123",
+        days: int = 365,
+        epoch: datetime = EPOCH,
+    ):
+        self.engine = engine
+        self.posts = posts
+        self.seed = seed
+        self.users = users if users is not None else max(10, posts // 100)
+        self.categories = categories
+        self.tags = tags
+        self.likes_per_post = likes_per_post
+        self.comments_per_post = comments_per_post
+        self.zipf_exponent = zipf_exponent
+        self.batch_size = batch_size
+        self.render = render
+        self.password = password
+        self.days = days
+        self.epoch = epoch
+        self.rng = random.Random(seed)
+
+    def generate(self) -> Dict[str, int]:
+        """Write the corpus. Returns the number of rows written per table."""
+        from ..services.permission_service import PermissionService
+        from ..services.search_service import get_search_index
+
+        SQLModel.metadata.create_all(self.engine)
+        counts = dict.fromkeys(
+            ("users", "posts", "post_tags", "likes", "comments"), 0
+        )
+        with Session(self.engine) as session:
+            PermissionService(session).ensure_initial_data()
+            user_ids = self._insert_users(session)
+            counts["users"] = len(user_ids)
+            category_ids = self._ensure_taxonomy(session, Category, "category", self.categories)
+            tag_ids = self._ensure_taxonomy(session, Tag, "tag", self.tags)
+            session.commit()
+
+            likes = self._zipf_shares(self.posts * self.likes_per_post)
+            comments = self._zipf_shares(self.posts * self.comments_per_post)
+            tag_weights = zipf_weights(len(tag_ids), self.zipf_exponent)
+            for start in range(0, self.posts, self.batch_size):
+                end = min(start + self.batch_size, self.posts)
+                for table, written in self._insert_post_batch(
+                    session, start, end, user_ids, category_ids, tag_ids,
+                    likes, comments, tag_weights,
+                ).items():
+                    counts[table] += written
+                session.commit()
+
+            get_search_index(session).rebuild()
+            session.commit()
+        return counts
+
+    def _uuid(self) -> uuid.UUID:
+        """A UUID drawn from the seeded RNG, so reruns produce the same ids."""
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _insert_users(self, session: Session) -> List[uuid.UUID]:
+        role_id = session.exec(select(Role.id).where(Role.name == "user")).one()
+        password_hash = hash_password(self.password)
+        joined = self.epoch - timedelta(days=self.days)
+        rows = [
+            {
+                "id": self._uuid(),
+                "username": f"user-{self.seed}-{i}",
+                "email": f"user-{self.seed}-{i}@example.com",
+                "password_hash": password_hash,
+                "display_name": f"User {i}",
+                "role_id": role_id,
+                "created_at": joined,
+                "updated_at": joined,
+            }
+            for i in range(self.users)
+        ]
+        for start in range(0, len(rows), self.batch_size):
+            session.execute(insert(User), rows[start:start + self.batch_size])
+        return [row["id"] for row in rows]
+
+    @staticmethod
+    def _ensure_taxonomy(session: Session, model, prefix: str, count: int) -> List[int]:
+        """Create `count` categories or tags, reusing any that already exist."""
+        slugs = [f"{prefix}-{i}" for i in range(count)]
+        existing = set(session.exec(select(model.slug).where(model.slug.in_(slugs))).all())
+        missing = [
+            {"name": f"{prefix.title()} {i}", "slug": slug}
+            for i, slug in enumerate(slugs)
+            if slug not in existing
+        ]
+        if missing:
+            session.execute(insert(model), missing)
+        ids_by_slug = dict(session.exec(select(model.slug, model.id).where(model.slug.in_(slugs))).all())
+        # Keep generation order, so Zipf rank 1 is always <prefix>-0
+        return [ids_by_slug[slug] for slug in slugs]
+
+    def _zipf_shares(self, total: float) -> Sequence[float]:
+        """Expected count per post for a Zipf split of `total` over random popularity ranks."""
+        weights = [1 / rank ** self.zipf_exponent for rank in range(1, self.posts + 1)]
+        scale = total / sum(weights)
+        self.rng.shuffle(weights)
+        return [weight * scale for weight in weights]
+
+    def _draw(self, expected: float) -> int:
+        """Round an expected count randomly, keeping its mean."""
+        whole = int(expected)
+        return whole + (self.rng.random() < expected - whole)
+
+    def _content(self, title: str) -> str:
+        """A short markdown document."""
+        paragraphs = [
+            " ".join(self.rng.choices(WORDS, k=self.rng.randint(20, 60))).capitalize() + "."
+            for _ in range(self.rng.randint(1, 4))
+        ]
+        return f"# {title}\n\n" + "\n\n".join(paragraphs)
+
+    def _insert_post_batch(
+        self,
+        session: Session,
+        start: int,
+        end: int,
+        user_ids: List[uuid.UUID],
+        category_ids: List[int],
+        tag_ids: List[int],
+        like_shares: Sequence[float],
+        comment_shares: Sequence[float],
+        tag_weights: List[float],
+    ) -> Dict[str, int]:
+        spacing = timedelta(days=self.days) / max(1, self.posts)
+        posts, post_data, post_categories, post_tags, likes, comments = [], [], [], [], [], []
+
+        for i in range(start, end):
+            post_id = self._uuid()
+            created_at = self.epoch - spacing * (self.posts - i)
+            title = f"Post {i}: " + " ".join(self.rng.choices(WORDS, k=4))
+            content = self._content(title)
+
+            likers = self.rng.sample(user_ids, min(len(user_ids), self._draw(like_shares[i])))
+            comment_count = self._draw(comment_shares[i])
+            posts.append({
+                "id": post_id,
+                "author_id": self.rng.choice(user_ids),
+                "feather_type": "text",
+                "slug": f"post-{self.seed}-{i}",
+                "title": title,
+                "status": PostStatus.PUBLISHED,
+                "published_at": created_at,
+                "is_private": False,
+                "view_count": 0,
+                "likes_count": len(likers),
+                "comments_count": comment_count,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            post_data.append({
+                "id": self._uuid(),
+                "post_id": post_id,
+                "content": content,
+                "rendered_html": render_markdown(content) if self.render else None,
+                "excerpt": make_excerpt(content) if self.render else None,
+                "content_hash": content_hash(content) if self.render else None,
+            })
+            post_categories.append(
+                {"post_id": post_id, "category_id": self.rng.choice(category_ids)}
+            )
+            if tag_ids:
+                chosen = {
+                    tag_ids[bisect.bisect_left(
+                        tag_weights, self.rng.random() * tag_weights[-1]
+                    )]
+                    for _ in range(self.rng.randint(0, 3))
+                }
+                post_tags.extend({"post_id": post_id, "tag_id": tag_id} for tag_id in chosen)
+            likes.extend(
+                {"id": self._uuid(), "post_id": post_id, "user_id": user_id, "created_at": created_at}
+                for user_id in likers
+            )
+            comments.extend(
+                {
+                    "id": self._uuid(),
+                    "post_id": post_id,
+                    "author_id": self.rng.choice(user_ids),
+                    "content": " ".join(self.rng.choices(WORDS, k=self.rng.randint(5, 30))),
+                    "status": CommentStatus.APPROVED,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                for _ in range(comment_count)
+            )
+
+        for table, rows in (
+            (Post, posts),
+            (PostData, post_data),
+            (PostCategory, post_categories),
+            (PostTag, post_tags),
+            (Like, likes),
+            (Comment, comments),
+        ):
+            if rows:
+                session.execute(insert(table), rows)
+        return {
+            "posts": len(posts),
+            "post_tags": len(post_tags),
+            "likes": len(likes),
+            "comments": len(comments),
+        }
+
+
+def main():
+    from .database import engine
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--posts", type=parse_count, default="10k", help="Posts to write: 10k, 100k, 1m, ...")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--users", type=parse_count, default=None, help="Default: posts / 100")
+    parser.add_argument("--likes-per-post", type=float, default=2.0)
+    parser.add_argument("--comments-per-post", type=float, default=0.5)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--no-render", action="store_true", help="Skip storing rendered HTML/excerpts")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = BulkDataGenerator(
+        engine,
+        posts=args.posts,
+        seed=args.seed,
+        users=args.users,
+        likes_per_post=args.likes_per_post,
+        comments_per_post=args.comments_per_post,
+        zipf_exponent=args.zipf_exponent,
+        batch_size=args.batch_size,
+        render=not args.no_render,
+    ).generate()
+    summary = ", ".join(f"{count} {table}" for table, count in counts.items())
+    print(f"Wrote {summary} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
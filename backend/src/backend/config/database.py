@@ -1,19 +1,132 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import SQLModel, create_engine, Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.config import settings
-from typing import Generator
+from backend.config.pool_metrics import (
+    InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_metrics,
+)
+from backend.config.replicas import ReplicaSet, SessionRouter
+from typing import AsyncGenerator, Generator, Optional, Union
 from ..models.system import Extension, Setting
 from ..models.post import Post, PostData
 from ..models.user import User, Role, Permission
 from ..utils.auth import hash_password
 
 
+def sqlite_pragmas() -> list:
+    """The SQLite connection profile from settings, as (pragma, value) pairs."""
+    return [
+        # First, so switching the journal mode waits out other writers
+        ("busy_timeout", settings.sqlite_busy_timeout_ms),
+        ("journal_mode", settings.sqlite_journal_mode),
+        ("synchronous", settings.sqlite_synchronous),
+        ("foreign_keys", "ON" if settings.sqlite_foreign_keys else "OFF"),
+        ("cache_size", settings.sqlite_cache_size),
+        ("mmap_size", settings.sqlite_mmap_size),
+        ("temp_store", settings.sqlite_temp_store),
+    ]
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None):
+    """Connect listener applying the SQLite profile to a new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in sqlite_pragmas():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
+
+
+def configure_sqlite(target: Engine) -> Engine:
+    """Apply the SQLite profile to every connection an engine opens (no-op for other backends)."""
+    if target.dialect.name == "sqlite":
+        event.listen(target, "connect", apply_sqlite_pragmas)
+    return target
+
+
+def optimize_database(target: Optional[Engine] = None):
+    """
+    Let SQLite refresh query planner statistics; run on shutdown.
+
+    PRAGMA optimize on a fresh connection only looks at tables that
+    connection used, so the 0x10000 flag asks it to check every table
+    (SQLite 3.46+; older versions ignore it).
+    """
+    target = target or engine
+    if target.dialect.name != "sqlite" or not settings.sqlite_optimize_on_shutdown:
+        return
+    with target.connect() as connection:
+        connection.exec_driver_sql("PRAGMA analysis_limit=400")
+        connection.exec_driver_sql("PRAGMA optimize=0x10002")
+    target.dispose()
+
+
+def engine_options(database_url: str, use_async: bool = False) -> dict:
+    """Engine and pool arguments from settings."""
+    options = {
+        "echo": False,  # Log SQL queries in debug mode
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite keeps its single-connection pool
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if use_async else InstrumentedQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+    )
+    return options
+
+
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    echo=False,  # Log SQL queries in debug mode
-    pool_pre_ping=True,   # Verify connections before use
-    pool_recycle=300,     # Recycle connections every 5 minutes
-)
+engine = configure_sqlite(create_engine(settings.database_url, **engine_options(settings.database_url)))
+pool_metrics.register("primary", engine)
+
+# Read replicas for read-only requests (DATABASE_REPLICA_URLS)
+replica_set: Optional[ReplicaSet] = None
+if settings.database_replica_urls:
+    replica_set = ReplicaSet([
+        configure_sqlite(create_engine(url, **engine_options(url)))
+        for url in settings.database_replica_urls
+    ])
+    for index, replica in enumerate(replica_set.engines):
+        pool_metrics.register(f"replica-{index}", replica)
+
+# Global session router instance
+session_router = SessionRouter(engine, replica_set)
+
+# Async driver used for each database backend in async mode
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Swap the driver in a database URL for its async counterpart."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver available for database backend '{backend}'")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+# Create async database engine when async mode is enabled
+async_engine: Optional[AsyncEngine] = None
+if settings.database_async:
+    async_database_url = get_async_database_url(settings.database_url)
+    async_engine = create_async_engine(
+        async_database_url, **engine_options(async_database_url, use_async=True)
+    )
+    configure_sqlite(async_engine.sync_engine)
+    pool_metrics.register("async", async_engine.sync_engine)
 
 
 def create_db_and_tables():
@@ -22,13 +135,64 @@ def create_db_and_tables():
     print(engine.url)
     SQLModel.metadata.create_all(engine)
 
+    # The search index lives outside the model metadata, so create it
+    # explicitly for databases where post_data already existed
+    from backend.services.search_service import get_search_index
 
-def get_session() -> Generator[Session, None, None]:
-    """Dependency to get database session."""
     with Session(engine) as session:
+        get_search_index(session).ensure_schema()
+        session.commit()
+
+
+def get_session() -> Generator[Session, None, None]:
+    """Dependency to get database session (on a replica for read-only requests, if configured)."""
+    with session_router.session() as session:
+        yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session."""
+    if async_engine is None:
+        raise RuntimeError("Async database mode is disabled; set DATABASE_ASYNC=true")
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
         yield session
 
 
+# Dependency for routes that work in either mode: an AsyncSession when
+# DATABASE_ASYNC is enabled, otherwise a regular Session
+get_db_session = get_async_session if async_engine is not None else get_session
+
+DbSession = Union[Session, AsyncSession]
+
+
+def reconcile_post_counters():
+    """Rebuild denormalized post counters from the likes and comments tables."""
+    from backend.services.blog_service import BlogService
+
+    with Session(engine) as session:
+        updated = BlogService(session).reconcile_post_counters()
+        print(f"Reconciled counters for {updated} posts")
+
+
+def rebuild_search_index():
+    """Rebuild the post full-text search index from the posts tables."""
+    from backend.services.search_service import get_search_index
+
+    with Session(engine) as session:
+        indexed = get_search_index(session).rebuild()
+        session.commit()
+        print(f"Indexed {indexed} posts for search")
+
+
+def backfill_rendered_posts():
+    """Render HTML and excerpts for posts saved before they were stored."""
+    from backend.services.blog_service import BlogService
+
+    with Session(engine) as session:
+        rendered = BlogService(session).backfill_rendered_posts()
+        print(f"Rendered {rendered} posts")
+
+
 def create_extensions():
     """Create default extensions if they don't exist."""
     from backend.models.system import Extension
@@ -85,6 +249,7 @@ def create_sample_data():
     """Create sample user and posts for testing."""
     from backend.models.user import User
     from backend.models.post import Post, PostData, PostStatus
+    from backend.services.blog_service import render_post_data
     from backend.utils import hash_password
     import uuid
     from datetime import datetime
@@ -146,6 +311,7 @@ def create_sample_data():
                 post_id=post.id,
                 content=post_info["content"]
             )
+            render_post_data(post_data)
             session.add(post_data)
             print(f"Created sample post: {post_info['title']}")
         
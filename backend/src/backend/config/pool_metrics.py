@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """
+    Checkout counters for one connection pool.
+
+    Records how long each checkout waited (including pre-ping), how many
+    timed out at DATABASE_POOL_TIMEOUT, and how many physical connections
+    were opened or invalidated. Combined with the pool's live status this
+    is what's needed to size DATABASE_POOL_SIZE and DATABASE_MAX_OVERFLOW
+    against the server's connection limit across workers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.connections_created = 0
+            self.invalidations = 0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def record_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_max = max(self.wait_max, wait)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connections_created += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool) -> Dict:
+        """Counters plus the pool's current status."""
+        with self._lock:
+            stats = {
+                "pool": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_total * 1000, 3),
+                "wait_ms_avg": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+                "connections_created": self.connections_created,
+                "invalidations": self.invalidations,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                # QueuePool counts overflow from -size; only connections beyond size matter
+                overflow=max(0, pool.overflow()),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        return stats
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times checkouts into the PoolMetrics registered for it."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super().connect()
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            metrics.record_timeout(time.perf_counter() - start)
+            raise
+        metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep recording into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Async-adapted variant of InstrumentedQueuePool."""
+
+
+class PoolMetricsRegistry:
+    """Pool metrics for each engine the app creates, by name."""
+
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+        self._metrics: Dict[str, PoolMetrics] = {}
+
+    def register(self, name: str, engine: Engine) -> PoolMetrics:
+        """Start recording pool metrics for an engine (the sync_engine for async engines)."""
+        metrics = PoolMetrics()
+        if isinstance(engine.pool, InstrumentedQueuePool):
+            engine.pool.metrics = metrics
+        event.listen(engine, "connect", lambda *args: metrics.record_connect())
+        event.listen(engine, "invalidate", lambda *args: metrics.record_invalidation())
+        self._engines[name] = engine
+        self._metrics[name] = metrics
+        return metrics
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Metrics and status of every registered pool."""
+        return {
+            name: self._metrics[name].snapshot(engine.pool)
+            for name, engine in self._engines.items()
+        }
+
+    def reset(self) -> None:
+        for metrics in self._metrics.values():
+            metrics.reset()
+
+
+# Global pool metrics registry instance
+pool_metrics = PoolMetricsRegistry()
@@ -0,0 +1,199 @@
+import asyncio
+import itertools
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import Delete, Insert, Update, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.selectable import SelectBase
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+# Requests that may read from a replica
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class RequestRouting:
+    """Replica routing for the request running in the current context."""
+
+    # Safe method and no recent write by this client
+    read_only: bool
+    # Set once the request writes to the primary
+    wrote: bool = False
+
+
+_request_routing: ContextVar[Optional[RequestRouting]] = ContextVar("request_routing", default=None)
+
+
+@contextmanager
+def route_request(read_only: bool) -> Iterator[RequestRouting]:
+    """Route the sessions opened in this block; read-only blocks may use a replica."""
+    routing = RequestRouting(read_only=read_only)
+    token = _request_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _request_routing.reset(token)
+
+
+def _is_write(clause) -> bool:
+    if isinstance(clause, (Insert, Update, Delete)):
+        return True
+    return isinstance(clause, TextClause) and not _is_read_text(clause)
+
+
+def _is_read(clause) -> bool:
+    return isinstance(clause, SelectBase) or (
+        isinstance(clause, TextClause) and _is_read_text(clause)
+    )
+
+
+def _is_read_text(clause: TextClause) -> bool:
+    words = clause.text.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() in ("SELECT", "WITH")
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica and writes to the primary.
+
+    Flushes, INSERT/UPDATE/DELETE statements and non-SELECT text go to the
+    primary, as does session.connection() without a statement. After the
+    first write, reads go to the primary too, so the session sees its own
+    changes. The request's RequestRouting is marked as having written.
+    """
+
+    def __init__(self, primary: Engine, replica: Engine, routing: Optional[RequestRouting] = None, **kwargs):
+        super().__init__(bind=primary, **kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.routing = routing
+        self.wrote = False
+        # Set by reading_from_primary()
+        self.read_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or _is_write(clause):
+            self.wrote = True
+            if self.routing is not None:
+                self.routing.wrote = True
+            return self.primary
+        if not self.wrote and not self.read_primary and _is_read(clause):
+            return self.replica
+        return self.primary
+
+
+@contextmanager
+def reading_from_primary(session: Session) -> Iterator[Session]:
+    """
+    Send a session's reads to the primary inside the block.
+
+    Process-wide caches load their misses this way: a lagging replica
+    would otherwise refill them with rows a write has just replaced, and
+    the stale copy would then be served to every client, writer included.
+    No-op for sessions that aren't routed.
+    """
+    if not isinstance(session, RoutingSession):
+        yield session
+        return
+    previous = session.read_primary
+    session.read_primary = True
+    try:
+        yield session
+    finally:
+        session.read_primary = previous
+
+
+class ReplicaSet:
+    """
+    Read replicas, picked round-robin among the healthy ones.
+
+    A replica is taken out of rotation when a connection to it fails, or
+    when a health check (SELECT 1) fails. It returns once a check passes.
+    """
+
+    def __init__(self, engines: Sequence[Engine]):
+        self.engines: List[Engine] = list(engines)
+        self._healthy: Dict[Engine, bool] = {engine: True for engine in self.engines}
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def choose(self) -> Optional[Engine]:
+        """Next healthy replica, or None if all are down."""
+        with self._lock:
+            healthy = [engine for engine in self.engines if self._healthy[engine]]
+            if not healthy:
+                return None
+            return healthy[next(self._next) % len(healthy)]
+
+    def healthy(self) -> List[Engine]:
+        with self._lock:
+            return [engine for engine in self.engines if self._healthy[engine]]
+
+    def mark_down(self, engine: Engine) -> None:
+        self._set_health(engine, False)
+
+    def check(self) -> int:
+        """Ping every replica and update its health. Returns the number healthy."""
+        for engine in self.engines:
+            try:
+                with engine.connect() as connection:
+                    connection.exec_driver_sql("SELECT 1")
+            except Exception as e:
+                logger.debug(f"Replica {engine.url!r} health check failed: {e}")
+                self._set_health(engine, False)
+            else:
+                self._set_health(engine, True)
+        return len(self.healthy())
+
+    async def run_periodic_check(self, interval: float) -> None:
+        """Check replica health every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.check)
+
+    def _set_health(self, engine: Engine, healthy: bool) -> None:
+        with self._lock:
+            changed = self._healthy[engine] != healthy
+            self._healthy[engine] = healthy
+        if changed:
+            state = "back in rotation" if healthy else "out of rotation"
+            logger.warning(f"Replica {engine.url!r} {state}")
+
+    def _on_error(self, context) -> None:
+        # Failed connects and dropped connections; statement errors don't count
+        if context.is_disconnect or context.connection is None:
+            self.mark_down(context.engine)
+
+
+class SessionRouter:
+    """
+    Opens request sessions on the primary or a replica.
+
+    Without replicas, or outside a routed request, every session uses
+    the primary. Within a routed request:
+
+    - read-only requests get a RoutingSession on the next healthy replica;
+    - other requests get a RoutingSession whose "replica" is the primary,
+      so their writes are still recorded for read-your-writes stickiness.
+    """
+
+    def __init__(self, primary: Engine, replicas: Optional[ReplicaSet] = None):
+        self.primary = primary
+        self.replicas = replicas
+
+    def session(self) -> Session:
+        routing = _request_routing.get()
+        if self.replicas is None or routing is None:
+            return Session(self.primary)
+        replica = self.replicas.choose() if routing.read_only else None
+        return RoutingSession(self.primary, replica or self.primary, routing)
@@ -11,6 +11,33 @@ class Settings:
     def __init__(self):
         # Database
         self.database_url = os.getenv("DATABASE_URL", "sqlite:///./blog.db")
+        # Serve requests through an async engine (aiosqlite/asyncpg by backend)
+        self.database_async = os.getenv("DATABASE_ASYNC", "False").lower() == "true"
+        # Read replicas (comma-separated URLs); read-only requests are routed to them
+        self.database_replica_urls = [
+            url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+        ]
+        # Clients read from the primary for this long after a write
+        self.database_replica_sticky_seconds = float(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", "5"))
+        self.database_replica_health_interval = float(os.getenv("DATABASE_REPLICA_HEALTH_INTERVAL", "10"))
+        # Connection pool (per engine, per worker process)
+        self.database_pool_size = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+        self.database_max_overflow = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+        self.database_pool_timeout = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+        self.database_pool_recycle = int(os.getenv("DATABASE_POOL_RECYCLE", "300"))
+        # Test each connection with a round trip on checkout
+        self.database_pool_pre_ping = os.getenv("DATABASE_POOL_PRE_PING", "True").lower() == "true"
+        # SQLite connection profile, applied to every new connection
+        self.sqlite_journal_mode = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+        self.sqlite_synchronous = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+        self.sqlite_busy_timeout_ms = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+        # Negative cache sizes are in KiB (default 64 MiB per connection)
+        self.sqlite_cache_size = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+        self.sqlite_mmap_size = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+        self.sqlite_temp_store = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+        # Off by default: post, category and user deletes don't remove dependent rows yet
+        self.sqlite_foreign_keys = os.getenv("SQLITE_FOREIGN_KEYS", "False").lower() == "true"
+        self.sqlite_optimize_on_shutdown = os.getenv("SQLITE_OPTIMIZE_ON_SHUTDOWN", "True").lower() == "true"
 
         # Application
         self.secret_key = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
@@ -21,9 +48,50 @@ class Settings:
 
         # Session
         self.session_expire_hours = int(os.getenv("SESSION_EXPIRE_HOURS", "24"))
+        # Sliding expiry: extend a session once less than this fraction of its lifetime remains
+        self.session_refresh_fraction = float(os.getenv("SESSION_REFRESH_FRACTION", "0.5"))
+        # "database" keeps sessions in user_sessions; "signed" issues HMAC-signed
+        # tokens (SECRET_KEY) that validate without a session lookup
+        self.session_token_mode = os.getenv("SESSION_TOKEN_MODE", "database").lower()
+        self.token_revocation_ttl_seconds = float(os.getenv("TOKEN_REVOCATION_TTL_SECONDS", "30"))
+        # Expired session sweeper (background task, bounded batches per run)
+        self.session_sweep_interval = float(os.getenv("SESSION_SWEEP_INTERVAL", "300"))
+        self.session_sweep_batch_size = int(os.getenv("SESSION_SWEEP_BATCH_SIZE", "1000"))
+        self.session_sweep_max_batches = int(os.getenv("SESSION_SWEEP_MAX_BATCHES", "50"))
+
+        # Password hashing (bcrypt cost factor and worker pool bounds)
+        self.bcrypt_rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
+        self.password_hash_workers = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.password_hash_queue_limit = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "32"))
+
+        # Authenticated user cache (per process)
+        self.auth_cache_ttl_seconds = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+        self.auth_cache_max_entries = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
         
         # Media/File storage
         self.media_dir = os.getenv("MEDIA_DIR", "media")
+        self.upload_max_bytes = int(os.getenv("UPLOAD_MAX_BYTES", str(500 * 1024 * 1024)))
+        self.upload_chunk_size = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+        # Whole multipart request body; defaults to one maximum-size file plus framing
+        self.upload_max_request_bytes = int(
+            os.getenv("UPLOAD_MAX_REQUEST_BYTES", str(self.upload_max_bytes + 1024 * 1024))
+        )
+
+        # Site configuration snapshot (per process)
+        self.site_config_ttl_seconds = float(os.getenv("SITE_CONFIG_TTL_SECONDS", "300"))
+
+        # Rendered post cache (in-process unless POST_CACHE_URL names a Redis server)
+        self.post_cache_url = os.getenv("POST_CACHE_URL", "")
+        self.post_cache_ttl_seconds = float(os.getenv("POST_CACHE_TTL_SECONDS", "60"))
+        self.post_cache_max_entries = int(os.getenv("POST_CACHE_MAX_ENTRIES", "1000"))
+
+        # Per-request query counting (Server-Timing header, repeated statement warnings)
+        self.query_counter_enabled = os.getenv("QUERY_COUNTER_ENABLED", str(self.debug)).lower() == "true"
+        self.query_repeat_threshold = int(os.getenv("QUERY_REPEAT_THRESHOLD", "5"))
+
+        # View counting (buffered in memory, flushed periodically)
+        self.view_count_flush_interval = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "10"))
+        self.view_count_max_buffered = int(os.getenv("VIEW_COUNT_MAX_BUFFERED", "1000"))
 
 
 # Global settings instance
@@ -8,6 +8,7 @@ from .blog_controller import router as blog_router
 from .theme_controller import router as theme_router
 from .uploader_controller import router as uploader_router
 from .site_controller import router as site_router
+from .metrics_controller import router as metrics_router
 
 __all__ = [
     "auth_router", 
@@ -19,5 +20,6 @@ __all__ = [
     "blog_router",
     "theme_router", 
     "uploader_router",
-    "site_router"
+    "site_router",
+    "metrics_router"
 ]
@@ -1,22 +1,25 @@
 from fastapi import APIRouter, Depends, Response, Request
-from sqlmodel import Session
 from typing import Optional
 
-from backend.config.database import get_session
 from backend.models import UserLogin, UserCreate, UserRead, SessionRead
-from backend.services import UserService, SessionService
-from backend.middleware import get_current_user, require_auth
+from backend.services.async_services import (
+    AsyncSessionService,
+    AsyncUserService,
+    get_session_service,
+    get_user_service,
+)
+from backend.middleware import get_current_user, require_auth, set_session_cookie
 from backend.utils import AuthenticationError, ValidationError
+from backend.utils.tokens import is_signed_token
 
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
 @router.post("/register", response_model=UserRead)
-async def register(user_data: UserCreate, session: Session = Depends(get_session)):
+async def register(user_data: UserCreate, user_service: AsyncUserService = Depends(get_user_service)):
     """Register a new user."""
-    user_service = UserService(session)
-    user = user_service.create_user(user_data)
+    user = await user_service.create_user(user_data)
     return user
 
 
@@ -24,14 +27,13 @@ async def register(user_data: UserCreate, session: Session = Depends(get_session
 async def login(
     user_credentials: UserLogin,
     response: Response,
-    session: Session = Depends(get_session),
+    user_service: AsyncUserService = Depends(get_user_service),
+    session_service: AsyncSessionService = Depends(get_session_service),
 ):
     """Login user and create session."""
-    user_service = UserService(session)
-    session_service = SessionService(session)
 
     # Authenticate user
-    user = user_service.authenticate_user(
+    user = await user_service.authenticate_user(
         user_credentials.username, user_credentials.password
     )
 
@@ -39,24 +41,15 @@ async def login(
         raise AuthenticationError("Invalid username or password")
 
     # Create session
-    user_session = session_service.create_session(user.id)
+    token, expires_at = await session_service.issue_token(user)
 
     # Set cookie
-    response.set_cookie(
-        key="session_token",
-        value=user_session.session_token,
-        httponly=True,
-        secure=False,  # Set to True in production with HTTPS
-        samesite="lax",
-        max_age=60 * 60 * 24 * 7,  # 7 days
-        expires=60 * 60 * 24 * 7,  # redundant but some browsers require it
-        path="/",
-    )
+    set_session_cookie(response, token, expires_at)
 
     return {
         "message": "Login successful",
         "user": UserRead.model_validate(user),
-        "session_token": user_session.session_token,
+        "session_token": token,
     }
 
 
@@ -64,11 +57,10 @@ async def login(
 async def logout(
     request: Request,
     response: Response,
-    session: Session = Depends(get_session),
+    session_service: AsyncSessionService = Depends(get_session_service),
     current_user=Depends(require_auth),
 ):
     """Logout user and delete session."""
-    session_service = SessionService(session)
 
     # Get token from cookie or header
     token = request.cookies.get("session_token")
@@ -79,7 +71,11 @@ async def logout(
             token = auth_header.split(" ")[1]
 
     if token:
-        session_service.delete_session(token)
+        if is_signed_token(token):
+            # Signed tokens can only be revoked per user
+            await session_service.revoke_user_tokens(current_user.id)
+        else:
+            await session_service.delete_session(token)
 
     # Clear cookie
     response.delete_cookie("session_token")
@@ -96,12 +92,12 @@ async def get_current_user_info(current_user=Depends(require_auth)):
 @router.post("/logout-all")
 async def logout_all_sessions(
     response: Response,
-    session: Session = Depends(get_session),
+    session_service: AsyncSessionService = Depends(get_session_service),
     current_user=Depends(require_auth),
 ):
     """Logout from all sessions."""
-    session_service = SessionService(session)
-    session_service.delete_user_sessions(current_user.id)
+    await session_service.delete_user_sessions(current_user.id)
+    await session_service.revoke_user_tokens(current_user.id)
 
     # Clear cookie
     response.delete_cookie("session_token")
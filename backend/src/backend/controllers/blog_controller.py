@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path as PathParam
-from sqlmodel import Session
-from typing import List, Optional
+from contextlib import nullcontext
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Path as PathParam
+from typing import List, Literal, Optional, Union
 import uuid
 
-from ..config.database import get_session
-from ..models.post import Post, PostRead, PostCreate, PostUpdate
-from ..services.blog_service import BlogService
+from ..config.replicas import reading_from_primary
+from ..models.post import Post, PostRead, PostCreate, PostUpdate, PostSummary
+from ..services.async_services import AsyncBlogService, get_blog_service
+from ..services.blog_service import encode_post_cursor
 from ..middleware.auth import get_current_user_optional, require_auth
 from ..models.user import User
+from ..services.post_cache import CachedPost, rendered_post_cache
+from ..utils import ValidationError
+from ..utils.http_cache import conditional_response
+from ..utils.responses import prevalidated_response
 
 router = APIRouter(
     prefix="/posts",
@@ -15,16 +20,42 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=List[PostRead])
+def _select_fields(fields: Optional[str], view: str):
+    """
+    Resolve the list view and the set of fields to return.
+
+    A `fields` selection made only of summary fields is served from the
+    summary query even when `view` is left at full.
+    """
+    if fields is None:
+        return view, None
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    if not selected:
+        raise ValidationError("No fields selected")
+    if view == "full" and selected <= set(PostSummary.model_fields):
+        view = "summary"
+    model = PostSummary if view == "summary" else PostRead
+    unknown = selected - set(model.model_fields)
+    if unknown:
+        raise ValidationError(f"Unknown fields for {view} view: {', '.join(sorted(unknown))}")
+    return view, selected
+
+
+@router.get("", response_model=Union[List[PostRead], List[PostSummary]])
 async def list_posts(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of posts to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of posts to return"),
     category: Optional[str] = Query(None, description="Filter by category slug"),
     tag: Optional[str] = Query(None, description="Filter by tag slug"),
-    search: Optional[str] = Query(None, description="Search in title and content"),
+    search: Optional[str] = Query(None, description="Full-text search in title and content, ranked by relevance"),
     status: Optional[str] = Query(None, description="Filter by post status"),
     author_id: Optional[uuid.UUID] = Query(None, description="Filter by author ID"),
-    session: Session = Depends(get_session),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; replaces skip"),
+    view: Literal["full", "summary"] = Query("full", description="`summary` returns PostSummary objects without the post body"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,slug,title,excerpt"),
+    blog_service: AsyncBlogService = Depends(get_blog_service),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -32,9 +63,24 @@ async def list_posts(
     
     Returns posts with joined categories, tags, likes, and view counts.
     Private/draft posts are only visible to authenticated users.
+    
+    When a full page is returned, the X-Next-Cursor header holds a cursor
+    for the following page. Passing it back as `cursor` gives stable keyset
+    pagination; `skip` keeps working for offset pagination.
+    
+    Search results are ordered by relevance and include a `search_snippet`
+    with matches wrapped in <mark> tags. They are paged with `skip` only.
+    
+    `view=summary` selects only the listing columns and returns the stored
+    excerpt instead of the content. `fields` trims each post to the given
+    fields; when they are all summary fields the summary query is used.
+    
+    Supports conditional requests: a matching If-None-Match gets a 304
+    without loading the page.
     """
-    blog_service = BlogService(session)
-    return await blog_service.list_posts(
+    view, include = _select_fields(fields, view)
+    
+    filters = dict(
         skip=skip,
         limit=limit,
         category=category,
@@ -42,14 +88,39 @@ async def list_posts(
         search=search,
         status=status,
         author_id=author_id,
-        current_user=current_user
+        current_user=current_user,
+        cursor=cursor
+    )
+    etag = await blog_service.get_list_validator(**filters)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    if view == "summary":
+        posts = await blog_service.list_post_summaries(**filters)
+        content_type = List[PostSummary]
+    else:
+        posts = await blog_service.list_posts(**filters)
+        content_type = List[PostRead]
+    
+    if len(posts) == limit and not search:
+        last = posts[-1]
+        response.headers["X-Next-Cursor"] = encode_post_cursor(last.created_at, last.id)
+    
+    return prevalidated_response(
+        posts,
+        content_type,
+        response,
+        include={"__all__": include} if include else None,
     )
 
 
 @router.get("/{slug}", response_model=PostRead)
 async def get_post(
+    request: Request,
+    response: Response,
     slug: str = PathParam(..., description="Post slug"),
-    session: Session = Depends(get_session),
+    blog_service: AsyncBlogService = Depends(get_blog_service),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -57,23 +128,66 @@ async def get_post(
     
     Automatically increments view count when post is accessed.
     Private/draft posts require authentication.
+    
+    Supports conditional requests: a matching If-None-Match or
+    If-Modified-Since gets a 304 (still counted as a view).
+    
+    Anonymous responses are served from the rendered post cache when
+    possible, without touching the database.
     """
-    blog_service = BlogService(session)
-    post = await blog_service.get_post_by_slug(slug, current_user)
+    if current_user is None:
+        cached = rendered_post_cache.get(slug)
+        if cached:
+            blog_service.record_view(cached.post_id)
+            not_modified = conditional_response(
+                request, response, cached.etag, cached.last_modified
+            )
+            if not_modified:
+                return not_modified
+            cached_response = Response(content=cached.body, media_type="application/json")
+            cached_response.headers.raw.extend(response.headers.raw)
+            return cached_response
     
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
+    # Taken before loading, so a write committed meanwhile keeps this render out of the cache
+    cache_generation = rendered_post_cache.generation()
+    # Anonymous renders are cached for every client, so load them from the primary
+    source = reading_from_primary(blog_service.session) if current_user is None else nullcontext()
+    with source:
+        validator = await blog_service.get_post_validator(slug, current_user)
+        if validator:
+            post_id, _, etag, last_modified = validator
+            not_modified = conditional_response(request, response, etag, last_modified)
+            if not_modified:
+                blog_service.record_view(post_id)
+                return not_modified
+    
+        post = await blog_service.get_post_by_slug(slug, current_user)
+    
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+    
+        # Record a view for found posts
+        blog_service.record_view(post.id)
     
-    # Increment view count for found posts
-    await blog_service.increment_view_count(post.id)
+        if current_user is None and validator:
+            cached = CachedPost(
+                post_id=post.id,
+                etag=etag,
+                last_modified=last_modified,
+                body=post.model_dump_json().encode(),
+            )
+            rendered_post_cache.set(slug, cached, cache_generation)
+            cached_response = Response(content=cached.body, media_type="application/json")
+            cached_response.headers.raw.extend(response.headers.raw)
+            return cached_response
     
-    return post
+    return prevalidated_response(post, PostRead, response)
 
 
 @router.post("", response_model=PostRead, status_code=201)
 async def create_post(
     post_data: PostCreate,
-    session: Session = Depends(get_session),
+    blog_service: AsyncBlogService = Depends(get_blog_service),
     current_user: User = Depends(require_auth)
 ):
     """
@@ -82,7 +196,6 @@ async def create_post(
     Supports all post types: text, quote, link, photo, audio, video.
     Requires authentication.
     """
-    blog_service = BlogService(session)
     return await blog_service.create_post(post_data, current_user)
 
 
@@ -90,7 +203,7 @@ async def create_post(
 async def update_post(
     post_data: PostUpdate,
     post_id: uuid.UUID = PathParam(..., description="Post ID"),
-    session: Session = Depends(get_session),
+    blog_service: AsyncBlogService = Depends(get_blog_service),
     current_user: User = Depends(require_auth)
 ):
     """
@@ -98,7 +211,6 @@ async def update_post(
     
     Only the author or users with appropriate permissions can update posts.
     """
-    blog_service = BlogService(session)
     updated_post = await blog_service.update_post(post_id, post_data, current_user)
     
     if not updated_post:
@@ -110,7 +222,7 @@ async def update_post(
 @router.delete("/{post_id}", status_code=204)
 async def delete_post(
     post_id: uuid.UUID = PathParam(..., description="Post ID"),
-    session: Session = Depends(get_session),
+    blog_service: AsyncBlogService = Depends(get_blog_service),
     current_user: User = Depends(require_auth)
 ):
     """
@@ -118,7 +230,6 @@ async def delete_post(
     
     Only the author or users with appropriate permissions can delete posts.
     """
-    blog_service = BlogService(session)
     success = await blog_service.delete_post(post_id, current_user)
     
     if not success:
@@ -128,7 +239,7 @@ async def delete_post(
 @router.post("/{post_id}/like", status_code=201)
 async def like_post(
     post_id: uuid.UUID = PathParam(..., description="Post ID"),
-    session: Session = Depends(get_session),
+    blog_service: AsyncBlogService = Depends(get_blog_service),
     current_user: User = Depends(require_auth)
 ):
     """
@@ -136,7 +247,6 @@ async def like_post(
     
     Creates a like entry if not already liked by the user.
     """
-    blog_service = BlogService(session)
     success = await blog_service.like_post(post_id, current_user)
     
     if not success:
@@ -148,7 +258,7 @@ async def like_post(
 @router.delete("/{post_id}/like", status_code=204)
 async def unlike_post(
     post_id: uuid.UUID = PathParam(..., description="Post ID"),
-    session: Session = Depends(get_session),
+    blog_service: AsyncBlogService = Depends(get_blog_service),
     current_user: User = Depends(require_auth)
 ):
     """
@@ -156,7 +266,6 @@ async def unlike_post(
     
     Removes the like entry if it exists.
     """
-    blog_service = BlogService(session)
     success = await blog_service.unlike_post(post_id, current_user)
     
     if not success:
@@ -166,14 +275,13 @@ async def unlike_post(
 @router.post("/{post_id}/view")
 async def mark_post_viewed(
     post_id: uuid.UUID = PathParam(..., description="Post ID"),
-    session: Session = Depends(get_session)
+    blog_service: AsyncBlogService = Depends(get_blog_service)
 ):
     """
     Mark a post as viewed. Increments view_count.
     
     No authentication required - tracks all views.
     """
-    blog_service = BlogService(session)
     success = await blog_service.increment_view_count(post_id)
     
     if not success:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlmodel import Session
 from typing import List
 import uuid
@@ -8,6 +8,7 @@ from backend.models.taxonomy import Category, CategoryCreate, CategoryRead, Cate
 from backend.services.category_service import CategoryService
 from backend.middleware import require_auth, get_current_user
 from backend.utils import NotFoundError
+from backend.utils.http_cache import conditional_response, make_etag
 
 
 router = APIRouter(prefix="/categories", tags=["categories"])
@@ -27,6 +28,8 @@ async def create_category(
 
 @router.get("/", response_model=List[CategoryRead])
 async def list_categories(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     session: Session = Depends(get_session)
@@ -34,6 +37,11 @@ async def list_categories(
     """List all categories with pagination."""
     category_service = CategoryService(session)
     categories = category_service.list_categories(skip=skip, limit=limit)
+    
+    etag = make_etag([item.model_dump() for item in categories])
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     return categories
 
 
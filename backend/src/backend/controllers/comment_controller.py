@@ -4,9 +4,9 @@ from typing import List, Optional
 import uuid
 
 from backend.config.database import get_session
-from backend.models.comment import Comment, CommentCreate, CommentRead, CommentUpdate
+from backend.models.comment import Comment, CommentCreate, CommentRead, CommentUpdate, CommentModerationUpdate
 from backend.services.comment_service import CommentService
-from backend.middleware import require_auth, get_current_user
+from backend.middleware import require_auth, require_permission, get_current_user
 from backend.utils import NotFoundError
 
 
@@ -72,3 +72,16 @@ async def delete_comment(
     comment_service = CommentService(session)
     comment_service.delete_comment(comment_id, current_user.id)
     return {"message": "Comment deleted successfully"}
+
+
+@router.put("/comments/{comment_id}/moderation", response_model=CommentRead)
+async def moderate_comment(
+    comment_id: uuid.UUID,
+    moderation: CommentModerationUpdate,
+    session: Session = Depends(get_session),
+    current_user = Depends(require_permission("update_site_settings"))
+):
+    """Approve, reject or mark a comment as spam (admin only)."""
+    comment_service = CommentService(session)
+    comment = comment_service.moderate_comment(comment_id, moderation.status)
+    return comment
@@ -0,0 +1,20 @@
+from typing import Dict
+
+from fastapi import APIRouter, Depends
+
+from ..config.pool_metrics import pool_metrics
+from ..middleware.auth import require_permission
+from ..models.user import User
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/pool")
+async def get_pool_metrics(
+    current_user: User = Depends(require_permission("update_site_settings"))
+) -> Dict[str, Dict]:
+    """
+    Connection pool status and checkout counters for this worker process,
+    one entry per engine. Requires admin permissions.
+    """
+    return pool_metrics.snapshot()
@@ -4,7 +4,7 @@ from typing import List, Optional
 
 from ..config.database import get_session
 from ..services.permission_service import PermissionService
-from ..middleware.auth import get_current_user
+from ..middleware.auth import require_permission
 from ..models.user import User, Role, Permission
 
 router = APIRouter(
@@ -16,7 +16,7 @@ router = APIRouter(
 @router.get("/", response_model=List[dict])
 async def get_all_roles(
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_permission("update_site_settings"))
 ):
     """
     Get all roles with their permissions.
@@ -24,22 +24,16 @@ async def get_all_roles(
     """
     permission_service = PermissionService(session)
     
-    # Check if user has admin permissions
-    permissions = permission_service.get_user_permissions(current_user)
-    if "update_site_settings" not in permissions:
-        raise HTTPException(status_code=403, detail="Admin permissions required")
-    
     roles = permission_service.get_all_roles()
     
     # Format roles with permissions
     result = []
     for role in roles:
-        role_permissions = permission_service.get_role_permissions(role.id)
         result.append({
             "id": role.id,
             "name": role.name,
             "description": role.description,
-            "permissions": [p.name for p in role_permissions]
+            "permissions": sorted(permission_service.get_role_permission_set(role.id))
         })
     
     return result
@@ -49,7 +43,7 @@ async def get_all_roles(
 async def create_role(
     role_data: dict,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_permission("update_site_settings"))
 ):
     """
     Create a new role with permissions.
@@ -58,11 +52,6 @@ async def create_role(
     """
     permission_service = PermissionService(session)
     
-    # Check if user has admin permissions
-    permissions = permission_service.get_user_permissions(current_user)
-    if "update_site_settings" not in permissions:
-        raise HTTPException(status_code=403, detail="Admin permissions required")
-    
     # Validate required fields
     if "name" not in role_data:
         raise HTTPException(status_code=400, detail="Role name is required")
@@ -92,7 +81,7 @@ async def update_role(
     role_id: int,
     role_data: dict,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_permission("update_site_settings"))
 ):
     """
     Update a role's permissions.
@@ -101,11 +90,6 @@ async def update_role(
     """
     permission_service = PermissionService(session)
     
-    # Check if user has admin permissions
-    permissions = permission_service.get_user_permissions(current_user)
-    if "update_site_settings" not in permissions:
-        raise HTTPException(status_code=403, detail="Admin permissions required")
-    
     # Check if role exists
     role = permission_service.get_role_by_id(role_id)
     if not role:
@@ -135,7 +119,7 @@ async def update_role(
 async def delete_role(
     role_id: int,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_permission("update_site_settings"))
 ):
     """
     Delete a role.
@@ -144,11 +128,6 @@ async def delete_role(
     """
     permission_service = PermissionService(session)
     
-    # Check if user has admin permissions
-    permissions = permission_service.get_user_permissions(current_user)
-    if "update_site_settings" not in permissions:
-        raise HTTPException(status_code=403, detail="Admin permissions required")
-    
     # Check if it's the public role
     role = permission_service.get_role_by_id(role_id)
     if not role:
@@ -168,7 +147,7 @@ async def delete_role(
 @router.get("/permissions", response_model=List[dict])
 async def get_all_permissions(
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_permission("update_site_settings"))
 ):
     """
     Get all available permissions.
@@ -176,11 +155,6 @@ async def get_all_permissions(
     """
     permission_service = PermissionService(session)
     
-    # Check if user has admin permissions
-    permissions = permission_service.get_user_permissions(current_user)
-    if "update_site_settings" not in permissions:
-        raise HTTPException(status_code=403, detail="Admin permissions required")
-    
     permissions_list = permission_service.get_all_permissions()
     
     return [
@@ -1,13 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List, Optional
 
-from ..config.database import get_session
 from ..models.site import SiteInfoResponse, ExtensionsResponse, ExtensionInfo, SettingsUpdateRequest, SettingsUpdateResponse, ExtensionStatusRequest, ExtensionStatusResponse
 from ..models.system import ExtensionRead
-from ..services.site_service import SiteService
-from ..middleware.auth import get_current_user_optional, get_current_user
+from ..services.async_services import AsyncSiteService, get_site_service
+from ..middleware.auth import get_current_user_optional, require_permission
 from ..models.user import User
+from ..utils.http_cache import conditional_response
 
 router = APIRouter(
     prefix="/site",
@@ -17,7 +16,9 @@ router = APIRouter(
 
 @router.get("/info", response_model=SiteInfoResponse)
 async def get_site_info(
-    session: Session = Depends(get_session),
+    request: Request,
+    response: Response,
+    site_service: AsyncSiteService = Depends(get_site_service),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -30,9 +31,13 @@ async def get_site_info(
     - Enabled features
     
     This endpoint provides all the essential information needed
-    to configure the frontend application.
+    to configure the frontend application. Supports If-None-Match.
     """
-    site_service = SiteService(session)
+    etag = await site_service.get_site_info_etag(current_user)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
     site_info = await site_service.get_site_info(current_user)
     
     return SiteInfoResponse(**site_info)
@@ -41,7 +46,7 @@ async def get_site_info(
 @router.get("/extensions", response_model=ExtensionsResponse)
 async def get_extensions(
     active_only: bool = False,
-    session: Session = Depends(get_session)
+    site_service: AsyncSiteService = Depends(get_site_service)
 ):
     """
     Get all extensions or only active ones.
@@ -49,8 +54,6 @@ async def get_extensions(
     This endpoint returns detailed information about extensions
     including their configuration and status.
     """
-    site_service = SiteService(session)
-    
     if active_only:
         extensions = await site_service.get_active_extensions()
     else:
@@ -73,7 +76,7 @@ async def get_extensions(
 
 @router.get("/extensions/active", response_model=List[str])
 async def get_active_extension_names(
-    session: Session = Depends(get_session)
+    site_service: AsyncSiteService = Depends(get_site_service)
 ):
     """
     Get list of active extension names.
@@ -81,13 +84,12 @@ async def get_active_extension_names(
     Returns a simple list of extension names that are currently active.
     Useful for quick feature detection in the frontend.
     """
-    site_service = SiteService(session)
-    return await site_service._get_active_extensions()
+    return await site_service.get_active_extension_names()
 
 
 @router.get("/features", response_model=List[str])
 async def get_enabled_features(
-    session: Session = Depends(get_session)
+    site_service: AsyncSiteService = Depends(get_site_service)
 ):
     """
     Get list of enabled features.
@@ -95,21 +97,19 @@ async def get_enabled_features(
     Returns a list of feature flags that indicate what functionality
     is available on this site (comments, registration, uploads, etc.).
     """
-    site_service = SiteService(session)
-    return await site_service._get_enabled_features()
+    return await site_service.get_enabled_features()
 
 
 @router.get("/theme")
 async def get_active_theme(
-    session: Session = Depends(get_session)
+    site_service: AsyncSiteService = Depends(get_site_service)
 ):
     """
     Get the currently active theme information.
     
     Returns the name and details of the active theme.
     """
-    site_service = SiteService(session)
-    theme_name = await site_service._get_active_theme_name()
+    theme_name = await site_service.get_active_theme_name()
     
     if not theme_name:
         raise HTTPException(status_code=404, detail="No active theme found")
@@ -124,22 +124,14 @@ async def get_active_theme(
 async def update_extension_status(
     extension_slug: str,
     request: ExtensionStatusRequest,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    site_service: AsyncSiteService = Depends(get_site_service),
+    current_user: User = Depends(require_permission("update_site_settings"))
 ):
     """
     Update the active status of an extension.
     
     Allows enabling or disabling extensions. Requires admin permissions.
     """
-    site_service = SiteService(session)
-    
-    # Check if user has admin permissions (same check as /settings)
-    permissions = site_service.permission_service.get_user_permissions(current_user)
-
-    if "update_site_settings" not in permissions:
-        raise HTTPException(status_code=403, detail="Admin permissions required")
-    
     try:
         updated_extension = await site_service.update_extension_status(
             extension_slug=extension_slug,
@@ -159,8 +151,8 @@ async def update_extension_status(
 @router.patch("/settings", response_model=SettingsUpdateResponse)
 async def update_settings(
     request: SettingsUpdateRequest,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    site_service: AsyncSiteService = Depends(get_site_service),
+    current_user: User = Depends(require_permission("update_site_settings"))
 ):
     """
     Update site settings.
@@ -168,16 +160,6 @@ async def update_settings(
     Allows updating of blog title and feature flags like search, markdown, and registration.
     Requires authentication.
     """
-    site_service = SiteService(session)
-    
-    # Check if user has admin permissions
-    permissions = site_service.permission_service.get_user_permissions(current_user)
-
-    print(permissions)
-
-    if "update_site_settings" not in permissions:
-        raise HTTPException(status_code=403, detail="Admin permissions required")
-    
     updated_settings = await site_service.update_settings(
         blog_title=request.blog_title,
         show_search=request.show_search,
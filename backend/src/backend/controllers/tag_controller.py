@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlmodel import Session
 from typing import List, Optional
 
@@ -7,6 +7,7 @@ from backend.models.taxonomy import Tag, TagCreate, TagRead
 from backend.services.tag_service import TagService
 from backend.middleware import require_auth, get_current_user
 from backend.utils import NotFoundError
+from backend.utils.http_cache import conditional_response, make_etag
 
 
 router = APIRouter(prefix="/tags", tags=["tags"])
@@ -26,6 +27,8 @@ async def create_tag(
 
 @router.get("/", response_model=List[TagRead])
 async def list_tags(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     search: Optional[str] = Query(None),
@@ -34,6 +37,11 @@ async def list_tags(
     """List all tags with pagination and optional search."""
     tag_service = TagService(session)
     tags = tag_service.list_tags(skip=skip, limit=limit, search=search)
+    
+    etag = make_etag([item.model_dump() for item in tags])
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     return tags
 
 
@@ -6,6 +6,7 @@ import uuid
 from ..config.database import get_session
 from ..models.system import Theme, ThemeRead
 from ..middleware.auth import require_auth, get_current_user_optional
+from ..services.site_service import site_config_cache
 from ..models.user import User
 
 router = APIRouter(
@@ -56,6 +57,7 @@ async def activate_theme(
     session.add(theme)
     session.commit()
     session.refresh(theme)
+    site_config_cache.invalidate()
     
     return theme
 
@@ -11,7 +11,8 @@ from fastapi import (
 )
 from fastapi.responses import FileResponse
 from sqlmodel import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import hashlib
 import uuid
 import os
 import aiofiles
@@ -22,10 +23,46 @@ from ..config import settings
 from ..models.post import PostFile, PostFileCreate, PostFileRead
 from ..middleware.auth import require_auth, get_current_user_optional
 from ..models.user import User
+from ..utils.exceptions import PayloadTooLargeError
 
 router = APIRouter(prefix="/upload", tags=["File Upload"])
 
 
+async def _stream_to_disk(file: UploadFile, destination: Path) -> Tuple[int, str]:
+    """
+    Copy an upload to disk in fixed-size chunks.
+
+    Writes to a temporary file next to the destination and renames it into
+    place once complete, so readers never see a partial file. Returns the
+    size in bytes and the SHA-256 hex digest of the content.
+    """
+    max_bytes = settings.upload_max_bytes
+    if file.size is not None and file.size > max_bytes:
+        raise PayloadTooLargeError(
+            f"File '{file.filename}' exceeds the {max_bytes} byte upload limit"
+        )
+
+    temp_path = destination.with_name(f".{destination.name}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, "wb") as f:
+            while chunk := await file.read(settings.upload_chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise PayloadTooLargeError(
+                        f"File '{file.filename}' exceeds the {max_bytes} byte upload limit"
+                    )
+                digest.update(chunk)
+                await f.write(chunk)
+        os.replace(temp_path, destination)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return size, digest.hexdigest()
+
+
 @router.post("", response_model=List[PostFile], status_code=201)
 async def upload_files(
     files: List[UploadFile] = File(...),
@@ -37,38 +74,47 @@ async def upload_files(
     Upload single or multiple files.
 
     Files are stored in the media directory configured via MEDIA_DIR env variable.
-    Supports associating files with a specific post.
+    Supports associating files with a specific post. Each file is limited to
+    UPLOAD_MAX_BYTES; if any file is too large, none of the batch is kept.
     """
     # Ensure media directory exists
     media_path = Path(settings.media_dir)
     media_path.mkdir(exist_ok=True)
 
     uploaded_files = []
-
-    for file in files:
-        # Generate unique filename
-        file_id = uuid.uuid4()
-        file_extension = Path(file.filename).suffix if file.filename else ""
-        filename = f"{file_id}{file_extension}"
-        file_path = media_path / filename
-
-        # Save file to disk
-        async with aiofiles.open(file_path, "wb") as f:
-            content = await file.read()
-            await f.write(content)
-
-        db_file = PostFile(
-            id=file_id,
-            file_url=f"/upload/{file_id}/download",
-            filename=filename,
-            file_type=file.content_type or "application/octet-stream",
-            created_at=datetime.datetime.utcnow(),
-            uploaded_at=datetime.datetime.utcnow(),
-        )
-        session.add(db_file)
-        uploaded_files.append(db_file)
-
-    session.commit()
+    written_paths = []
+
+    try:
+        for file in files:
+            # Generate unique filename
+            file_id = uuid.uuid4()
+            file_extension = Path(file.filename).suffix if file.filename else ""
+            filename = f"{file_id}{file_extension}"
+            file_path = media_path / filename
+
+            # Save file to disk
+            file_size, content_hash = await _stream_to_disk(file, file_path)
+            written_paths.append(file_path)
+
+            db_file = PostFile(
+                id=file_id,
+                file_url=f"/upload/{file_id}/download",
+                filename=filename,
+                file_type=file.content_type or "application/octet-stream",
+                file_size=file_size,
+                content_hash=content_hash,
+                created_at=datetime.datetime.utcnow(),
+                uploaded_at=datetime.datetime.utcnow(),
+            )
+            session.add(db_file)
+            uploaded_files.append(db_file)
+
+        session.commit()
+    except BaseException:
+        session.rollback()
+        for path in written_paths:
+            path.unlink(missing_ok=True)
+        raise
 
     # Refresh all files to get updated data
     for file in uploaded_files:
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request
+import asyncio
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 
 from backend.config import settings
@@ -15,9 +16,13 @@ from backend.controllers import (
     blog_router,
     theme_router,
     uploader_router,
-    site_router
+    site_router,
+    metrics_router
 )
 from backend.controllers.role_controller import router as role_router
+from backend.middleware.query_counter import QueryCounterMiddleware
+from backend.middleware.replica_routing import ReplicaRoutingMiddleware
+from backend.middleware.upload_limit import UploadLimitMiddleware
 
 
 # Configure logging
@@ -35,7 +40,8 @@ def create_app() -> FastAPI:
         title="Blog Backend API",
         description="A scalable blog backend built with FastAPI and SQLModel",
         version="1.0.0",
-        debug=settings.debug
+        debug=settings.debug,
+        default_response_class=ORJSONResponse,
     )
     
     # CORS middleware
@@ -48,8 +54,18 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
     )
     
+    # Per-request query counts and database time as Server-Timing
+    app.add_middleware(QueryCounterMiddleware)
+
+    # Read-only requests on replicas, with read-your-writes stickiness
+    app.add_middleware(ReplicaRoutingMiddleware)
+
+    # Reject oversized uploads before their bodies are read
+    app.add_middleware(UploadLimitMiddleware)
+    
     # Include routers
     app.include_router(auth_router)
     app.include_router(user_router)
@@ -62,6 +78,7 @@ def create_app() -> FastAPI:
     app.include_router(uploader_router)
     app.include_router(site_router)
     app.include_router(role_router)
+    app.include_router(metrics_router)
     
     # Global exception handler
     @app.exception_handler(Exception)
@@ -134,8 +151,54 @@ async def startup_event():
         logger.warning(f"Sample data creation failed: {e}")
         # Don't fail startup if sample data creation fails
 
+    # Start the buffered view count flusher
+    from backend.services.view_counter import view_counter
+    app.state.view_count_flusher = asyncio.create_task(
+        view_counter.run_periodic_flush(settings.view_count_flush_interval)
+    )
+    logger.info("View count flusher started")
+
+    # Start the expired session sweeper
+    from backend.services.session_sweeper import session_sweeper
+    app.state.session_sweeper = asyncio.create_task(
+        session_sweeper.run_periodic_sweep(settings.session_sweep_interval)
+    )
+    logger.info("Expired session sweeper started")
+
+    # Check read replica health
+    from backend.config.database import replica_set
+    if replica_set:
+        healthy = await asyncio.to_thread(replica_set.check)
+        app.state.replica_health_check = asyncio.create_task(
+            replica_set.run_periodic_check(settings.database_replica_health_interval)
+        )
+        logger.info(f"{healthy} of {len(replica_set.engines)} read replicas healthy")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown."""
     logger.info("Shutting down...")
+
+    # Stop the view count flusher and write out anything still buffered
+    from backend.services.view_counter import view_counter
+    flusher = getattr(app.state, "view_count_flusher", None)
+    if flusher:
+        flusher.cancel()
+    view_counter.flush()
+    logger.info("Buffered view counts flushed")
+
+    sweeper = getattr(app.state, "session_sweeper", None)
+    if sweeper:
+        sweeper.cancel()
+
+    health_check = getattr(app.state, "replica_health_check", None)
+    if health_check:
+        health_check.cancel()
+
+    from backend.utils.auth import password_hasher
+    password_hasher.shutdown()
+
+    from backend.config.database import optimize_database
+    optimize_database()
+    logger.info("Database optimized")
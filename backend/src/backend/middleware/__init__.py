@@ -1,3 +1,16 @@
-from .auth import get_current_user, require_auth
+from .auth import get_current_user, require_auth, require_permission, set_session_cookie
+from .query_counter import QueryCounterMiddleware, QueryStats, track_queries
+from .replica_routing import ReplicaRoutingMiddleware
+from .upload_limit import UploadLimitMiddleware
 
-__all__ = ["get_current_user", "require_auth"]
+__all__ = [
+    "get_current_user",
+    "require_auth",
+    "require_permission",
+    "set_session_cookie",
+    "QueryCounterMiddleware",
+    "QueryStats",
+    "track_queries",
+    "ReplicaRoutingMiddleware",
+    "UploadLimitMiddleware",
+]
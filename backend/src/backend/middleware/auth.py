@@ -1,23 +1,124 @@
-from fastapi import Request, Depends
+from fastapi import Request, Response, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session, select
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from backend.config.database import get_session
+from backend.config import settings
+from backend.config.database import DbSession, get_db_session
+from backend.config.replicas import reading_from_primary
 from backend.models import User, UserSession
-from backend.utils import AuthenticationError
+from backend.services.async_services import run_in_session
+from backend.services.auth_cache import auth_user_cache
+from backend.services.permission_service import PermissionService
+from backend.services.session_service import SessionService
+from backend.services.token_revocations import token_revocations
+from backend.utils import AuthenticationError, AuthorizationError
+from backend.utils.tokens import SessionTokenClaims, is_signed_token, verify_session_token
 
 
 security = HTTPBearer(auto_error=False)
 
 
+def set_session_cookie(response: Response, token: str, expires_at: datetime) -> None:
+    """Set the session cookie to last exactly as long as the session."""
+    max_age = max(0, round((expires_at - datetime.utcnow()).total_seconds()))
+    response.set_cookie(
+        key="session_token",
+        value=token,
+        httponly=True,
+        secure=False,  # Set to True in production with HTTPS
+        samesite="lax",
+        max_age=max_age,
+        expires=max_age,  # redundant but some browsers require it
+        path="/",
+    )
+
+
+def _load_session_user(session: Session, token: str) -> Optional[Tuple[User, datetime]]:
+    """
+    Look up the user behind a session token and cache it with its
+    permissions. Returns the user and the session's expiry.
+    """
+    # Cached for every request on the token, so never from a lagging replica
+    with reading_from_primary(session):
+        # Find session
+        statement = select(UserSession).where(
+            UserSession.session_token == token,
+            UserSession.expires_at > datetime.utcnow()
+        )
+        user_session = session.exec(statement).first()
+
+        if not user_session:
+            return None
+
+        # Get user
+        user_statement = select(User).where(User.id == user_session.user_id)
+        user = session.exec(user_statement).first()
+
+        if not user:
+            return None
+
+        permissions = PermissionService(session).get_user_permissions(user)
+    auth_user_cache.set(token, user, frozenset(permissions), user_session.expires_at)
+    return user, user_session.expires_at
+
+
+def _load_token_user(
+    session: Session, token: str, claims: SessionTokenClaims
+) -> Optional[Tuple[User, datetime]]:
+    """
+    Load the user a signed token was issued to and cache it with its
+    permissions. A token whose role no longer matches the user's is
+    rejected, so role changes take effect like a revocation.
+    """
+    with reading_from_primary(session):
+        user = session.get(User, claims.user_id)
+        if not user or user.role_id != claims.role_id:
+            return None
+
+        permissions = PermissionService(session).get_user_permissions(user)
+    auth_user_cache.set(token, user, frozenset(permissions), claims.expires_at)
+    return user, claims.expires_at
+
+
+def _reissue_token(session: Session, claims: SessionTokenClaims) -> Tuple[str, datetime]:
+    """Sign a fresh token for the holder of a signed token."""
+    return SessionService(session).sign_token(claims.user_id, claims.role_id)
+
+
+def _refresh_session(session: Session, token: str) -> Optional[datetime]:
+    """Slide a session's expiry; drop its cached entry either way so the new expiry is read back."""
+    new_expires_at = SessionService(session).refresh_session(token)
+    auth_user_cache.invalidate_token(token)
+    return new_expires_at
+
+
+def _get_user_permissions(session: Session, user: Optional[User]) -> List[str]:
+    """Get the permissions of a user, or of the public role when anonymous."""
+    return PermissionService(session).get_user_permissions(user)
+
+
 async def get_current_user(
     request: Request,
-    session: Session = Depends(get_session),
+    response: Response,
+    session: DbSession = Depends(get_db_session),
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[User]:
-    """Get current authenticated user from session token."""
+    """
+    Get current authenticated user from session token.
+
+    Resolved users are cached per token, so repeat requests on a session
+    skip both lookups.
+
+    Sessions slide: once less than SESSION_REFRESH_FRACTION of the
+    lifetime remains, the expiry is pushed out by a full lifetime and a
+    cookie session gets a fresh cookie to match.
+
+    With SESSION_TOKEN_MODE=signed, signed tokens are checked against
+    their HMAC, expiry and the in-memory revocation list, with no session
+    lookup; they slide by having a new token set in the cookie.
+    """
     
     # Try to get token from Authorization header
     token = None
@@ -25,25 +126,46 @@ async def get_current_user(
         token = credentials.credentials
     
     # If no token in header, try to get from cookies
+    from_cookie = False
     if not token:
         token = request.cookies.get("session_token")
+        from_cookie = True
     
     if not token:
         return None
     
-    # Find session
-    statement = select(UserSession).where(
-        UserSession.session_token == token,
-        UserSession.expires_at > datetime.utcnow()
-    )
-    user_session = session.exec(statement).first()
+    claims = None
+    if settings.session_token_mode == "signed" and is_signed_token(token):
+        claims = verify_session_token(token)
+        if not claims:
+            return None
+        not_before = await run_in_session(
+            session, token_revocations.get_not_before, claims.user_id
+        )
+        if not_before and claims.issued_at <= not_before:
+            return None
     
-    if not user_session:
-        return None
+    cached = auth_user_cache.get(token)
+    if cached:
+        user, session_expires_at = cached.to_user(), cached.session_expires_at
+    else:
+        if claims:
+            loaded = await run_in_session(session, _load_token_user, token, claims)
+        else:
+            loaded = await run_in_session(session, _load_session_user, token)
+        if not loaded:
+            return None
+        user, session_expires_at = loaded
     
-    # Get user
-    user_statement = select(User).where(User.id == user_session.user_id)
-    user = session.exec(user_statement).first()
+    if session_expires_at < UserSession.get_refresh_time():
+        if claims:
+            if from_cookie:
+                new_token, new_expires_at = await run_in_session(session, _reissue_token, claims)
+                set_session_cookie(response, new_token, new_expires_at)
+        else:
+            new_expires_at = await run_in_session(session, _refresh_session, token)
+            if new_expires_at and from_cookie:
+                set_session_cookie(response, token, new_expires_at)
     
     return user
 
@@ -58,9 +180,30 @@ async def require_auth(
 
 
 async def get_current_user_optional(
-    request: Request,
-    session: Session = Depends(get_session),
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+    current_user: Optional[User] = Depends(get_current_user)
 ) -> Optional[User]:
     """Get current authenticated user (optional) - returns None if not authenticated."""
-    return await get_current_user(request, session, credentials)
+    return current_user
+
+
+def require_permission(permission: str):
+    """
+    Build a dependency that requires the current user to hold a permission.
+
+    Anonymous requests are checked against the public role and get a 401 if
+    it lacks the permission. Permission sets come from the role permission
+    cache, so the check needs no queries once the role is warm.
+    """
+
+    async def check_permission(
+        session: DbSession = Depends(get_db_session),
+        current_user: Optional[User] = Depends(get_current_user),
+    ) -> Optional[User]:
+        permissions = await run_in_session(session, _get_user_permissions, current_user)
+        if permission not in permissions:
+            if not current_user:
+                raise AuthenticationError("Authentication required")
+            raise AuthorizationError(f"Missing required permission: {permission}")
+        return current_user
+
+    return check_permission
@@ -0,0 +1,120 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Stats for the request (or tracked block) running in the current context
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+_PARAM_LIST = re.compile(r"\(\s*(\?|%\(\w+\)s|:\w+)(\s*,\s*(\?|%\(\w+\)s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeats differing only in IN-list size match."""
+    return _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    """Queries executed while tracking: count, total time and statement shapes."""
+
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    # Enclosing tracker, which sees every query this one does
+    parent: Optional["QueryStats"] = None
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+        if self.parent is not None:
+            self.parent.record(statement, duration)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than `threshold` times, most frequent first."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the queries run in the current context until the block exits."""
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_query(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    start_times = conn.info.get("query_start_times")
+    if stats is not None and start_times:
+        stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+def server_timing(stats: QueryStats, repeat_threshold: int) -> str:
+    """Format query stats as a Server-Timing header value."""
+    value = f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'
+    repeated = stats.repeated(repeat_threshold)
+    if repeated:
+        value += f', db-repeat;desc="{repeated[0][1]}x same statement"'
+    return value
+
+
+class QueryCounterMiddleware:
+    """
+    ASGI middleware that counts the SQL statements each request runs.
+
+    Adds a Server-Timing header with the query count and total database
+    time, and logs a warning when one statement shape runs more than
+    QUERY_REPEAT_THRESHOLD times in a request (the usual sign of a
+    per-row query loop). Enabled by QUERY_COUNTER_ENABLED.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.query_counter_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        threshold = settings.query_repeat_threshold
+        with track_queries() as stats:
+
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    header = server_timing(stats, threshold).encode()
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"server-timing", header),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        for shape, repeats in stats.repeated(threshold):
+            logger.warning(
+                f"{scope['method']} {scope['path']} ran the same statement {repeats} times: {shape[:200]}"
+            )
@@ -0,0 +1,61 @@
+import math
+import time
+
+from starlette.requests import HTTPConnection
+
+from backend.config import settings
+from backend.config.replicas import READ_ONLY_METHODS, route_request
+
+# Cookie holding the time until which this client reads from the primary
+STICKY_COOKIE = "primary_reads_until"
+
+
+class ReplicaRoutingMiddleware:
+    """
+    ASGI middleware that decides whether a request may read from replicas.
+
+    GET/HEAD/OPTIONS requests are routed to a replica unless the client
+    wrote within the last DATABASE_REPLICA_STICKY_SECONDS. A successful
+    response to a request that wrote sets a cookie recording that window,
+    so the client's next reads see its own writes on any worker.
+    Has no effect unless DATABASE_REPLICA_URLS is set.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        window = settings.database_replica_sticky_seconds
+        now = time.time()
+        try:
+            sticky_until = float(HTTPConnection(scope).cookies.get(STICKY_COOKIE, 0))
+        except ValueError:
+            sticky_until = 0.0
+        # Ignore values a client couldn't have been given
+        sticky = 0 < sticky_until - now <= window
+        read_only = scope["method"] in READ_ONLY_METHODS and not sticky
+
+        with route_request(read_only) as routing:
+
+            async def send_with_cookie(message):
+                if (
+                    message["type"] == "http.response.start"
+                    and routing.wrote
+                    and message["status"] < 400
+                    and window > 0
+                ):
+                    cookie = (
+                        f"{STICKY_COOKIE}={time.time() + window:.3f}; "
+                        f"Max-Age={math.ceil(window)}; Path=/; HttpOnly; SameSite=lax"
+                    )
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"set-cookie", cookie.encode()),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
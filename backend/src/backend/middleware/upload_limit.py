@@ -0,0 +1,71 @@
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+
+from backend.config import settings
+from backend.utils.exceptions import PayloadTooLargeError
+
+# Paths whose request bodies are capped at UPLOAD_MAX_REQUEST_BYTES
+UPLOAD_PATH_PREFIX = "/upload"
+
+
+class UploadLimitMiddleware:
+    """
+    ASGI middleware that caps upload request bodies at UPLOAD_MAX_REQUEST_BYTES.
+
+    Starlette spools a multipart body to temporary files before the endpoint
+    runs, so a per-file check in the endpoint only fires once the whole body
+    has been received. This rejects an oversized Content-Length before any
+    of the body is read, and stops reading a body sent without one (or with
+    a false one) as soon as it passes the limit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] in ("GET", "HEAD", "OPTIONS")
+            or not scope["path"].startswith(UPLOAD_PATH_PREFIX)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = settings.upload_max_request_bytes
+        too_large = PayloadTooLargeError(f"Request body exceeds the {max_bytes} byte upload limit")
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+            await self._reject(scope, receive, send, too_large)
+            return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    # Raised through the body parser, which re-raises HTTPExceptions
+                    raise too_large
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except PayloadTooLargeError:
+            if response_started:
+                raise
+            await self._reject(scope, receive, send, too_large)
+
+    @staticmethod
+    async def _reject(scope, receive, send, error: PayloadTooLargeError) -> None:
+        response = ORJSONResponse({"detail": error.detail}, status_code=error.status_code)
+        await response(scope, receive, send)
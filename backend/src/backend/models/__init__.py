@@ -1,12 +1,12 @@
 from .base import BaseModel
 from .user import User, UserCreate, UserRead, UserUpdate, UserLogin, Role, Permission, RolePermission
-from .session import UserSession, SessionCreate, SessionRead
+from .session import UserSession, TokenRevocation, SessionCreate, SessionRead
 from .post import (
     Post, PostData, PostFile, PostStatus,
     PostCreate, PostRead, PostUpdate, PostSummary
 )
 from .taxonomy import (
-    Category, Tag, PostCategory, PostTag,
+    Category, Tag, PostCategory, PostTag, TaxonomyVersion,
     CategoryCreate, CategoryRead, CategoryUpdate,
     TagCreate, TagRead, TagUpdate
 )
@@ -36,14 +36,14 @@ __all__ = [
     # User & Auth
     "User", "UserCreate", "UserRead", "UserUpdate", "UserLogin",
     "Role", "Permission", "UserRole", "RolePermission",
-    "UserSession", "SessionCreate", "SessionRead",
+    "UserSession", "TokenRevocation", "SessionCreate", "SessionRead",
     
     # Posts
     "Post", "PostData", "PostFile", "PostStatus",
     "PostCreate", "PostRead", "PostUpdate", "PostSummary",
     
     # Taxonomy
-    "Category", "Tag", "PostCategory", "PostTag",
+    "Category", "Tag", "PostCategory", "PostTag", "TaxonomyVersion",
     "CategoryCreate", "CategoryRead", "CategoryUpdate",
     "TagCreate", "TagRead", "TagUpdate",
     
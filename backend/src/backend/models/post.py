@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import datetime
 from typing import Optional, List
 import uuid
@@ -20,6 +21,10 @@ class Post(BaseModel, table=True):
     """Post model."""
 
     __tablename__ = "posts"
+    __table_args__ = (
+        # Backs keyset pagination over (created_at, id)
+        Index("idx_posts_created_at_id", "created_at", "id"),
+    )
 
     id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
     author_id: uuid.UUID = Field(foreign_key="users.id")
@@ -32,6 +37,9 @@ class Post(BaseModel, table=True):
     published_at: Optional[datetime] = Field(default=None)
     is_private: bool = Field(default=False)
     view_count: int = Field(default=0)
+    # Denormalized counters, kept in step with the likes/comments tables
+    likes_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    comments_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -49,6 +57,11 @@ class PostData(SQLModel, table=True):
     markdown_content: Optional[str] = Field(default=None)
     raw_markup: Optional[str] = Field(default=None)
 
+    # Derived from markdown_content (or content) when the post is saved
+    rendered_html: Optional[str] = Field(default=None)  # Sanitized HTML
+    excerpt: Optional[str] = Field(default=None)  # Plain-text listing excerpt
+    content_hash: Optional[str] = Field(default=None, max_length=64)  # Source the above were built from
+
     # Media content
     media_url: Optional[str] = Field(default=None, max_length=255)
     media_thumbnail_url: Optional[str] = Field(default=None, max_length=255)
@@ -84,6 +97,7 @@ class PostFile(BaseModel, table=True):
         default=None, max_length=100
     )  # File type (matches SQL)
     file_size: Optional[int] = Field(default=None)  # File size in bytes
+    content_hash: Optional[str] = Field(default=None, max_length=64)  # SHA-256 hex digest
     description: Optional[str] = Field(default=None)
     uploaded_at: datetime = Field(default_factory=datetime.utcnow)  # Matches SQL
 
@@ -131,15 +145,21 @@ class PostRead(SQLModel):
     categories: List[dict] = Field(default_factory=list)
     tags: List[dict] = Field(default_factory=list)
     likes_count: int = Field(default=0)
+    comments_count: int = Field(default=0)
 
     # PostData join
     content: Optional[str] = Field(default=None)
+    markdown_content: Optional[str] = Field(default=None)
+    rendered_html: Optional[str] = Field(default=None)
     excerpt: Optional[str] = Field(default=None)
     media_url: Optional[str] = Field(default=None)
     media_type: Optional[str] = Field(default=None)
     quote_source: Optional[str] = Field(default=None)
     link_url: Optional[str] = Field(default=None)
 
+    # Highlighted match context, only set for search results
+    search_snippet: Optional[str] = Field(default=None)
+
 
 class PostUpdate(SQLModel):
     """Model for post updates."""
@@ -162,6 +182,13 @@ class PostSummary(SQLModel):
     published_at: Optional[datetime]
     view_count: int
     created_at: datetime
+    author_name: str
+    likes_count: int = Field(default=0)
+    comments_count: int = Field(default=0)
+    excerpt: Optional[str] = Field(default=None)
+
+    # Highlighted match context, only set for search results
+    search_snippet: Optional[str] = Field(default=None)
 
 
 class PostFileCreate(SQLModel):
@@ -184,6 +211,7 @@ class PostFileRead(SQLModel):
     file_path: Optional[str]
     mime_type: Optional[str]
     file_size: Optional[int]
+    content_hash: Optional[str]
     description: Optional[str]
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
@@ -3,6 +3,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 import uuid
 
+from ..config.settings import settings
+
 
 class UserSession(SQLModel, table=True):
     """User session model."""
@@ -10,9 +12,9 @@ class UserSession(SQLModel, table=True):
     __tablename__ = "user_sessions"
     
     id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
-    user_id: uuid.UUID = Field(foreign_key="users.id")
+    user_id: uuid.UUID = Field(foreign_key="users.id", index=True)
     session_token: str = Field(unique=True, index=True)
-    expires_at: datetime
+    expires_at: datetime = Field(index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     @classmethod
@@ -20,10 +22,29 @@ class UserSession(SQLModel, table=True):
         """Generate a secure session token."""
         return str(uuid.uuid4())
     
+    @classmethod
+    def get_lifetime(cls) -> timedelta:
+        """Get the lifetime of a new or refreshed session."""
+        return timedelta(hours=settings.session_expire_hours)
+    
     @classmethod
     def get_expiry_time(cls) -> datetime:
         """Get session expiry time."""
-        return datetime.utcnow() + timedelta(hours=24)  # Default 24 hours
+        return datetime.utcnow() + cls.get_lifetime()
+    
+    @classmethod
+    def get_refresh_time(cls) -> datetime:
+        """Get the time before which an expiry is due for sliding refresh."""
+        return datetime.utcnow() + cls.get_lifetime() * settings.session_refresh_fraction
+
+
+class TokenRevocation(SQLModel, table=True):
+    """Per-user revocation of signed session tokens issued up to not_before."""
+    
+    __tablename__ = "token_revocations"
+    
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    not_before: datetime = Field(index=True)
 
 
 class SessionCreate(SQLModel):
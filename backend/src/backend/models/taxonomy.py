@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from datetime import datetime
 from typing import Optional
 import uuid
 
@@ -42,6 +43,19 @@ class PostTag(SQLModel, table=True):
     tag_id: int = Field(foreign_key="tags.id", primary_key=True)
 
 
+class TaxonomyVersion(SQLModel, table=True):
+    """
+    Single-row counter bumped whenever categories or tags change how posts
+    render, so post validators change without rewriting the posts.
+    """
+    
+    __tablename__ = "taxonomy_version"
+    
+    id: int = Field(default=1, primary_key=True)
+    version: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 # ================================
 # DTOs for Categories and Tags - Future Claude: Add your request/response models here
 # ================================
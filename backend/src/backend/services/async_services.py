@@ -0,0 +1,231 @@
+import datetime
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from fastapi import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..config.database import DbSession, get_db_session
+from ..models.post import PostCreate, PostRead, PostSummary, PostUpdate
+from ..models.system import Extension
+from ..models.user import User, UserCreate, UserRead, UserUpdate
+from ..utils import hash_password_async, verify_and_update_password
+from .blog_service import BlogService
+from .permission_service import PermissionService
+from .session_service import SessionService
+from .site_service import SiteService
+from .user_service import UserService
+from .view_counter import view_counter
+
+T = TypeVar("T")
+
+
+async def run_in_session(session: DbSession, fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call the sync function fn(sync_session, *args, **kwargs) against either
+    kind of session.
+
+    With an AsyncSession the call runs through run_sync, so every query is
+    awaited on the async driver and the event loop stays free.
+    """
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(lambda sync_session: fn(sync_session, *args, **kwargs))
+    return fn(session, *args, **kwargs)
+
+
+class AsyncBlogService:
+    """
+    Awaitable BlogService for either kind of session.
+
+    Each method runs the sync BlogService method of the same name through
+    run_in_session, so the query logic lives in one place for both engine
+    modes.
+    """
+
+    def __init__(self, session: DbSession):
+        self.session = session
+
+    async def _call(self, method: Callable[..., T], *args, **kwargs) -> T:
+        return await run_in_session(
+            self.session, lambda sync_session: method(BlogService(sync_session), *args, **kwargs)
+        )
+
+    async def list_posts(self, **filters: Any) -> List[PostRead]:
+        return await self._call(BlogService.list_posts, **filters)
+
+    async def list_post_summaries(self, **filters: Any) -> List[PostSummary]:
+        return await self._call(BlogService.list_post_summaries, **filters)
+
+    async def get_list_validator(self, **filters: Any) -> str:
+        return await self._call(BlogService.get_list_validator, **filters)
+
+    async def get_post_validator(
+        self, slug: str, current_user: Optional[User] = None
+    ) -> Optional[Tuple[uuid.UUID, str, str, datetime.datetime]]:
+        return await self._call(BlogService.get_post_validator, slug, current_user)
+
+    async def get_post_by_slug(self, slug: str, current_user: Optional[User] = None) -> Optional[PostRead]:
+        return await self._call(BlogService.get_post_by_slug, slug, current_user)
+
+    async def create_post(self, post_data: PostCreate, current_user: User) -> PostRead:
+        return await self._call(BlogService.create_post, post_data, current_user)
+
+    async def update_post(
+        self, post_id: uuid.UUID, post_data: PostUpdate, current_user: User
+    ) -> Optional[PostRead]:
+        return await self._call(BlogService.update_post, post_id, post_data, current_user)
+
+    async def delete_post(self, post_id: uuid.UUID, current_user: User) -> bool:
+        return await self._call(BlogService.delete_post, post_id, current_user)
+
+    async def like_post(self, post_id: uuid.UUID, current_user: User) -> bool:
+        return await self._call(BlogService.like_post, post_id, current_user)
+
+    async def unlike_post(self, post_id: uuid.UUID, current_user: User) -> bool:
+        return await self._call(BlogService.unlike_post, post_id, current_user)
+
+    async def increment_view_count(self, post_id: uuid.UUID) -> bool:
+        return await self._call(BlogService.increment_view_count, post_id)
+
+    def record_view(self, post_id: uuid.UUID) -> None:
+        """Buffer a view for a post; needs no database access."""
+        view_counter.record(post_id)
+
+
+class AsyncSiteService:
+    """Awaitable SiteService for either kind of session, like AsyncBlogService."""
+
+    def __init__(self, session: DbSession):
+        self.session = session
+
+    async def _call(self, method: Callable[..., T], *args, **kwargs) -> T:
+        return await run_in_session(
+            self.session, lambda sync_session: method(SiteService(sync_session), *args, **kwargs)
+        )
+
+    async def get_site_info(self, current_user: Optional[User] = None) -> Dict[str, Any]:
+        return await self._call(SiteService.get_site_info, current_user)
+
+    async def get_site_info_etag(self, current_user: Optional[User] = None) -> str:
+        return await self._call(SiteService.get_site_info_etag, current_user)
+
+    async def get_active_extension_names(self) -> List[str]:
+        return await self._call(SiteService._get_active_extensions)
+
+    async def get_enabled_features(self) -> List[str]:
+        return await self._call(SiteService._get_enabled_features)
+
+    async def get_active_theme_name(self) -> Optional[str]:
+        return await self._call(SiteService._get_active_theme_name)
+
+    async def get_all_extensions(self) -> List[Extension]:
+        return await self._call(SiteService.get_all_extensions)
+
+    async def get_active_extensions(self) -> List[Extension]:
+        return await self._call(SiteService.get_active_extensions)
+
+    async def update_extension_status(self, extension_slug: str, is_active: bool) -> Extension:
+        return await self._call(SiteService.update_extension_status, extension_slug, is_active)
+
+    async def update_settings(self, **changes: Optional[Any]) -> Dict[str, Any]:
+        return await self._call(SiteService.update_settings, **changes)
+
+
+class AsyncUserService:
+    """
+    Awaitable UserService for either kind of session, like AsyncBlogService.
+
+    Password hashing runs on the hasher's worker pool between the database
+    calls, never inside run_sync, so a login doesn't hold the session's
+    connection while bcrypt works.
+    """
+
+    def __init__(self, session: DbSession):
+        self.session = session
+
+    async def _call(self, method: Callable[..., T], *args, **kwargs) -> T:
+        return await run_in_session(
+            self.session, lambda sync_session: method(UserService(sync_session), *args, **kwargs)
+        )
+
+    async def create_user(self, user_data: UserCreate) -> UserRead:
+        role_id = await self._call(UserService.resolve_new_user_role, user_data)
+        password_hash = await hash_password_async(user_data.password)
+        return await self._call(UserService.insert_user, user_data, role_id, password_hash)
+
+    async def authenticate_user(self, username: str, password: str) -> Optional[User]:
+        user = await self._call(UserService.get_user_by_username, username)
+        if not user:
+            return None
+
+        valid, new_hash = await verify_and_update_password(password, user.password_hash)
+        if not valid:
+            return None
+
+        if new_hash:
+            user = await self._call(UserService.store_password_hash, user, new_hash)
+        return user
+
+    async def get_user_by_id(self, user_id: uuid.UUID) -> Optional[UserRead]:
+        return await self._call(UserService.get_user_by_id, user_id)
+
+    async def update_user(self, user_id: uuid.UUID, user_data: UserUpdate) -> UserRead:
+        password_hash = None
+        if user_data.password:
+            password_hash = await hash_password_async(user_data.password)
+        return await self._call(UserService.apply_user_update, user_id, user_data, password_hash)
+
+    async def delete_user(self, user_id: uuid.UUID) -> bool:
+        return await self._call(UserService.delete_user, user_id)
+
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[UserRead]:
+        return await self._call(UserService.list_users, skip=skip, limit=limit)
+
+    async def get_user_permissions(self, user: Optional[User]) -> List[str]:
+        return await run_in_session(
+            self.session, lambda sync_session: PermissionService(sync_session).get_user_permissions(user)
+        )
+
+
+class AsyncSessionService:
+    """Awaitable SessionService for either kind of session, like AsyncBlogService."""
+
+    def __init__(self, session: DbSession):
+        self.session = session
+
+    async def _call(self, method: Callable[..., T], *args, **kwargs) -> T:
+        return await run_in_session(
+            self.session, lambda sync_session: method(SessionService(sync_session), *args, **kwargs)
+        )
+
+    async def issue_token(self, user: User) -> Tuple[str, datetime.datetime]:
+        return await self._call(SessionService.issue_token, user)
+
+    async def revoke_user_tokens(self, user_id: uuid.UUID) -> None:
+        return await self._call(SessionService.revoke_user_tokens, user_id)
+
+    async def delete_session(self, token: str) -> bool:
+        return await self._call(SessionService.delete_session, token)
+
+    async def delete_user_sessions(self, user_id: uuid.UUID) -> bool:
+        return await self._call(SessionService.delete_user_sessions, user_id)
+
+
+def get_blog_service(session: DbSession = Depends(get_db_session)) -> AsyncBlogService:
+    """Dependency to get the blog service for the request's session."""
+    return AsyncBlogService(session)
+
+
+def get_site_service(session: DbSession = Depends(get_db_session)) -> AsyncSiteService:
+    """Dependency to get the site service for the request's session."""
+    return AsyncSiteService(session)
+
+
+def get_user_service(session: DbSession = Depends(get_db_session)) -> AsyncUserService:
+    """Dependency to get the user service for the request's session."""
+    return AsyncUserService(session)
+
+
+def get_session_service(session: DbSession = Depends(get_db_session)) -> AsyncSessionService:
+    """Dependency to get the session service for the request's session."""
+    return AsyncSessionService(session)
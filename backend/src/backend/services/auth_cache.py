@@ -0,0 +1,139 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Optional, Set
+
+from ..config import settings
+from ..models.user import User
+
+
+@dataclass(frozen=True)
+class CachedAuth:
+    """A resolved session: user snapshot, role and permissions."""
+
+    user_id: uuid.UUID
+    role_id: int
+    user_data: Dict[str, Any]
+    permissions: FrozenSet[str]
+    expires_at: float
+    session_expires_at: datetime
+
+    def to_user(self) -> User:
+        """Build a detached User from the snapshot."""
+        return User(**self.user_data)
+
+
+class AuthUserCache:
+    """
+    Token-keyed TTL/LRU cache of authenticated users.
+
+    Lets get_current_user resolve a session token without touching the
+    database. Entries never outlive their session, and are dropped when a
+    session is deleted, a user is updated or a role changes. The cache is
+    per process, so other workers only see those changes once the TTL runs
+    out.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedAuth]" = OrderedDict()
+        self._user_tokens: Dict[uuid.UUID, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[CachedAuth]:
+        """Get the cached entry for a token, if present and still valid."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(token)
+                return None
+            self._entries.move_to_end(token)
+            return entry
+
+    def get_permissions(self, user_id: uuid.UUID) -> Optional[FrozenSet[str]]:
+        """Get the cached permission set of a user with a live cached session."""
+        now = time.time()
+        with self._lock:
+            for token in self._user_tokens.get(user_id, ()):
+                entry = self._entries[token]
+                if entry.expires_at > now:
+                    return entry.permissions
+        return None
+
+    def set(
+        self,
+        token: str,
+        user: User,
+        permissions: FrozenSet[str],
+        session_expires_at: datetime,
+    ) -> None:
+        """Cache a resolved user for a session token."""
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+
+        session_remaining = (session_expires_at - datetime.utcnow()).total_seconds()
+        entry = CachedAuth(
+            user_id=user.id,
+            role_id=user.role_id,
+            user_data=user.model_dump(),
+            permissions=frozenset(permissions),
+            expires_at=time.time() + min(self.ttl_seconds, session_remaining),
+            session_expires_at=session_expires_at,
+        )
+        with self._lock:
+            self._remove(token)
+            self._entries[token] = entry
+            self._user_tokens.setdefault(entry.user_id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_token(self, token: str) -> None:
+        """Drop the entry for a single session token."""
+        with self._lock:
+            self._remove(token)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        """Drop every entry belonging to a user."""
+        with self._lock:
+            for token in list(self._user_tokens.get(user_id, ())):
+                self._remove(token)
+
+    def invalidate_role(self, role_id: int) -> None:
+        """Drop every entry for users holding a role."""
+        with self._lock:
+            for token in [
+                token
+                for token, entry in self._entries.items()
+                if entry.role_id == role_id
+            ]:
+                self._remove(token)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._user_tokens.clear()
+
+    def _remove(self, token: str) -> None:
+        """Remove a token entry. Caller must hold the lock."""
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._user_tokens.get(entry.user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._user_tokens[entry.user_id]
+
+
+# Global auth cache instance
+auth_user_cache = AuthUserCache(
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+    max_entries=settings.auth_cache_max_entries,
+)
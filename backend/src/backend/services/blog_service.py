@@ -1,18 +1,158 @@
+import base64
 import datetime
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
-from sqlmodel import Session, select, and_, or_
-from typing import List, Optional
+from collections import defaultdict
+from sqlmodel import Session, select, update, and_, or_, func
+from typing import Dict, List, Optional, Sequence, Tuple
 import uuid
 
-from ..models.post import Post, PostRead, PostCreate, PostUpdate
+from ..models.post import Post, PostRead, PostCreate, PostUpdate, PostSummary
 from ..models.user import User
-from ..models.taxonomy import Category, Tag, PostCategory, PostTag
+from ..models.taxonomy import Category, Tag, PostCategory, PostTag, TaxonomyVersion
 from ..models.engagement import Like
 from ..models.post import PostData
+from ..models.comment import Comment, CommentStatus
 from ..config.database import engine
+from ..utils import ValidationError
+from ..utils.http_cache import make_etag
+from ..utils.rendering import EXCERPT_LENGTH, content_hash, make_excerpt, render_markdown
+from .post_cache import rendered_post_cache
+from .search_service import get_search_index, highlight_snippet
+from .view_counter import view_counter
+
+
+def adjust_post_counters(
+    session: Session, post_id: uuid.UUID, likes: int = 0, comments: int = 0
+) -> None:
+    """
+    Atomically shift a post's denormalized counters.
+
+    Runs as a single UPDATE ... SET col = col + :delta inside the caller's
+    transaction, so the counter commits together with the like/comment row.
+    The post's cached rendering is dropped when that transaction commits.
+    """
+    values = {}
+    if likes:
+        values["likes_count"] = Post.likes_count + likes
+    if comments:
+        values["comments_count"] = Post.comments_count + comments
+    if values:
+        rendered_post_cache.mark_stale(session, Post.id == post_id)
+        session.exec(update(Post).where(Post.id == post_id).values(**values))
+
+
+def touch_posts(session: Session, post_ids) -> None:
+    """
+    Bump updated_at on posts whose rendered payload changed without an
+    edit, such as through a re-render of their markdown, so their
+    validators change too.
+    """
+    rendered_post_cache.mark_stale(session, Post.id.in_(post_ids))
+    session.exec(
+        update(Post)
+        .where(Post.id.in_(post_ids))
+        .values(updated_at=datetime.datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_taxonomy_version(session: Session, post_ids) -> None:
+    """
+    Record a category or tag change that alters how posts render, such as
+    a rename. Post validators include the taxonomy version, so they change
+    without the posts being rewritten; the cached renderings of post_ids
+    are dropped when the transaction commits.
+    """
+    rendered_post_cache.mark_stale(session, Post.id.in_(post_ids))
+    now = datetime.datetime.utcnow()
+    result = session.exec(
+        update(TaxonomyVersion)
+        .where(TaxonomyVersion.id == 1)
+        .values(version=TaxonomyVersion.version + 1, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        session.add(TaxonomyVersion(id=1, version=1, updated_at=now))
+
+
+# Columns that change whenever a post renders differently (except view counts)
+POST_VALIDATOR_COLUMNS = (
+    Post.id,
+    Post.status,
+    Post.updated_at,
+    Post.likes_count,
+    Post.comments_count,
+    User.username,
+    User.display_name,
+    # Category and tag names are rendered too
+    select(TaxonomyVersion.version)
+    .where(TaxonomyVersion.id == 1)
+    .scalar_subquery()
+    .label("taxonomy_version"),
+    select(TaxonomyVersion.updated_at)
+    .where(TaxonomyVersion.id == 1)
+    .scalar_subquery()
+    .label("taxonomy_updated_at"),
+)
+
+
+def render_post_data(post_data: PostData) -> bool:
+    """
+    Store the rendered HTML and excerpt for a post's markdown source.
+
+    The source is markdown_content, or content when there is none. Nothing
+    is re-rendered when its hash matches the stored content_hash. Returns
+    whether the stored rendering changed.
+    """
+    source = post_data.markdown_content or post_data.content
+    source_hash = content_hash(source)
+    if post_data.content_hash == source_hash:
+        return False
+    post_data.rendered_html = render_markdown(source)
+    post_data.excerpt = make_excerpt(source)
+    post_data.content_hash = source_hash
+    return True
+
+
+# Columns needed to build a PostSummary; the post body is never loaded.
+# Rows written before excerpts were stored fall back to a SQL substring.
+POST_SUMMARY_COLUMNS = (
+    Post.id,
+    Post.slug,
+    Post.title,
+    Post.feather_type,
+    Post.status,
+    Post.published_at,
+    Post.view_count,
+    Post.created_at,
+    Post.likes_count,
+    Post.comments_count,
+    User.username,
+    User.display_name,
+    func.coalesce(
+        PostData.excerpt, func.substr(PostData.content, 1, EXCERPT_LENGTH), ""
+    ).label("excerpt"),
+)
+
+
+def encode_post_cursor(created_at: datetime.datetime, post_id: uuid.UUID) -> str:
+    """Encode a (created_at, id) listing position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), str(post_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_post_cursor(cursor: str) -> Tuple[datetime.datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_post_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, post_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.datetime.fromisoformat(created_at), uuid.UUID(post_id)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor")
 
 
 class BlogService:
@@ -21,7 +161,7 @@ class BlogService:
     def __init__(self, session: Session):
         self.session = session
 
-    async def list_posts(
+    def list_posts(
         self,
         skip: int = 0,
         limit: int = 50,
@@ -31,15 +171,156 @@ class BlogService:
         status: Optional[str] = None,
         author_id: Optional[uuid.UUID] = None,
         current_user: Optional[User] = None,
+        cursor: Optional[str] = None,
     ) -> List[PostRead]:
         """
         List posts with filtering and pagination.
 
         Includes categories, tags, likes count, and view count.
         Private/draft posts filtered based on user permissions.
+
+        Posts are ordered newest first by (created_at, id). When a cursor
+        is given, the page starts right after that position (keyset
+        pagination) and skip is ignored.
+
+        With a search query, posts come from the full-text index ordered by
+        relevance and carry a highlighted search_snippet; cursors are not
+        supported in that mode.
+        """
+        statement, search_results = self._list_statement(
+            (Post, PostData, User),
+            skip=skip,
+            limit=limit,
+            category=category,
+            tag=tag,
+            search=search,
+            status=status,
+            author_id=author_id,
+            current_user=current_user,
+            cursor=cursor,
+        )
+        posts = self.session.exec(statement).all()
+
+        if search_results is None:
+            # Convert to PostRead with additional data
+            return self._hydrate_posts(posts)
+
+        post_reads = self._hydrate_posts([row[:3] for row in posts])
+        for post_read, row in zip(post_reads, posts):
+            post_read.search_snippet = highlight_snippet(row[3])
+        return post_reads
+
+    def list_post_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        author_id: Optional[uuid.UUID] = None,
+        current_user: Optional[User] = None,
+        cursor: Optional[str] = None,
+    ) -> List[PostSummary]:
+        """
+        List posts like list_posts, as lightweight summaries.
+
+        Selects only the columns a listing shows, with the stored excerpt in
+        place of the post body, and skips the category and tag lookups.
+        """
+        statement, search_results = self._list_statement(
+            POST_SUMMARY_COLUMNS,
+            skip=skip,
+            limit=limit,
+            category=category,
+            tag=tag,
+            search=search,
+            status=status,
+            author_id=author_id,
+            current_user=current_user,
+            cursor=cursor,
+        )
+        rows = self.session.exec(statement).all()
+
+        return [
+            PostSummary(
+                id=row.id,
+                slug=row.slug,
+                title=row.title,
+                feather_type=row.feather_type,
+                status=row.status,
+                published_at=row.published_at,
+                view_count=(row.view_count or 0) + view_counter.pending(row.id),
+                created_at=row.created_at,
+                author_name=row.display_name or row.username,
+                likes_count=row.likes_count,
+                comments_count=row.comments_count,
+                excerpt=row.excerpt,
+                search_snippet=highlight_snippet(row.snippet) if search_results is not None else None,
+            )
+            for row in rows
+        ]
+
+    def get_list_validator(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        author_id: Optional[uuid.UUID] = None,
+        current_user: Optional[User] = None,
+        cursor: Optional[str] = None,
+    ) -> str:
+        """
+        Get the ETag validator for a list_posts page.
+
+        Runs the same query as list_posts but selects only the columns that
+        change whenever a post on the page would render differently, so a
+        conditional request can be answered without hydrating the page.
+        The ETag is weak because buffered view counts are left out.
+
+        There is no Last-Modified: a post deleted or unpublished off the
+        page leaves the newest remaining updated_at unchanged, while the
+        ETag changes with the set of posts on the page.
+        """
+        statement, _ = self._list_statement(
+            POST_VALIDATOR_COLUMNS,
+            skip=skip,
+            limit=limit,
+            category=category,
+            tag=tag,
+            search=search,
+            status=status,
+            author_id=author_id,
+            current_user=current_user,
+            cursor=cursor,
+        )
+        rows = self.session.exec(statement).all()
+        return make_etag([tuple(row) for row in rows], weak=True)
+
+    def _list_statement(
+        self,
+        columns: Sequence,
+        skip: int,
+        limit: int,
+        category: Optional[str],
+        tag: Optional[str],
+        search: Optional[str],
+        status: Optional[str],
+        author_id: Optional[uuid.UUID],
+        current_user: Optional[User],
+        cursor: Optional[str],
+    ):
+        """
+        Build the filtered, ordered and paginated list_posts query.
+
+        Returns the statement and the search subquery, if searching. With
+        search the snippet is selected after the given columns.
         """
         # join with PostData to get content and excerpt
-        statement = select(Post, PostData, User).where(
+        statement = select(*columns).where(
             Post.id == PostData.post_id, Post.author_id == User.id
         )
 
@@ -65,65 +346,40 @@ class BlogService:
         if tag:
             statement = statement.join(PostTag).join(Tag).where(Tag.slug == tag)
 
-        # Search in title and content
+        # Search in title and content via the full-text index
+        search_results = None
         if search:
-            search_filter = or_(
-                Post.title.ilike(f"%{search}%"), Post.content.ilike(f"%{search}%")
+            if cursor:
+                raise ValidationError("Cursor pagination is not supported with search")
+            search_results = get_search_index(self.session).search(search)
+            statement = statement.add_columns(search_results.c.snippet).join(
+                search_results, search_results.c.post_id == Post.id
             )
-            statement = statement.where(search_filter)
 
         # Apply pagination
-        statement = statement.offset(skip).limit(limit).order_by(Post.created_at.desc())
-
-        posts = self.session.exec(statement).all()
-
-        # Convert to PostRead with additional data
-        post_reads = []
-        for post, post_data, author in posts:
-            # Get categories
-            categories = self._get_post_categories(post.id)
-
-            # Get tags
-            tags = self._get_post_tags(post.id)
-
-            # Get likes count
-            likes_count = self._get_likes_count(post.id)
-
-            # Create PostRead object
-            post_read = PostRead(
-                id=post.id,
-                author_id=author.id,
-                author_name=author.display_name or author.username,
-                feather_type=post.feather_type,
-                slug=post.slug,
-                title=post.title,
-                status=post.status,
-                published_at=post.published_at,
-                is_private=post.is_private,
-                view_count=post.view_count,
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                categories=categories,
-                tags=tags,
-                likes_count=likes_count,
-                content=post_data.content,
-                excerpt=post_data.content[:100] if post_data.content else "",
-                media_url=post_data.media_url,
-                media_type=post_data.media_type,
-                quote_source=post_data.quote_source,
-                link_url=post_data.link_url,
+        if cursor:
+            cursor_created_at, cursor_id = decode_post_cursor(cursor)
+            statement = statement.where(
+                or_(
+                    Post.created_at < cursor_created_at,
+                    and_(Post.created_at == cursor_created_at, Post.id < cursor_id),
+                )
             )
+        else:
+            statement = statement.offset(skip)
+        if search_results is not None:
+            statement = statement.order_by(search_results.c.rank.desc())
+        statement = statement.limit(limit).order_by(
+            Post.created_at.desc(), Post.id.desc()
+        )
+        return statement, search_results
 
-            post_reads.append(post_read)
-
-        return post_reads
-
-    async def get_post_by_id(
+    def get_post_by_id(
         self, post_id: uuid.UUID, current_user: Optional[User] = None
     ) -> Optional[PostRead]:
         """
         Get a single post by ID with all related data.
-        Increments view count for public posts.
+        Records a view for public posts.
         """
         statement = (
             select(Post, PostData, User)
@@ -142,43 +398,42 @@ class BlogService:
         if post.status != "published" and not current_user:
             return None
 
-        # Increment view count for published posts
+        # Record a view for published posts
         if post.status == "published":
-            post.view_count = (post.view_count or 0) + 1
-            self.session.add(post)
-            self.session.commit()
-            self.session.refresh(post)
-
-        # Get additional data
-        categories = self._get_post_categories(post.id)
-        tags = self._get_post_tags(post.id)
-        likes_count = self._get_likes_count(post.id)
-
-        return PostRead(
-            id=post.id,
-            author_id=author.id,
-            author_name=author.display_name or author.username,
-            feather_type=post.feather_type,
-            slug=post.slug,
-            title=post.title,
-            status=post.status,
-            published_at=post.published_at,
-            is_private=post.is_private,
-            view_count=post.view_count,
-            created_at=post.created_at,
-            updated_at=post.updated_at,
-            categories=categories,
-            tags=tags,
-            likes_count=likes_count,
-            content=post_data.content,
-            excerpt=post_data.content[:100] if post_data.content else "",
-            media_url=post_data.media_url,
-            media_type=post_data.media_type,
-            quote_source=post_data.quote_source,
-            link_url=post_data.link_url,
+            view_counter.record(post.id)
+
+        return self._hydrate_posts([(post, post_data, author)])[0]
+
+    def get_post_validator(
+        self, slug: str, current_user: Optional[User] = None
+    ) -> Optional[Tuple[uuid.UUID, str, str, datetime.datetime]]:
+        """
+        Get (post_id, status, ETag, Last-Modified) for a post by slug.
+
+        Applies the same visibility rules as get_post_by_slug and returns
+        None where it would. The ETag is weak because buffered view counts
+        are left out.
+        """
+        statement = (
+            select(*POST_VALIDATOR_COLUMNS)
+            .where(Post.slug == slug)
+            .join(PostData, Post.id == PostData.post_id)
+            .join(User, Post.author_id == User.id)
         )
+        row = self.session.exec(statement).first()
+        if not row:
+            return None
 
-    async def get_post_by_slug(
+        # Check if user can view this post
+        if row.status != "published" and not current_user:
+            return None
+
+        last_modified = row.updated_at
+        if row.taxonomy_updated_at is not None:
+            last_modified = max(last_modified, row.taxonomy_updated_at)
+        return row.id, row.status, make_etag(tuple(row), weak=True), last_modified
+
+    def get_post_by_slug(
         self, slug: str, current_user: Optional[User] = None
     ) -> Optional[PostRead]:
         """
@@ -202,36 +457,9 @@ class BlogService:
         if post.status != "published" and not current_user:
             return None
 
-        # Get additional data
-        categories = self._get_post_categories(post.id)
-        tags = self._get_post_tags(post.id)
-        likes_count = self._get_likes_count(post.id)
-
-        return PostRead(
-            id=post.id,
-            author_id=author.id,
-            author_name=author.display_name or author.username,
-            feather_type=post.feather_type,
-            slug=post.slug,
-            title=post.title,
-            status=post.status,
-            published_at=post.published_at,
-            is_private=post.is_private,
-            view_count=post.view_count,
-            created_at=post.created_at,
-            updated_at=post.updated_at,
-            categories=categories,
-            tags=tags,
-            likes_count=likes_count,
-            content=post_data.content,
-            excerpt=post_data.content[:100] if post_data.content else "",
-            media_url=post_data.media_url,
-            media_type=post_data.media_type,
-            quote_source=post_data.quote_source,
-            link_url=post_data.link_url,
-        )
+        return self._hydrate_posts([(post, post_data, author)])[0]
 
-    async def create_post(self, post_data: PostCreate, current_user: User) -> PostRead:
+    def create_post(self, post_data: PostCreate, current_user: User) -> PostRead:
         """Create a new post."""
         post = Post(
             feather_type=post_data.feather_type,
@@ -259,8 +487,11 @@ class BlogService:
             media_type=post_data.media_type,
             quote_source=post_data.quote_source,
         )
+        render_post_data(post_data_entry)
 
         self.session.add(post_data_entry)
+        self.session.flush()
+        get_search_index(self.session).index_post(post.id)
         self.session.commit()
 
         # Add categories if provided
@@ -277,9 +508,9 @@ class BlogService:
 
         self.session.commit()
 
-        return await self.get_post_by_id(post.id, current_user)
+        return self.get_post_by_id(post.id, current_user)
 
-    async def update_post(
+    def update_post(
         self, post_id: uuid.UUID, post_data: PostUpdate, current_user: User
     ) -> Optional[PostRead]:
         """Update an existing post."""
@@ -289,6 +520,8 @@ class BlogService:
 
         # TODO: Add authorization check (author or admin)
 
+        rendered_post_cache.mark_stale(self.session, Post.id == post_id)
+
         # Update base post fields
         update_data = post_data.model_dump(
             exclude_unset=True, exclude={"categories", "tags", "content", "markdown_content", 
@@ -296,6 +529,7 @@ class BlogService:
         )
         for field, value in update_data.items():
             setattr(post, field, value)
+        post.updated_at = datetime.datetime.utcnow()
 
         # Handle published_at
         if "status" in update_data:
@@ -326,7 +560,10 @@ class BlogService:
                 quote_source=post_data.quote_source,
             )
             self.session.add(post_data_entry)
+        render_post_data(post_data_entry)
 
+        self.session.flush()
+        get_search_index(self.session).index_post(post.id)
         self.session.commit()
 
         # Update categories
@@ -343,12 +580,14 @@ class BlogService:
                 post_tag = PostTag(post_id=post.id, tag_id=tag_id)
                 self.session.add(post_tag)
 
+        # Covers the new slug and anything re-cached during the update
+        rendered_post_cache.mark_stale(self.session, Post.id == post_id)
         self.session.commit()
 
-        return await self.get_post_by_id(post.id, current_user)
+        return self.get_post_by_id(post.id, current_user)
 
 
-    async def delete_post(self, post_id: uuid.UUID, current_user: User) -> bool:
+    def delete_post(self, post_id: uuid.UUID, current_user: User) -> bool:
         """Delete a post."""
         post = self.session.get(Post, post_id)
         if not post:
@@ -356,11 +595,13 @@ class BlogService:
 
         # TODO: Add authorization check (author or admin)
 
+        get_search_index(self.session).remove_post(post.id)
+        rendered_post_cache.mark_stale(self.session, Post.id == post_id)
         self.session.delete(post)
         self.session.commit()
         return True
 
-    async def like_post(self, post_id: uuid.UUID, current_user: User) -> bool:
+    def like_post(self, post_id: uuid.UUID, current_user: User) -> bool:
         """Like a post."""
         post = self.session.get(Post, post_id)
         if not post:
@@ -379,10 +620,11 @@ class BlogService:
         # Create like
         like = Like(post_id=post_id, user_id=current_user.id)
         self.session.add(like)
+        adjust_post_counters(self.session, post_id, likes=1)
         self.session.commit()
         return True
 
-    async def unlike_post(self, post_id: uuid.UUID, current_user: User) -> bool:
+    def unlike_post(self, post_id: uuid.UUID, current_user: User) -> bool:
         """Remove like from a post."""
         like = self.session.exec(
             select(Like).where(
@@ -394,38 +636,155 @@ class BlogService:
             return False
 
         self.session.delete(like)
+        adjust_post_counters(self.session, post_id, likes=-1)
         self.session.commit()
         return True
 
-    def _get_post_categories(self, post_id: uuid.UUID) -> List[dict]:
-        """Get categories for a post."""
-        statement = (
-            select(Category).join(PostCategory).where(PostCategory.post_id == post_id)
-        )
-        categories = self.session.exec(statement).all()
+    def _hydrate_posts(
+        self, rows: Sequence[Tuple[Post, PostData, User]]
+    ) -> List[PostRead]:
+        """
+        Build PostRead objects for a page of (Post, PostData, User) rows.
+
+        Categories and tags are loaded with one grouped query each for the
+        whole page rather than once per post; likes and comments counts come
+        from the denormalized columns on Post.
+        """
+        post_ids = [post.id for post, _, _ in rows]
+        categories = self._get_categories_for_posts(post_ids)
+        tags = self._get_tags_for_posts(post_ids)
+
         return [
-            {"id": cat.id, "name": cat.name, "slug": cat.slug} for cat in categories
+            PostRead(
+                id=post.id,
+                author_id=author.id,
+                author_name=author.display_name or author.username,
+                feather_type=post.feather_type,
+                slug=post.slug,
+                title=post.title,
+                status=post.status,
+                published_at=post.published_at,
+                is_private=post.is_private,
+                view_count=(post.view_count or 0) + view_counter.pending(post.id),
+                created_at=post.created_at,
+                updated_at=post.updated_at,
+                categories=categories.get(post.id, []),
+                tags=tags.get(post.id, []),
+                likes_count=post.likes_count,
+                comments_count=post.comments_count,
+                content=post_data.content,
+                markdown_content=post_data.markdown_content,
+                rendered_html=post_data.rendered_html,
+                # Rows not yet backfilled match the summary query's fallback
+                excerpt=(
+                    post_data.excerpt
+                    if post_data.excerpt is not None
+                    else (post_data.content or "")[:EXCERPT_LENGTH]
+                ),
+                media_url=post_data.media_url,
+                media_type=post_data.media_type,
+                quote_source=post_data.quote_source,
+                link_url=post_data.link_url,
+            )
+            for post, post_data, author in rows
         ]
 
-    def _get_post_tags(self, post_id: uuid.UUID) -> List[dict]:
-        """Get tags for a post."""
-        statement = select(Tag).join(PostTag).where(PostTag.post_id == post_id)
-        tags = self.session.exec(statement).all()
-        return [{"id": tag.id, "name": tag.name, "slug": tag.slug} for tag in tags]
+    def _get_categories_for_posts(
+        self, post_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[dict]]:
+        """Get categories for a set of posts, keyed by post id."""
+        if not post_ids:
+            return {}
+        statement = (
+            select(PostCategory.post_id, Category)
+            .join(Category, Category.id == PostCategory.category_id)
+            .where(PostCategory.post_id.in_(post_ids))
+        )
+        categories: Dict[uuid.UUID, List[dict]] = defaultdict(list)
+        for post_id, cat in self.session.exec(statement).all():
+            categories[post_id].append(
+                {"id": cat.id, "name": cat.name, "slug": cat.slug}
+            )
+        return categories
+
+    def _get_tags_for_posts(
+        self, post_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[dict]]:
+        """Get tags for a set of posts, keyed by post id."""
+        if not post_ids:
+            return {}
+        statement = (
+            select(PostTag.post_id, Tag)
+            .join(Tag, Tag.id == PostTag.tag_id)
+            .where(PostTag.post_id.in_(post_ids))
+        )
+        tags: Dict[uuid.UUID, List[dict]] = defaultdict(list)
+        for post_id, tag in self.session.exec(statement).all():
+            tags[post_id].append({"id": tag.id, "name": tag.name, "slug": tag.slug})
+        return tags
 
-    def _get_likes_count(self, post_id: uuid.UUID) -> int:
-        """Get likes count for a post."""
-        statement = select(Like).where(Like.post_id == post_id)
-        likes = self.session.exec(statement).all()
-        return len(likes)
+    def increment_view_count(self, post_id: uuid.UUID) -> bool:
+        """
+        Increment view count for a post.
 
-    async def increment_view_count(self, post_id: uuid.UUID) -> bool:
-        """Increment view count for a post."""
-        post = self.session.get(Post, post_id)
-        if not post:
+        The view is buffered and written back by the view counter flush.
+        """
+        exists = self.session.exec(select(Post.id).where(Post.id == post_id)).first()
+        if not exists:
             return False
-        
-        post.view_count = (post.view_count or 0) + 1
-        self.session.add(post)
-        self.session.commit()
+
+        view_counter.record(post_id)
         return True
+
+    def record_view(self, post_id: uuid.UUID) -> None:
+        """Record a view for a post already known to exist."""
+        view_counter.record(post_id)
+
+    def reconcile_post_counters(self) -> int:
+        """
+        Rebuild likes_count and comments_count on every post from the
+        likes and approved comments. Returns the number of posts updated.
+        """
+        likes_subquery = (
+            select(func.count(Like.id))
+            .where(Like.post_id == Post.id)
+            .scalar_subquery()
+        )
+        comments_subquery = (
+            select(func.count(Comment.id))
+            .where(Comment.post_id == Post.id, Comment.status == CommentStatus.APPROVED)
+            .scalar_subquery()
+        )
+        result = self.session.exec(
+            update(Post)
+            .values(likes_count=likes_subquery, comments_count=comments_subquery)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.commit()
+        return result.rowcount
+
+    def backfill_rendered_posts(self, batch_size: int = 500) -> int:
+        """
+        Store rendered HTML and excerpts for every post whose stored
+        rendering is missing or out of date, one batch per transaction.
+        Changed posts are touched so their validators and cached
+        renderings are refreshed. Returns the number of posts rendered.
+        """
+        rendered = 0
+        last_id = None
+        while True:
+            statement = select(PostData).order_by(PostData.id).limit(batch_size)
+            if last_id is not None:
+                statement = statement.where(PostData.id > last_id)
+            batch = self.session.exec(statement).all()
+            if not batch:
+                return rendered
+            last_id = batch[-1].id
+
+            changed = [entry.post_id for entry in batch if render_post_data(entry)]
+            if changed:
+                touch_posts(self.session, changed)
+                self.session.commit()
+                rendered += len(changed)
+            for entry in batch:
+                self.session.expunge(entry)
@@ -1,7 +1,8 @@
 from sqlmodel import Session, select
 from typing import Optional, List
 
-from backend.models.taxonomy import Category, CategoryCreate, CategoryUpdate
+from backend.models.taxonomy import Category, CategoryCreate, CategoryUpdate, PostCategory
+from backend.services.blog_service import bump_taxonomy_version
 from backend.utils import ConflictError, NotFoundError
 
 
@@ -81,6 +82,7 @@ class CategoryService:
             setattr(category, field, value)
         
         self.session.add(category)
+        bump_taxonomy_version(self.session, self._post_ids(category_id))
         self.session.commit()
         self.session.refresh(category)
         return category
@@ -95,6 +97,11 @@ class CategoryService:
         # is being used by any posts before allowing deletion, or implement
         # soft deletion instead
         
+        bump_taxonomy_version(self.session, self._post_ids(category_id))
         self.session.delete(category)
         self.session.commit()
         return True
+
+    def _post_ids(self, category_id: int):
+        """Select the ids of posts filed under a category."""
+        return select(PostCategory.post_id).where(PostCategory.category_id == category_id)
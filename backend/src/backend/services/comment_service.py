@@ -4,6 +4,7 @@ import uuid
 
 from backend.models.comment import Comment, CommentCreate, CommentUpdate, CommentStatus
 from backend.models.post import Post
+from backend.services.blog_service import adjust_post_counters
 from backend.utils import ConflictError, NotFoundError, AuthorizationError
 
 
@@ -43,6 +44,7 @@ class CommentService:
             status=CommentStatus.PENDING
         )
         
+        # Pending comments aren't shown, so they aren't counted until approved
         self.session.add(comment)
         self.session.commit()
         self.session.refresh(comment)
@@ -96,5 +98,25 @@ class CommentService:
             raise AuthorizationError("Can only delete your own comments")
         
         self.session.delete(comment)
+        if comment.status == CommentStatus.APPROVED:
+            adjust_post_counters(self.session, comment.post_id, comments=-1)
         self.session.commit()
         return True
+
+    def moderate_comment(self, comment_id: uuid.UUID, status: CommentStatus) -> Comment:
+        """
+        Set a comment's moderation status (admin only). The post's
+        comments_count follows comments into and out of APPROVED.
+        """
+        comment = self.get_comment_by_id(comment_id)
+        if not comment:
+            raise NotFoundError("Comment not found")
+
+        delta = int(status == CommentStatus.APPROVED) - int(comment.status == CommentStatus.APPROVED)
+        comment.status = status
+        self.session.add(comment)
+        if delta:
+            adjust_post_counters(self.session, comment.post_id, comments=delta)
+        self.session.commit()
+        self.session.refresh(comment)
+        return comment
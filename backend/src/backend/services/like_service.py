@@ -4,6 +4,7 @@ import uuid
 
 from backend.models.engagement import Like, LikeCreate
 from backend.models.post import Post
+from backend.services.blog_service import adjust_post_counters
 from backend.utils import ConflictError, NotFoundError, ValidationError
 
 
@@ -48,6 +49,7 @@ class LikeService:
         )
         
         self.session.add(like)
+        adjust_post_counters(self.session, post_id, likes=1)
         self.session.commit()
         self.session.refresh(like)
         return like
@@ -67,6 +69,7 @@ class LikeService:
             raise NotFoundError("Like not found")
         
         self.session.delete(like)
+        adjust_post_counters(self.session, post_id, likes=-1)
         self.session.commit()
         return True
     
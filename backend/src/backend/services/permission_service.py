@@ -1,6 +1,41 @@
+import threading
 from sqlmodel import Session, select, delete
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional
+from ..config.replicas import reading_from_primary
 from ..models.user import Role, Permission, RolePermission, User
+from .auth_cache import auth_user_cache
+
+
+class RolePermissionCache:
+    """Process-wide cache of each role's frozen permission set."""
+
+    def __init__(self):
+        self._permissions: Dict[int, FrozenSet[str]] = {}
+        self._lock = threading.Lock()
+        self.public_role_id: Optional[int] = None
+
+    def get(self, role_id: int) -> Optional[FrozenSet[str]]:
+        with self._lock:
+            return self._permissions.get(role_id)
+
+    def set(self, role_id: int, permissions: FrozenSet[str]) -> None:
+        with self._lock:
+            self._permissions[role_id] = permissions
+
+    def invalidate(self, role_id: Optional[int] = None) -> None:
+        """Drop one role's permissions, or everything when no role is given."""
+        with self._lock:
+            if role_id is None:
+                self._permissions.clear()
+                self.public_role_id = None
+            else:
+                self._permissions.pop(role_id, None)
+                if role_id == self.public_role_id:
+                    self.public_role_id = None
+
+
+# Global role permission cache instance
+role_permission_cache = RolePermissionCache()
 
 
 class PermissionService:
@@ -13,12 +48,19 @@ class PermissionService:
         """Get all permissions for a user."""
         if not user:
             # Get public role permissions
-            public_role = self.session.exec(
-                select(Role).where(Role.name == "public")
-            ).first()
-            if public_role:
-                return self._get_role_permissions(public_role.id)
-            return []
+            public_role_id = role_permission_cache.public_role_id
+            if public_role_id is None:
+                with reading_from_primary(self.session):
+                    public_role = self.get_role_by_name("public")
+                if not public_role:
+                    return []
+                public_role_id = role_permission_cache.public_role_id = public_role.id
+            return self._get_role_permissions(public_role_id)
+
+        # Reuse the permission set resolved alongside the user's session
+        cached = auth_user_cache.get_permissions(user.id)
+        if cached is not None:
+            return list(cached)
 
         # Get user's role permissions directly from user.role_id
         if user.role_id:
@@ -29,19 +71,27 @@ class PermissionService:
 
     def _get_role_permissions(self, role_id: int) -> List[str]:
         """Get permissions for a specific role."""
-        role_permissions = self.session.exec(
-            select(RolePermission).where(RolePermission.role_id == role_id)
-        ).all()
-
-        permission_names = []
-        for rp in role_permissions:
-            permission = self.session.exec(
-                select(Permission).where(Permission.id == rp.permission_id)
-            ).first()
-            if permission:
-                permission_names.append(permission.name)
-
-        return permission_names
+        return list(self.get_role_permission_set(role_id))
+
+    def get_role_permission_set(self, role_id: int) -> FrozenSet[str]:
+        """
+        Get the permission names of a role as a frozen set.
+
+        Served from the process-wide role cache; a miss loads the role's
+        permissions from the primary with a single join.
+        """
+        permissions = role_permission_cache.get(role_id)
+        if permissions is None:
+            with reading_from_primary(self.session):
+                permissions = frozenset(
+                    self.session.exec(
+                        select(Permission.name)
+                        .join(RolePermission, RolePermission.permission_id == Permission.id)
+                        .where(RolePermission.role_id == role_id)
+                    ).all()
+                )
+            role_permission_cache.set(role_id, permissions)
+        return permissions
 
     def create_role(
         self, name: str, permissions: List[str], description: Optional[str] = None
@@ -60,6 +110,7 @@ class PermissionService:
 
         # Add permissions
         self._update_role_permissions(role.id, permissions)
+        role_permission_cache.invalidate(role.id)
 
         return role
 
@@ -71,6 +122,8 @@ class PermissionService:
             return False
 
         self._update_role_permissions(role_id, permissions)
+        role_permission_cache.invalidate(role_id)
+        auth_user_cache.invalidate_role(role_id)
         return True
 
     def _update_role_permissions(self, role_id: int, permissions: List[str]) -> None:
@@ -148,6 +201,8 @@ class PermissionService:
         # Delete the role
         self.session.delete(role)
         self.session.commit()
+        role_permission_cache.invalidate(role_id)
+        auth_user_cache.invalidate_role(role_id)
 
         return True
 
@@ -233,3 +288,4 @@ class PermissionService:
                     )
 
         self.session.commit()
+        role_permission_cache.invalidate()
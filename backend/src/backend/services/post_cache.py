@@ -0,0 +1,274 @@
+import datetime
+import json
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from ..config import settings
+from ..models.post import Post
+
+
+@dataclass(frozen=True)
+class CachedPost:
+    """A serialized anonymous PostRead and the validators it was sent with."""
+
+    post_id: uuid.UUID
+    etag: str
+    last_modified: datetime.datetime
+    body: bytes
+
+    def to_bytes(self) -> bytes:
+        """Encode as a JSON header line followed by the body."""
+        header = json.dumps(
+            {
+                "post_id": str(self.post_id),
+                "etag": self.etag,
+                "last_modified": self.last_modified.isoformat(),
+            }
+        )
+        return header.encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CachedPost":
+        """Decode a value written by to_bytes."""
+        header, body = data.split(b"\n", 1)
+        fields = json.loads(header)
+        return cls(
+            post_id=uuid.UUID(fields["post_id"]),
+            etag=fields["etag"],
+            last_modified=datetime.datetime.fromisoformat(fields["last_modified"]),
+            body=body,
+        )
+
+
+class PostCacheBackend(ABC):
+    """
+    Storage for rendered posts, keyed by slug.
+
+    Holds a generation counter that every invalidation bumps. `set` only
+    stores a value if the generation is still the one read before the
+    value was loaded, so a rendering of a row that was replaced meanwhile
+    is never cached.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a stored value, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, generation: int) -> bool:
+        """Store a value unless the generation moved on; returns whether it was stored."""
+
+    @abstractmethod
+    def generation(self) -> int:
+        """Get the current generation."""
+
+    @abstractmethod
+    def bump_generation(self) -> None:
+        """Advance the generation, refusing in-flight `set` calls."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Drop a stored value."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every stored value."""
+
+
+class MemoryPostCacheBackend(PostCacheBackend):
+    """In-process TTL/LRU backend. Each worker process holds its own copy."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, generation: int) -> bool:
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return False
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def bump_generation(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedPostCacheBackend(PostCacheBackend):
+    """
+    Backend on a shared key-value store, so invalidations reach every worker.
+
+    `client` needs the redis-py get/set(ex=)/incr/delete/scan_iter
+    interface; any object providing it (such as an in-memory stand-in)
+    can be used.
+
+    The generation is a counter key. `set` checks it before writing and
+    again after, deleting its own write if an invalidation slipped in
+    between; invalidations bump the counter before deleting, so either
+    the check or the invalidation's delete removes a stale value.
+    """
+
+    def __init__(self, client: Any, ttl_seconds: float, prefix: str = "post:"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, generation: int) -> bool:
+        if self.ttl_seconds <= 0 or self.generation() != generation:
+            return False
+        self.client.set(self.prefix + key, value, ex=max(1, int(self.ttl_seconds)))
+        if self.generation() != generation:
+            self.client.delete(self.prefix + key)
+            return False
+        return True
+
+    def generation(self) -> int:
+        return int(self.client.get(self._generation_key) or 0)
+
+    def bump_generation(self) -> None:
+        self.client.incr(self._generation_key)
+
+    @property
+    def _generation_key(self) -> str:
+        # Outside the prefix* namespace, so clear() keeps the counter going
+        return f"generation:{self.prefix}"
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=f"{self.prefix}*"):
+            self.client.delete(key)
+
+
+class RenderedPostCache:
+    """
+    Cache of rendered anonymous GET /posts/{slug} responses.
+
+    Writes that change how a post renders call mark_stale inside their
+    transaction; once it commits, the cache generation is bumped and the
+    slugs are dropped. Readers take `generation()` before loading a post
+    and pass it to `set`, which refuses to store the rendering if an
+    invalidation happened in between, so a reader that loaded the old row
+    cannot re-cache it after the writer's invalidation.
+    """
+
+    def __init__(self, backend: PostCacheBackend):
+        self.backend = backend
+
+    def get(self, slug: str) -> Optional[CachedPost]:
+        """Get the cached rendering of a post."""
+        data = self.backend.get(slug)
+        return CachedPost.from_bytes(data) if data is not None else None
+
+    def generation(self) -> int:
+        """Current cache generation; read it before loading what will be cached."""
+        return self.backend.generation()
+
+    def set(self, slug: str, post: CachedPost, generation: int) -> bool:
+        """
+        Store the rendering of a post, unless the cache was invalidated
+        since `generation` was read. Returns whether it was stored.
+        """
+        return self.backend.set(slug, post.to_bytes(), generation)
+
+    def invalidate(self, slugs: Iterable[str]) -> None:
+        """Drop cached renderings now."""
+        self.backend.bump_generation()
+        for slug in slugs:
+            self.backend.delete(slug)
+
+    def clear(self) -> None:
+        """Drop all cached renderings."""
+        self.backend.bump_generation()
+        self.backend.clear()
+
+    def mark_stale(self, session: Session, *conditions) -> None:
+        """
+        Queue posts matching `conditions` for invalidation when the session
+        commits. Call before any change to the posts' slugs is flushed.
+        """
+        slugs = session.exec(select(Post.slug).where(*conditions)).all()
+        session.info.setdefault("stale_post_slugs", set()).update(slugs)
+
+
+def _create_backend() -> PostCacheBackend:
+    """Build the backend configured by POST_CACHE_URL."""
+    if not settings.post_cache_url:
+        return MemoryPostCacheBackend(
+            ttl_seconds=settings.post_cache_ttl_seconds,
+            max_entries=settings.post_cache_max_entries,
+        )
+
+    # Redis is only needed when a shared cache is configured
+    try:
+        import redis
+    except ImportError as e:
+        raise RuntimeError(
+            "POST_CACHE_URL is set but the redis package is not installed; "
+            "install the backend's 'redis' extra or leave POST_CACHE_URL empty"
+        ) from e
+
+    return SharedPostCacheBackend(
+        redis.Redis.from_url(settings.post_cache_url),
+        ttl_seconds=settings.post_cache_ttl_seconds,
+    )
+
+
+# Global rendered post cache instance
+rendered_post_cache = RenderedPostCache(_create_backend())
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    slugs: Optional[Set[str]] = session.info.pop("stale_post_slugs", None)
+    if slugs:
+        rendered_post_cache.invalidate(slugs)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop("stale_post_slugs", None)
@@ -0,0 +1,308 @@
+import html
+import re
+import uuid
+from typing import Dict, List, Optional, Type
+
+from sqlalchemy import DDL, Float, String, bindparam, event, literal, text
+from sqlalchemy.sql import Subquery
+from sqlalchemy.sql.expression import BindParameter
+from sqlmodel import Session, select, or_
+
+from ..models.post import Post, PostData
+
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+
+# Private-use characters the database wraps matches in; they become
+# <mark> tags only after the snippet text has been HTML-escaped
+MATCH_START = "\ue000"
+MATCH_END = "\ue001"
+
+
+def highlight_snippet(snippet: Optional[str]) -> Optional[str]:
+    """HTML-escape a raw search snippet and wrap its matches in <mark> tags."""
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet, quote=False)
+        .replace(MATCH_START, SNIPPET_START)
+        .replace(MATCH_END, SNIPPET_END)
+    )
+
+
+class PostSearchIndex:
+    """
+    Base class for post full-text search backends.
+
+    Backends index Post.title together with PostData.content and
+    PostData.markdown_content, and answer queries with a subquery of
+    (post_id, rank, snippet) rows where a higher rank is a better match.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def ensure_schema(self) -> None:
+        """Create the backend's index structures if they don't exist."""
+
+    def index_post(self, post_id: uuid.UUID) -> None:
+        """Add or refresh a post in the index."""
+
+    def remove_post(self, post_id: uuid.UUID) -> None:
+        """Remove a post from the index. Must run before the post is deleted."""
+
+    def rebuild(self) -> int:
+        """Re-index every post. Returns the number of posts indexed."""
+        return 0
+
+    def search(self, query: str) -> Subquery:
+        """Get a (post_id, rank, snippet) subquery of posts matching query."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _terms(query: str) -> List[str]:
+        """Split a user query into plain word terms."""
+        return re.findall(r"\w+", query)
+
+    @staticmethod
+    def _post_id_param() -> BindParameter:
+        return bindparam("post_id", type_=Post.__table__.c.id.type)
+
+
+class LikeSearchIndex(PostSearchIndex):
+    """Fallback backend using ILIKE scans, for databases without full-text support."""
+
+    def search(self, query: str) -> Subquery:
+        pattern = f"%{query}%"
+        return (
+            select(
+                Post.id.label("post_id"),
+                literal(0.0, Float).label("rank"),
+                literal(None, String).label("snippet"),
+            )
+            .join(PostData, PostData.post_id == Post.id)
+            .where(
+                or_(
+                    Post.title.ilike(pattern),
+                    PostData.content.ilike(pattern),
+                    PostData.markdown_content.ilike(pattern),
+                )
+            )
+            .subquery("search")
+        )
+
+
+class SqliteSearchIndex(PostSearchIndex):
+    """
+    FTS5 backend. Each post gets a stable FTS rowid from post_search_rowid,
+    so refreshing or removing a post is a rowid lookup rather than a scan of
+    the UNINDEXED post_id column; posts.rowid isn't used, since VACUUM may
+    renumber it.
+    """
+
+    SELECT_ROWS = (
+        "SELECT m.fts_rowid, p.id, p.title, d.content, d.markdown_content "
+        "FROM posts p JOIN post_search_rowid m ON m.post_id = p.id "
+        "LEFT JOIN post_data d ON d.post_id = p.id"
+    )
+
+    def ensure_schema(self) -> None:
+        connection = self.session.connection()
+        for statement in SQLITE_SCHEMA:
+            connection.execute(text(statement))
+        # Indexes built before the rowid map existed have no rowids to replace by
+        stale = connection.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM posts_fts) "
+                "AND NOT EXISTS (SELECT 1 FROM post_search_rowid)"
+            )
+        ).scalar()
+        if stale:
+            self.rebuild()
+
+    def index_post(self, post_id: uuid.UUID) -> None:
+        connection = self.session.connection()
+        params = {"post_id": post_id}
+        connection.execute(
+            text("INSERT OR IGNORE INTO post_search_rowid (post_id) VALUES (:post_id)").bindparams(
+                self._post_id_param()
+            ),
+            params,
+        )
+        fts_rowid = connection.execute(
+            text("SELECT fts_rowid FROM post_search_rowid WHERE post_id = :post_id").bindparams(
+                self._post_id_param()
+            ),
+            params,
+        ).scalar_one()
+        connection.execute(text("DELETE FROM posts_fts WHERE rowid = :fts_rowid"), {"fts_rowid": fts_rowid})
+        connection.execute(
+            text(
+                "INSERT INTO posts_fts (rowid, post_id, title, content, markdown_content) "
+                f"{self.SELECT_ROWS} WHERE p.id = :post_id"
+            ).bindparams(self._post_id_param()),
+            params,
+        )
+
+    def remove_post(self, post_id: uuid.UUID) -> None:
+        connection = self.session.connection()
+        connection.execute(
+            text(
+                "DELETE FROM posts_fts WHERE rowid = "
+                "(SELECT fts_rowid FROM post_search_rowid WHERE post_id = :post_id)"
+            ).bindparams(self._post_id_param()),
+            {"post_id": post_id},
+        )
+        connection.execute(
+            text("DELETE FROM post_search_rowid WHERE post_id = :post_id").bindparams(
+                self._post_id_param()
+            ),
+            {"post_id": post_id},
+        )
+
+    def rebuild(self) -> int:
+        connection = self.session.connection()
+        for statement in SQLITE_SCHEMA:
+            connection.execute(text(statement))
+        connection.execute(text("DELETE FROM posts_fts"))
+        connection.execute(text("DELETE FROM post_search_rowid"))
+        connection.execute(text("INSERT INTO post_search_rowid (post_id) SELECT id FROM posts"))
+        result = connection.execute(
+            text(f"INSERT INTO posts_fts (rowid, post_id, title, content, markdown_content) {self.SELECT_ROWS}")
+        )
+        return result.rowcount
+
+    def search(self, query: str) -> Subquery:
+        terms = self._terms(query)
+        if not terms:
+            statement = text("SELECT NULL AS post_id, 0.0 AS rank, NULL AS snippet WHERE 0")
+        else:
+            # Quote every term so FTS5 operators in user input are taken literally,
+            # and let the last one match as a prefix for search-as-you-type.
+            match = " ".join(f'"{term}"' for term in terms) + "*"
+            statement = text(
+                "SELECT post_id, -bm25(posts_fts, 0.0, 10.0, 1.0, 1.0) AS rank, "
+                f"snippet(posts_fts, -1, '{MATCH_START}', '{MATCH_END}', '…', 16) AS snippet "
+                "FROM posts_fts WHERE posts_fts MATCH :match"
+            ).bindparams(match=match)
+        return (
+            statement
+            .columns(post_id=Post.__table__.c.id.type, rank=Float, snippet=String)
+            .subquery("search")
+        )
+
+
+class PostgresSearchIndex(PostSearchIndex):
+    """tsvector backend with a GIN index, title weighted above body text."""
+
+    DOCUMENT = (
+        "setweight(to_tsvector('english', coalesce(p.title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(d.content, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(d.markdown_content, '')), 'B')"
+    )
+    SELECT_ROWS = (
+        f"SELECT p.id, coalesce(d.content, d.markdown_content, ''), {DOCUMENT} "
+        "FROM posts p LEFT JOIN post_data d ON d.post_id = p.id"
+    )
+
+    def ensure_schema(self) -> None:
+        connection = self.session.connection()
+        for statement in POSTGRES_SCHEMA:
+            connection.execute(text(statement))
+
+    def index_post(self, post_id: uuid.UUID) -> None:
+        self.session.connection().execute(
+            text(
+                "INSERT INTO post_search (post_id, body, document) "
+                f"{self.SELECT_ROWS} WHERE p.id = :post_id "
+                "ON CONFLICT (post_id) DO UPDATE "
+                "SET body = EXCLUDED.body, document = EXCLUDED.document"
+            ).bindparams(self._post_id_param()),
+            {"post_id": post_id},
+        )
+
+    def remove_post(self, post_id: uuid.UUID) -> None:
+        self.session.connection().execute(
+            text("DELETE FROM post_search WHERE post_id = :post_id").bindparams(
+                self._post_id_param()
+            ),
+            {"post_id": post_id},
+        )
+
+    def rebuild(self) -> int:
+        self.ensure_schema()
+        connection = self.session.connection()
+        connection.execute(text("TRUNCATE post_search"))
+        result = connection.execute(
+            text(f"INSERT INTO post_search (post_id, body, document) {self.SELECT_ROWS}")
+        )
+        return result.rowcount
+
+    def search(self, query: str) -> Subquery:
+        return (
+            text(
+                "SELECT s.post_id, ts_rank_cd(s.document, q) AS rank, "
+                "ts_headline('english', s.body, q, "
+                f"'StartSel={MATCH_START}, StopSel={MATCH_END}, MaxWords=30, MinWords=10') AS snippet "
+                "FROM post_search s, websearch_to_tsquery('english', :query) q "
+                "WHERE s.document @@ q"
+            )
+            .bindparams(query=query)
+            .columns(post_id=Post.__table__.c.id.type, rank=Float, snippet=String)
+            .subquery("search")
+        )
+
+
+SQLITE_SCHEMA = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5("
+    "post_id UNINDEXED, title, content, markdown_content)",
+    "CREATE TABLE IF NOT EXISTS post_search_rowid ("
+    "fts_rowid INTEGER PRIMARY KEY, "
+    "post_id CHAR(32) NOT NULL UNIQUE)",
+]
+
+POSTGRES_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS post_search ("
+    "post_id UUID PRIMARY KEY REFERENCES posts(id) ON DELETE CASCADE, "
+    "body TEXT, "
+    "document TSVECTOR NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_post_search_document ON post_search USING GIN (document)",
+]
+
+SEARCH_BACKENDS: Dict[str, Type[PostSearchIndex]] = {
+    "sqlite": SqliteSearchIndex,
+    "postgresql": PostgresSearchIndex,
+}
+
+
+def get_search_index(session: Session) -> PostSearchIndex:
+    """Get the search backend for the session's database dialect."""
+    dialect = session.get_bind().dialect.name
+    return SEARCH_BACKENDS.get(dialect, LikeSearchIndex)(session)
+
+
+# Create the index structures alongside post_data on fresh databases
+for _statement in SQLITE_SCHEMA:
+    event.listen(
+        PostData.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+for _statement in POSTGRES_SCHEMA:
+    event.listen(
+        PostData.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+for _table in ("posts_fts", "post_search_rowid"):
+    event.listen(
+        PostData.__table__,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {_table}").execute_if(dialect="sqlite"),
+    )
+event.listen(
+    PostData.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS post_search").execute_if(dialect="postgresql"),
+)
@@ -1,10 +1,14 @@
-from sqlmodel import Session, select
-from typing import Optional
+from sqlmodel import Session, select, delete, update
+from typing import Optional, Tuple
 from datetime import datetime
 import uuid
 
+from backend.config import settings
 from backend.models import UserSession, SessionCreate, User
 from backend.utils import NotFoundError
+from backend.utils.tokens import SessionTokenClaims, sign_session_token
+from backend.services.auth_cache import auth_user_cache
+from backend.services.token_revocations import token_revocations
 
 
 class SessionService:
@@ -15,9 +19,6 @@ class SessionService:
     
     def create_session(self, user_id: uuid.UUID) -> UserSession:
         """Create a new session for user."""
-        # Clean up expired sessions for this user
-        self.cleanup_expired_sessions(user_id)
-        
         session_token = UserSession.create_session_token()
         expires_at = UserSession.get_expiry_time()
         
@@ -32,6 +33,31 @@ class SessionService:
         self.session.refresh(user_session)
         return user_session
     
+    def issue_token(self, user: User) -> Tuple[str, datetime]:
+        """
+        Start a session for a user in the configured SESSION_TOKEN_MODE.
+        Returns the token and its expiry.
+        """
+        if settings.session_token_mode == "signed":
+            return self.sign_token(user.id, user.role_id)
+        user_session = self.create_session(user.id)
+        return user_session.session_token, user_session.expires_at
+    
+    def sign_token(self, user_id: uuid.UUID, role_id: int) -> Tuple[str, datetime]:
+        """Issue a signed session token; nothing is stored."""
+        claims = SessionTokenClaims(
+            user_id=user_id,
+            role_id=role_id,
+            issued_at=datetime.utcnow(),
+            expires_at=UserSession.get_expiry_time(),
+        )
+        return sign_session_token(claims), claims.expires_at
+    
+    def revoke_user_tokens(self, user_id: uuid.UUID) -> None:
+        """Revoke every signed token issued to a user so far."""
+        token_revocations.revoke(self.session, user_id)
+        auth_user_cache.invalidate_user(user_id)
+    
     def get_session_by_token(self, token: str) -> Optional[UserSession]:
         """Get session by token."""
         statement = select(UserSession).where(
@@ -59,6 +85,7 @@ class SessionService:
         
         self.session.delete(user_session)
         self.session.commit()
+        auth_user_cache.invalidate_token(token)
         return True
     
     def delete_user_sessions(self, user_id: uuid.UUID) -> bool:
@@ -70,30 +97,61 @@ class SessionService:
             self.session.delete(session)
         
         self.session.commit()
+        auth_user_cache.invalidate_user(user_id)
         return True
     
-    def cleanup_expired_sessions(self, user_id: Optional[uuid.UUID] = None):
-        """Clean up expired sessions."""
-        statement = select(UserSession).where(UserSession.expires_at <= datetime.utcnow())
-        
+    def cleanup_expired_sessions(
+        self,
+        user_id: Optional[uuid.UUID] = None,
+        batch_size: int = 1000,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """
+        Delete expired sessions with set-based DELETEs of at most
+        `batch_size` rows, committing after each batch. Stops when none are
+        left or after `max_batches` batches. Returns the number deleted.
+        """
+        now = datetime.utcnow()
+        expired_ids = select(UserSession.id).where(UserSession.expires_at <= now)
         if user_id:
-            statement = statement.where(UserSession.user_id == user_id)
-        
-        expired_sessions = self.session.exec(statement).all()
-        
-        for expired_session in expired_sessions:
-            self.session.delete(expired_session)
-        
-        self.session.commit()
+            expired_ids = expired_ids.where(UserSession.user_id == user_id)
+        expired_ids = expired_ids.limit(batch_size)
+
+        deleted = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            result = self.session.exec(
+                delete(UserSession)
+                .where(UserSession.id.in_(expired_ids))
+                .execution_options(synchronize_session=False)
+            )
+            self.session.commit()
+            deleted += result.rowcount
+            batches += 1
+            if result.rowcount < batch_size:
+                break
+        return deleted
     
-    def refresh_session(self, token: str) -> Optional[UserSession]:
-        """Refresh session expiry time."""
-        user_session = self.get_session_by_token(token)
-        if not user_session:
-            return None
-        
-        user_session.expires_at = UserSession.get_expiry_time()
-        self.session.add(user_session)
+    def refresh_session(self, token: str) -> Optional[datetime]:
+        """
+        Slide a session's expiry forward by a full lifetime, but only once
+        less than the refresh fraction of its lifetime remains, so an active
+        session is written at most once per refresh window.
+
+        Runs as one conditional UPDATE; concurrent refreshes of the same
+        session write once. Returns the new expiry, or None if the session
+        was not due (or is gone or expired).
+        """
+        new_expires_at = UserSession.get_expiry_time()
+        result = self.session.exec(
+            update(UserSession)
+            .where(
+                UserSession.session_token == token,
+                UserSession.expires_at > datetime.utcnow(),
+                UserSession.expires_at < UserSession.get_refresh_time(),
+            )
+            .values(expires_at=new_expires_at)
+            .execution_options(synchronize_session=False)
+        )
         self.session.commit()
-        self.session.refresh(user_session)
-        return user_session
+        return new_expires_at if result.rowcount else None
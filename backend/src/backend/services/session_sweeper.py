@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Session
+
+from ..config import settings
+from ..config.database import engine
+from ..models.session import UserSession
+from .session_service import SessionService
+from .token_revocations import token_revocations
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiredSessionSweeper:
+    """
+    Background reaper for expired user sessions.
+
+    Each run deletes at most `batch_size * max_batches` expired sessions in
+    bounded DELETE batches, so a large backlog is worked off over several
+    runs instead of holding locks for one long statement. Signed token
+    revocations older than a session lifetime are pruned too. Counts are kept
+    for the last run and in total, and every non-empty run is logged.
+    """
+
+    def __init__(self, batch_size: int, max_batches: int):
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.runs = 0
+        self.last_reaped = 0
+        self.total_reaped = 0
+        self.last_run_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def sweep(self, session: Optional[Session] = None) -> int:
+        """
+        Delete expired sessions. Uses the given session if provided,
+        otherwise opens one on the application engine. Returns the number
+        of sessions reaped.
+        """
+        try:
+            if session is not None:
+                reaped = self._sweep(session)
+            else:
+                with Session(engine) as own_session:
+                    reaped = self._sweep(own_session)
+        except Exception as e:
+            logger.error(f"Failed to sweep expired sessions: {e}")
+            return 0
+
+        with self._lock:
+            self.runs += 1
+            self.last_reaped = reaped
+            self.total_reaped += reaped
+            self.last_run_at = datetime.utcnow()
+
+        if reaped:
+            logger.info(
+                f"Reaped {reaped} expired sessions",
+                extra={"metric": "sessions_reaped", "value": reaped},
+            )
+        return reaped
+
+    def _sweep(self, session: Session) -> int:
+        reaped = SessionService(session).cleanup_expired_sessions(
+            batch_size=self.batch_size, max_batches=self.max_batches
+        )
+        # Every token a revocation this old could cover has expired
+        token_revocations.prune(session, datetime.utcnow() - UserSession.get_lifetime())
+        return reaped
+
+    async def run_periodic_sweep(self, interval: float) -> None:
+        """Sweep every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.sweep)
+
+
+# Global expired session sweeper instance
+session_sweeper = ExpiredSessionSweeper(
+    batch_size=settings.session_sweep_batch_size,
+    max_batches=settings.session_sweep_max_batches,
+)
@@ -1,11 +1,155 @@
+import threading
+import time
+from dataclasses import dataclass
 from sqlmodel import Session, select
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from ..models.system import Setting, Extension
+from ..config import settings as app_settings
+from ..config.replicas import reading_from_primary
+from ..models.system import Setting, Extension, Theme
 from ..models.user import User, UserRead
+from ..utils.http_cache import make_etag
 from .permission_service import PermissionService
 
 
+PUBLIC_SETTING_KEYS = [
+    "show_search",
+    "show_markdown",
+    "show_registration",
+]
+
+
+@dataclass(frozen=True)
+class SiteConfigSnapshot:
+    """Immutable view of the site-wide settings, extensions and theme."""
+
+    version: int
+    blog_title: str
+    blog_description: str
+    extensions: Tuple[str, ...]
+    theme: Optional[str]
+    settings: Dict[str, Any]
+    features: Tuple[str, ...]
+    loaded_at: float
+    etag: str
+
+
+class SiteConfigCache:
+    """
+    Process-wide holder of the current SiteConfigSnapshot.
+
+    Settings, extensions and the theme are loaded together and served from
+    memory until invalidated. Every invalidation bumps the version, so
+    callers can tell snapshots apart. Other worker processes pick changes
+    up once SITE_CONFIG_TTL_SECONDS has passed.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.version = 1
+        self._snapshot: Optional[SiteConfigSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get(self, session: Session) -> SiteConfigSnapshot:
+        """Get the current snapshot, loading it if missing or expired."""
+        snapshot = self._snapshot
+        if snapshot and snapshot.version == self.version:
+            if time.time() - snapshot.loaded_at < self.ttl_seconds:
+                return snapshot
+
+        with self._lock:
+            version = self.version
+        with reading_from_primary(session):
+            snapshot = self._load(session, version)
+        with self._lock:
+            if version == self.version:
+                self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot and bump the version."""
+        with self._lock:
+            self.version += 1
+            self._snapshot = None
+
+    @staticmethod
+    def _load(session: Session, version: int) -> SiteConfigSnapshot:
+        """Load all site configuration in one pass."""
+        settings_by_key = {
+            setting.key: setting for setting in session.exec(select(Setting)).all()
+        }
+        extensions = tuple(
+            session.exec(
+                select(Extension.slug).where(Extension.is_active == True)
+            ).all()
+        )
+        theme = session.exec(
+            select(Theme.name).where(Theme.is_active == True)
+        ).first()
+
+        def setting_value(key: str, default: Optional[str] = None) -> Optional[str]:
+            setting = settings_by_key.get(key)
+            return setting.value if setting else default
+
+        def is_enabled(key: str) -> bool:
+            setting = settings_by_key.get(key)
+            if setting and setting.type == "boolean":
+                return setting.value.lower() == "true"
+            return False
+
+        public_settings: Dict[str, Any] = {}
+        for key in PUBLIC_SETTING_KEYS:
+            setting = settings_by_key.get(key)
+            if setting:
+                # Convert boolean strings to actual booleans
+                if setting.type == "boolean":
+                    public_settings[key] = setting.value.lower() == "true"
+                elif setting.type == "integer":
+                    public_settings[key] = (
+                        int(setting.value) if setting.value.isdigit() else None
+                    )
+                else:
+                    public_settings[key] = setting.value
+            else:
+                public_settings[key] = None
+
+        features = []
+        # Check for comment system
+        if is_enabled("allow_comments"):
+            features.append("comments")
+        # Check for user registration
+        if is_enabled("allow_registration"):
+            features.append("registration")
+        features.append("file_uploads")  # Always enabled for now
+        features.append("themes")  # Always enabled
+        # Check extensions for additional features
+        for ext in extensions:
+            features.append(f"ext_{ext.lower()}")
+
+        blog_title = setting_value("blog_title", "My Blog")
+        blog_description = setting_value(
+            "blog_description", "A blog powered by FastAPI"
+        )
+        return SiteConfigSnapshot(
+            version=version,
+            blog_title=blog_title,
+            blog_description=blog_description,
+            extensions=extensions,
+            theme=theme,
+            settings=public_settings,
+            features=tuple(features),
+            loaded_at=time.time(),
+            # Content-derived, so every worker agrees on it for the same config
+            etag=make_etag(
+                blog_title, blog_description, extensions, theme, public_settings, features
+            ),
+        )
+
+
+# Global site config cache instance
+site_config_cache = SiteConfigCache(ttl_seconds=app_settings.site_config_ttl_seconds)
+
+
 class SiteService:
     """Service for site-wide information and configuration."""
 
@@ -13,20 +157,24 @@ class SiteService:
         self.session = session
         self.permission_service = PermissionService(session)
 
-    async def get_site_info(
+    def get_site_info(
         self, current_user: Optional[User] = None
     ) -> Dict[str, Any]:
         """
         Get general site information including user info, blog title, extensions, etc.
+
+        Site-wide fields come from the in-memory config snapshot; only the
+        user-specific fields are resolved per request.
         """
+        snapshot = self.get_config()
         site_info = {
             "user": None,
-            "blog_title": await self._get_blog_title(),
-            "blog_description": await self._get_blog_description(),
-            "extensions": await self._get_active_extensions(),
-            "theme": await self._get_active_theme_name(),
-            "settings": await self._get_public_settings(),
-            "features": await self._get_enabled_features(),
+            "blog_title": snapshot.blog_title,
+            "blog_description": snapshot.blog_description,
+            "extensions": list(snapshot.extensions),
+            "theme": snapshot.theme,
+            "settings": dict(snapshot.settings),
+            "features": list(snapshot.features),
             "permissions": self.permission_service.get_user_permissions(current_user),
         }
 
@@ -46,107 +194,60 @@ class SiteService:
 
         return site_info
 
-    async def _get_blog_title(self) -> str:
+    def get_site_info_etag(self, current_user: Optional[User] = None) -> str:
+        """
+        Get the ETag of the get_site_info payload without building it.
+
+        Combines the config snapshot's content ETag with the user-specific
+        fields, so it costs no queries once the caches are warm.
+        """
+        user_fields = None
+        if current_user:
+            user_fields = UserRead.model_validate(current_user).model_dump(
+                exclude={"role_name"}
+            )
+        permissions = sorted(self.permission_service.get_user_permissions(current_user))
+        return make_etag(self.get_config().etag, user_fields, permissions)
+
+    def get_config(self) -> SiteConfigSnapshot:
+        """Get the current site configuration snapshot."""
+        return site_config_cache.get(self.session)
+
+    def _get_blog_title(self) -> str:
         """Get the blog title from settings."""
-        setting = self.session.exec(
-            select(Setting).where(Setting.key == "blog_title")
-        ).first()
-        return setting.value if setting else "My Blog"
+        return self.get_config().blog_title
 
-    async def _get_blog_description(self) -> str:
+    def _get_blog_description(self) -> str:
         """Get the blog description from settings."""
-        setting = self.session.exec(
-            select(Setting).where(Setting.key == "blog_description")
-        ).first()
-        return setting.value if setting else "A blog powered by FastAPI"
+        return self.get_config().blog_description
 
-    async def _get_active_extensions(self) -> List[str]:
+    def _get_active_extensions(self) -> List[str]:
         """Get list of active extension names."""
-        extensions = self.session.exec(
-            select(Extension).where(Extension.is_active == True)
-        ).all()
-        return [ext.slug for ext in extensions]
+        return list(self.get_config().extensions)
 
-    async def _get_active_theme_name(self) -> Optional[str]:
+    def _get_active_theme_name(self) -> Optional[str]:
         """Get the name of the currently active theme."""
-        from ..models.system import Theme
-
-        theme = self.session.exec(select(Theme).where(Theme.is_active == True)).first()
-        return theme.name if theme else None
+        return self.get_config().theme
 
-    async def _get_public_settings(self) -> Dict[str, Any]:
+    def _get_public_settings(self) -> Dict[str, Any]:
         """Get public-facing settings (non-sensitive configuration)."""
-        public_keys = [
-            "show_search",
-            "show_markdown",
-            "show_registration",
-        ]
-
-        settings = {}
-        for key in public_keys:
-            setting = self.session.exec(
-                select(Setting).where(Setting.key == key)
-            ).first()
-            if setting:
-                # Convert boolean strings to actual booleans
-                if setting.type == "boolean":
-                    settings[key] = setting.value.lower() == "true"
-                elif setting.type == "integer":
-                    settings[key] = (
-                        int(setting.value) if setting.value.isdigit() else None
-                    )
-                else:
-                    settings[key] = setting.value
-            else:
-                settings[key] = None
+        return dict(self.get_config().settings)
 
-        return settings
-
-    async def _get_enabled_features(self) -> List[str]:
+    def _get_enabled_features(self) -> List[str]:
         """Get list of enabled features based on settings and extensions."""
-        features = []
-
-        # Check for comment system
-        if await self._is_feature_enabled("allow_comments"):
-            features.append("comments")
-
-        # Check for user registration
-        if await self._is_feature_enabled("allow_registration"):
-            features.append("registration")
-
-        # Check for file uploads
-        features.append("file_uploads")  # Always enabled for now
-
-        # Check for themes
-        features.append("themes")  # Always enabled
-
-        # Check extensions for additional features
-        active_extensions = await self._get_active_extensions()
-        for ext in active_extensions:
-            features.append(f"ext_{ext.lower()}")
-
-        return features
-
-    async def _is_feature_enabled(self, setting_key: str) -> bool:
-        """Check if a feature is enabled via settings."""
-        setting = self.session.exec(
-            select(Setting).where(Setting.key == setting_key)
-        ).first()
-        if setting and setting.type == "boolean":
-            return setting.value.lower() == "true"
-        return False
+        return list(self.get_config().features)
 
-    async def get_all_extensions(self) -> List[Extension]:
+    def get_all_extensions(self) -> List[Extension]:
         """Get all extensions (active and inactive)."""
         return self.session.exec(select(Extension)).all()
 
-    async def get_active_extensions(self) -> List[Extension]:
+    def get_active_extensions(self) -> List[Extension]:
         """Get only active extensions."""
         return self.session.exec(
             select(Extension).where(Extension.is_active == True)
         ).all()
 
-    async def update_extension_status(self, extension_slug: str, is_active: bool) -> Extension:
+    def update_extension_status(self, extension_slug: str, is_active: bool) -> Extension:
         """
         Update the active status of an extension.
         
@@ -170,10 +271,11 @@ class SiteService:
         self.session.add(extension)
         self.session.commit()
         self.session.refresh(extension)
+        site_config_cache.invalidate()
         
         return extension
 
-    async def update_settings(
+    def update_settings(
         self,
         blog_title: Optional[str] = None,
         show_search: Optional[bool] = None,
@@ -186,33 +288,34 @@ class SiteService:
         updated_settings = {}
 
         if blog_title is not None:
-            setting = await self._get_or_create_setting("blog_title", "string")
+            setting = self._get_or_create_setting("blog_title", "string")
             setting.value = blog_title
             self.session.add(setting)
             updated_settings["blog_title"] = blog_title
 
         if show_search is not None:
-            setting = await self._get_or_create_setting("show_search", "boolean")
+            setting = self._get_or_create_setting("show_search", "boolean")
             setting.value = str(show_search).lower()
             self.session.add(setting)
             updated_settings["show_search"] = show_search
 
         if show_markdown is not None:
-            setting = await self._get_or_create_setting("show_markdown", "boolean")
+            setting = self._get_or_create_setting("show_markdown", "boolean")
             setting.value = str(show_markdown).lower()
             self.session.add(setting)
             updated_settings["show_markdown"] = show_markdown
 
         if show_registration is not None:
-            setting = await self._get_or_create_setting("show_registration", "boolean")
+            setting = self._get_or_create_setting("show_registration", "boolean")
             setting.value = str(show_registration).lower()
             self.session.add(setting)
             updated_settings["show_registration"] = show_registration
 
         self.session.commit()
+        site_config_cache.invalidate()
         return updated_settings
 
-    async def _get_or_create_setting(self, key: str, setting_type: str) -> Setting:
+    def _get_or_create_setting(self, key: str, setting_type: str) -> Setting:
         """Get an existing setting or create a new one."""
         setting = self.session.exec(select(Setting).where(Setting.key == key)).first()
 
@@ -1,7 +1,8 @@
 from sqlmodel import Session, select
 from typing import Optional, List
 
-from backend.models.taxonomy import Tag, TagCreate
+from backend.models.taxonomy import Tag, TagCreate, PostTag
+from backend.services.blog_service import bump_taxonomy_version
 from backend.utils import ConflictError, NotFoundError
 
 
@@ -72,6 +73,9 @@ class TagService:
         # is being used by any posts before allowing deletion, or implement
         # soft deletion instead
         
+        bump_taxonomy_version(
+            self.session, select(PostTag.post_id).where(PostTag.tag_id == tag_id)
+        )
         self.session.delete(tag)
         self.session.commit()
         return True
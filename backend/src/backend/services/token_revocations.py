@@ -0,0 +1,93 @@
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlmodel import Session, delete, select
+
+from ..config import settings
+from ..config.replicas import reading_from_primary
+from ..models.session import TokenRevocation
+
+
+class TokenRevocationList:
+    """
+    Process-wide copy of the token_revocations table.
+
+    Holds one "not before" time per user; signed tokens issued at or
+    before it are rejected. The table stays small (one row per user, pruned
+    once every token it could cover has expired), so it is loaded whole
+    and served from memory. Revocations made in this process apply at once;
+    other worker processes pick them up within TOKEN_REVOCATION_TTL_SECONDS.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._not_before: Dict[uuid.UUID, datetime] = {}
+        self._loaded_at: Optional[float] = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get_not_before(self, session: Session, user_id: uuid.UUID) -> Optional[datetime]:
+        """Get a user's revocation time, reloading the list if it is stale."""
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.time() - loaded_at >= self.ttl_seconds:
+            self._load(session)
+        return self._not_before.get(user_id)
+
+    def revoke(self, session: Session, user_id: uuid.UUID) -> datetime:
+        """Revoke every signed token issued to a user up to now."""
+        not_before = datetime.utcnow()
+        revocation = session.get(TokenRevocation, user_id)
+        if revocation:
+            revocation.not_before = not_before
+        else:
+            revocation = TokenRevocation(user_id=user_id, not_before=not_before)
+        session.add(revocation)
+        session.commit()
+
+        with self._lock:
+            self._version += 1
+            self._not_before[user_id] = not_before
+        return not_before
+
+    def prune(self, session: Session, before: datetime) -> int:
+        """Drop revocations older than `before`. Returns the number removed."""
+        result = session.exec(
+            delete(TokenRevocation)
+            .where(TokenRevocation.not_before < before)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        self.invalidate()
+        return result.rowcount
+
+    def invalidate(self) -> None:
+        """Forget the loaded list; the next lookup reloads it."""
+        with self._lock:
+            self._version += 1
+            self._loaded_at = None
+
+    def clear(self) -> None:
+        """Forget all revocations held in memory."""
+        with self._lock:
+            self._version += 1
+            self._not_before = {}
+            self._loaded_at = None
+
+    def _load(self, session: Session) -> None:
+        with self._lock:
+            version = self._version
+        loaded_at = time.time()
+        with reading_from_primary(session):
+            rows = session.exec(select(TokenRevocation.user_id, TokenRevocation.not_before)).all()
+        with self._lock:
+            # A revocation made while loading wins; reload on the next lookup
+            if version == self._version:
+                self._not_before = dict(rows)
+                self._loaded_at = loaded_at
+
+
+# Global token revocation list instance
+token_revocations = TokenRevocationList(ttl_seconds=settings.token_revocation_ttl_seconds)
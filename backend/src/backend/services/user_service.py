@@ -2,9 +2,16 @@ from sqlmodel import Session, select
 from typing import Optional, List
 import uuid
 
-from backend.models import User, UserCreate, UserUpdate, UserRead, Role
-from backend.utils import hash_password, verify_password, ConflictError, NotFoundError
+from backend.models import User, UserCreate, UserUpdate, UserRead, Role, Post
+from backend.utils import (
+    hash_password_async,
+    verify_and_update_password,
+    ConflictError,
+    NotFoundError,
+)
 from backend.services.permission_service import PermissionService
+from backend.services.auth_cache import auth_user_cache
+from backend.services.post_cache import rendered_post_cache
 
 
 class UserService:
@@ -22,8 +29,14 @@ class UserService:
                 user_read.role_name = role.name
         return user_read
 
-    def create_user(self, user_data: UserCreate) -> UserRead:
+    async def create_user(self, user_data: UserCreate) -> UserRead:
         """Create a new user."""
+        role_id = self.resolve_new_user_role(user_data)
+        password_hash = await hash_password_async(user_data.password)
+        return self.insert_user(user_data, role_id, password_hash)
+
+    def resolve_new_user_role(self, user_data: UserCreate) -> int:
+        """Check a new user's username and email are free and return their role ID."""
         # Check if username already exists
         statement = select(User).where(User.username == user_data.username)
         existing_user = self.session.exec(statement).first()
@@ -37,29 +50,27 @@ class UserService:
             raise ConflictError("Email already exists")
 
         # Get role_id from role_name - default to 'public' role if not specified
-        role_id = None
         if user_data.role_name:
             # Use PermissionService to look up role by name
             permission_service = PermissionService(self.session)
             role = permission_service.get_role_by_name(user_data.role_name)
             if not role:
                 raise NotFoundError(f"Role '{user_data.role_name}' not found")
-            role_id = role.id
-        else:
-            # Find 'public' role ID as default
-            public_role = self.session.exec(select(Role).where(Role.name == "public")).first()
-            if public_role:
-                role_id = public_role.id
-            else:
-                # Fallback to role ID 1 if 'public' role doesn't exist
-                role_id = 1
-
-        # Create user
-        hashed_password = hash_password(user_data.password)
+            return role.id
+
+        # Find 'public' role ID as default
+        public_role = self.session.exec(select(Role).where(Role.name == "public")).first()
+        if public_role:
+            return public_role.id
+        # Fallback to role ID 1 if 'public' role doesn't exist
+        return 1
+
+    def insert_user(self, user_data: UserCreate, role_id: int, password_hash: str) -> UserRead:
+        """Insert a user whose password has already been hashed."""
         user = User(
             username=user_data.username,
             email=user_data.email,
-            password_hash=hashed_password,
+            password_hash=password_hash,
             display_name=user_data.display_name,
             bio=user_data.bio,
             role_id=role_id,
@@ -89,19 +100,44 @@ class UserService:
         statement = select(User).where(User.email == email)
         return self.session.exec(statement).first()
 
-    def authenticate_user(self, username: str, password: str) -> Optional[User]:
-        """Authenticate user with username/password."""
+    async def authenticate_user(self, username: str, password: str) -> Optional[User]:
+        """
+        Authenticate user with username/password.
+
+        Hashes with an outdated cost factor are replaced on successful login.
+        """
         user = self.get_user_by_username(username)
         if not user:
             return None
 
-        if not verify_password(password, user.password_hash):
+        valid, new_hash = await verify_and_update_password(password, user.password_hash)
+        if not valid:
             return None
 
+        if new_hash:
+            user = self.store_password_hash(user, new_hash)
+
         return user
 
-    def update_user(self, user_id: uuid.UUID, user_data: UserUpdate) -> UserRead:
+    def store_password_hash(self, user: User, password_hash: str) -> User:
+        """Replace a user's password hash, e.g. one with an outdated cost factor."""
+        user.password_hash = password_hash
+        self.session.add(user)
+        self.session.commit()
+        self.session.refresh(user)
+        return user
+
+    async def update_user(self, user_id: uuid.UUID, user_data: UserUpdate) -> UserRead:
         """Update user."""
+        password_hash = None
+        if user_data.password:
+            password_hash = await hash_password_async(user_data.password)
+        return self.apply_user_update(user_id, user_data, password_hash)
+
+    def apply_user_update(
+        self, user_id: uuid.UUID, user_data: UserUpdate, password_hash: Optional[str] = None
+    ) -> UserRead:
+        """Update user, with any new password already hashed."""
         user = self.session.exec(select(User).where(User.id == user_id)).first()
         if not user:
             raise NotFoundError("User not found")
@@ -130,10 +166,14 @@ class UserService:
         if 'password_hash' in update_data:
             del update_data['password_hash']
 
-        # Handle password hashing if password is provided
-        if 'password' in update_data and update_data['password']:
-            update_data['password_hash'] = hash_password(update_data['password'])
-            del update_data['password']
+        # The password arrives already hashed
+        update_data.pop('password', None)
+        if password_hash:
+            update_data['password_hash'] = password_hash
+
+        # Author names are part of rendered posts
+        if 'display_name' in update_data or 'username' in update_data:
+            rendered_post_cache.mark_stale(self.session, Post.author_id == user_id)
 
         # Apply updates to user
         for field, value in update_data.items():
@@ -142,6 +182,7 @@ class UserService:
         self.session.add(user)
         self.session.commit()
         self.session.refresh(user)
+        auth_user_cache.invalidate_user(user_id)
         
         return self._populate_user_role_name(user)
 
@@ -154,6 +195,7 @@ class UserService:
 
         self.session.delete(user)
         self.session.commit()
+        auth_user_cache.invalidate_user(user_id)
         return True
 
     def list_users(self, skip: int = 0, limit: int = 100) -> List[UserRead]:
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import threading
+import uuid
+from collections import Counter
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam
+from sqlmodel import Session, update
+
+from ..config import settings
+from ..config.database import engine
+from ..models.post import Post
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    In-process write-behind accumulator for post view counts.
+
+    Views are counted in memory and periodically written back with one
+    UPDATE ... SET view_count = view_count + :n per post, instead of a
+    read-modify-write commit on every page hit.
+
+    Flushes run in a worker thread from run_periodic_flush, so requests
+    never wait on the database write; a full buffer wakes the flusher
+    early rather than flushing in the request that filled it.
+    """
+
+    def __init__(self, max_buffered: int):
+        self.max_buffered = max_buffered
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+        # Set while run_periodic_flush is running
+        self._flusher_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def record(self, post_id: uuid.UUID, count: int = 1) -> None:
+        """
+        Buffer a view. Once the buffer is full the periodic flusher is woken
+        up; without a running flusher (scripts, tests) it is flushed here.
+        """
+        with self._lock:
+            self._pending[post_id] += count
+            full = sum(self._pending.values()) >= self.max_buffered
+
+        if not full:
+            return
+        loop, wake = self._flusher_loop, self._wake
+        if loop is None or wake is None:
+            self.flush()
+        elif not loop.is_closed():
+            # record() may be called from threadpool workers as well as the loop
+            loop.call_soon_threadsafe(wake.set)
+
+    def pending(self, post_id: uuid.UUID) -> int:
+        """Get the number of buffered, not yet flushed views for a post."""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def flush(self, session: Optional[Session] = None) -> int:
+        """
+        Write buffered views to the database.
+
+        Uses the given session if provided, otherwise opens one on the
+        application engine. Returns the number of posts updated.
+        """
+        with self._lock:
+            deltas: Dict[uuid.UUID, int] = dict(self._pending)
+            self._pending.clear()
+
+        if not deltas:
+            return 0
+
+        statement = (
+            update(Post)
+            .where(Post.id == bindparam("post_id", type_=Post.__table__.c.id.type))
+            .values(view_count=Post.view_count + bindparam("delta"))
+        )
+        params = [
+            {"post_id": post_id, "delta": delta} for post_id, delta in deltas.items()
+        ]
+
+        try:
+            if session is not None:
+                session.connection().execute(statement, params)
+                session.commit()
+            else:
+                with Session(engine) as own_session:
+                    own_session.connection().execute(statement, params)
+                    own_session.commit()
+        except Exception as e:
+            # Put the views back so the next flush retries them
+            logger.error(f"Failed to flush view counts: {e}")
+            with self._lock:
+                self._pending.update(deltas)
+            return 0
+
+        return len(deltas)
+
+    async def run_periodic_flush(self, interval: float) -> None:
+        """
+        Flush the buffer every `interval` seconds, or sooner when it fills
+        up, until cancelled. Each flush runs in a worker thread.
+        """
+        self._wake = asyncio.Event()
+        self._flusher_loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                await asyncio.to_thread(self.flush)
+        finally:
+            self._flusher_loop = None
+            self._wake = None
+
+
+# Global view counter instance
+view_counter = ViewCountBuffer(max_buffered=settings.view_count_max_buffered)
@@ -1,18 +1,29 @@
-from .auth import hash_password, verify_password
+from .auth import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_and_update_password,
+)
 from .exceptions import (
     AuthenticationError,
     AuthorizationError,
     ValidationError,
     NotFoundError,
     ConflictError,
+    PayloadTooLargeError,
+    ServiceUnavailableError,
 )
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_and_update_password",
     "AuthenticationError",
     "AuthorizationError", 
     "ValidationError",
     "NotFoundError",
     "ConflictError",
+    "PayloadTooLargeError",
+    "ServiceUnavailableError",
 ]
@@ -1,8 +1,73 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
+from ..config.settings import settings
+from .exceptions import ServiceUnavailableError
+
+T = TypeVar("T")
+
+
+# Password hashing context. Hashes made with a different cost factor are
+# reported as needing an update, so logins can upgrade them.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
+
+
+class PasswordHasherPool:
+    """
+    Bounded worker pool for bcrypt calls.
+
+    Hashing takes hundreds of milliseconds of CPU, so it runs on worker
+    threads (bcrypt releases the GIL) instead of the event loop. At most
+    `max_workers` calls run at once and `queue_limit` more may wait; any
+    call beyond that is rejected with 503 instead of piling up.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Run fn(*args) on the pool, or raise ServiceUnavailableError if full."""
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.queue_limit:
+                raise ServiceUnavailableError("Too many password operations in progress")
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hasher"
+                )
+            executor = self._executor
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads; the pool restarts on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global password hasher pool instance
+password_hasher = PasswordHasherPool(
+    max_workers=settings.password_hash_workers,
+    queue_limit=settings.password_hash_queue_limit,
+)
 
 
 def hash_password(password: str) -> str:
@@ -13,3 +78,22 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password hasher pool."""
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password on the password hasher pool.
+
+    Returns (valid, new_hash); new_hash is set when the password is valid
+    but its hash uses an outdated cost factor and should be replaced.
+    """
+    return await password_hasher.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
@@ -49,3 +49,24 @@ class ConflictError(HTTPException):
             status_code=status.HTTP_409_CONFLICT,
             detail=detail
         )
+
+
+class ServiceUnavailableError(HTTPException):
+    """Server temporarily overloaded errors."""
+    
+    def __init__(self, detail: str = "Service temporarily unavailable", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+class PayloadTooLargeError(HTTPException):
+    """Request body too large errors."""
+    
+    def __init__(self, detail: str = "Payload too large"):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=detail
+        )
@@ -0,0 +1,89 @@
+import datetime
+import hashlib
+import json
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+
+# Responses depend on the session cookie and must be revalidated on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """Build an ETag from the values that determine a response body."""
+    digest = hashlib.sha256(
+        json.dumps(parts, default=str, separators=(",", ":")).encode()
+    ).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime.datetime) -> bool:
+    """Check an If-Modified-Since header against a naive UTC timestamp."""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is not None:
+        since = since.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[datetime.datetime] = None
+) -> Dict[str, str]:
+    """Build the ETag, Last-Modified and Cache-Control headers for a response."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.replace(tzinfo=datetime.timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime.datetime] = None,
+) -> Optional[Response]:
+    """
+    Apply validators to a response and evaluate the request's conditions.
+
+    Sets ETag, Last-Modified and Cache-Control on `response`. Returns a 304
+    response when the client's copy is still current, otherwise None.
+    The 304 carries every header set on `response`, including cookies from
+    a session refresh. If-None-Match takes precedence over If-Modified-Since.
+    """
+    headers = validator_headers(etag, last_modified)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = bool(
+            if_modified_since
+            and last_modified is not None
+            and _not_modified_since(if_modified_since, last_modified)
+        )
+
+    if not fresh:
+        return None
+    not_modified = Response(status_code=304)
+    not_modified.headers.raw.extend(response.headers.raw)
+    return not_modified
@@ -0,0 +1,143 @@
+import hashlib
+import re
+import unicodedata
+from typing import Optional
+
+from markdown_it import MarkdownIt
+from mdit_py_plugins.footnote import footnote_plugin
+from mdit_py_plugins.tasklists import tasklists_plugin
+
+# Bump when the renderer or excerpt rules change, so stored renderings
+# are redone by the backfill even though the content itself is unchanged.
+RENDERER_VERSION = "3"
+
+# Length of the plain-text listing excerpt, in characters
+EXCERPT_LENGTH = 100
+
+# CommonMark plus the GFM extensions remark-gfm gives the frontend: tables,
+# strikethrough, autolinked URLs, task lists and footnotes. Raw HTML in the
+# source is escaped and unsafe link schemes (javascript:, vbscript:, file:,
+# most data:) are not turned into links.
+_markdown = (
+    MarkdownIt("commonmark", {"html": False, "linkify": True})
+    .enable(["table", "strikethrough", "linkify"])
+    .use(tasklists_plugin)
+    .use(footnote_plugin)
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Opening line of a fenced code block, and a run of backticks that may
+# open or close an inline code span
+_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+_BACKTICKS = re.compile(r"`+")
+# Text ending at the start of a line, real or escaped
+_LINE_START = re.compile(r"(\n|\\n) {0,3}$")
+
+
+def content_hash(source: Optional[str]) -> str:
+    """Hash the markdown source together with the renderer version."""
+    return hashlib.sha256(f"{RENDERER_VERSION}\0{source or ''}".encode()).hexdigest()
+
+
+def _unescape_newlines(text: str) -> str:
+    """Turn escaped "\\n" sequences into newlines outside inline code spans."""
+    parts = []
+    position = 0
+    while opening := _BACKTICKS.search(text, position):
+        start = opening.start()
+        closing = None
+        # A backslash-escaped backtick doesn't open a code span, and nor does
+        # a fence written with escaped newlines, which unescaping turns into one
+        escaped = text[start - 1 : start] == "\\"
+        fence = len(opening.group()) >= 3 and (
+            _LINE_START.search(text[max(0, start - 5) : start])
+            or (start <= 3 and not text[:start].strip(" "))
+        )
+        if not escaped and not fence:
+            closing = re.compile(f"(?<!`){opening.group()}(?!`)").search(text, opening.end())
+        # A run without a closing run of the same length is literal text
+        end = closing.end() if closing else opening.end()
+        parts.append(text[position:start].replace("\\n", "\n"))
+        parts.append(text[start:end])
+        position = end
+    parts.append(text[position:].replace("\\n", "\n"))
+    return "".join(parts)
+
+
+def _prepare(source: str) -> str:
+    """
+    Turn escaped "\\n" sequences into newlines, as PostView does before its
+    client-side rendering, so both renderings of a post agree. Code spans
+    and fenced code blocks are left alone, since a "\\n" there is code.
+    """
+    parts = []
+    prose = []
+    fence = None
+    for line in source.splitlines(keepends=True):
+        if fence:
+            parts.append(line)
+            if re.match(f" {{0,3}}{fence[0]}{{{len(fence)},}}\\s*$", line):
+                fence = None
+            continue
+        opening = _FENCE.match(line)
+        # The info string of a backtick fence can't contain backticks
+        if opening and not (opening.group(1)[0] == "`" and "`" in line[opening.end():]):
+            parts.append(_unescape_newlines("".join(prose)))
+            prose = []
+            parts.append(line)
+            fence = opening.group(1)
+        else:
+            prose.append(line)
+    parts.append(_unescape_newlines("".join(prose)))
+    return "".join(parts)
+
+
+def render_markdown(source: Optional[str]) -> str:
+    """Render markdown to sanitized HTML."""
+    return _markdown.render(_prepare(source)) if source else ""
+
+
+def _plain_text(source: str) -> str:
+    """Collect the visible text of a markdown document."""
+    parts = []
+    for token in _markdown.parse(_prepare(source)):
+        if token.type == "inline":
+            parts.extend(
+                child.content
+                for child in token.children or []
+                if child.type in ("text", "code_inline")
+            )
+        elif token.type in ("code_block", "fence"):
+            parts.append(token.content)
+        parts.append(" ")
+    return _WHITESPACE.sub(" ", "".join(parts)).strip()
+
+
+def _is_continuation(char: str) -> bool:
+    """Check whether a character attaches to the one before it."""
+    return (
+        unicodedata.combining(char) > 0
+        or unicodedata.category(char) in ("Mn", "Me", "Cf")
+        or "\ufe00" <= char <= "\ufe0f"
+    )
+
+
+def make_excerpt(source: Optional[str], length: int = EXCERPT_LENGTH) -> str:
+    """
+    Build a plain-text excerpt of a markdown document.
+
+    Markdown syntax is dropped rather than cut in half. Long text is cut at
+    the last word boundary within `length` characters, or failing that
+    between characters that do not combine, and ends with an ellipsis.
+    """
+    text = _plain_text(source) if source else ""
+    if len(text) <= length:
+        return text
+
+    cut = text.rfind(" ", 0, length + 1)
+    if cut <= 0:
+        cut = length
+        while cut > 0 and (_is_continuation(text[cut]) or text[cut - 1] == "\u200d"):
+            cut -= 1
+    return text[:cut].rstrip() + "\u2026"
@@ -0,0 +1,37 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(content_type: Any) -> TypeAdapter:
+    return TypeAdapter(content_type)
+
+
+def prevalidated_response(
+    content: Any,
+    content_type: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+    include: Any = None,
+) -> Response:
+    """
+    Serialize models the service layer already built straight to JSON.
+
+    Skips FastAPI's response_model round trip (re-validating every object,
+    jsonable_encoder, then json.dumps) by letting pydantic-core write the
+    bytes in one pass. Only use it for content that is already of
+    `content_type`; keep response_model on the route for the schema.
+    Headers set on the injected `response` are carried over. `include`
+    restricts the output fields, as in pydantic's dump_json.
+    """
+    fast_response = Response(
+        content=_adapter(content_type).dump_json(content, include=include),
+        status_code=status_code,
+        media_type="application/json",
+    )
+    if response is not None:
+        fast_response.headers.raw.extend(response.headers.raw)
+    return fast_response
@@ -3,23 +3,41 @@ Comprehensive test suite for core blog functionality.
 Tests all endpoints with sample data insertion.
 """
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine, select
 from sqlmodel.pool import StaticPool
-from datetime import datetime, timezone
+from sqlalchemy import event, text
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 
 import sys
 import os
+import uuid
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 from backend.main import app
-from backend.config.database import get_session
+from backend.middleware.query_counter import server_timing, track_queries
+from backend.config.database import configure_sqlite, engine_options, get_session, optimize_database
+from backend.config.pool_metrics import PoolMetricsRegistry
+from backend.config.replicas import ReplicaSet, RoutingSession, SessionRouter, route_request
+from backend.config.data_generator import EPOCH, BulkDataGenerator
+from backend.config.settings import settings
 from backend.models import (
     User, Role, Permission, Post, PostData, Category, Tag, 
-    Comment, Like, Setting, Theme, Extension
+    Comment, Like, Setting, Theme, Extension, PostCategory, PostTag, UserSession,
+    RolePermission
 )
 from backend.utils.auth import hash_password
+from backend.services.blog_service import BlogService
+from backend.services.view_counter import view_counter
+from backend.services.search_service import get_search_index
+from backend.services.permission_service import PermissionService, role_permission_cache
+from backend.services.auth_cache import auth_user_cache
+from backend.services.session_sweeper import ExpiredSessionSweeper
+from backend.services.token_revocations import token_revocations
+from backend.services.site_service import site_config_cache
+from backend.services.post_cache import rendered_post_cache, SharedPostCacheBackend
 
 
 @pytest.fixture(name="session")
@@ -31,6 +49,12 @@ def session_fixture():
         poolclass=StaticPool,
     )
     SQLModel.metadata.create_all(engine)
+    # Process-wide caches must not leak state between test databases
+    site_config_cache.invalidate()
+    role_permission_cache.invalidate()
+    auth_user_cache.clear()
+    rendered_post_cache.clear()
+    token_revocations.clear()
     with Session(engine) as session:
         yield session
 
@@ -47,6 +71,30 @@ def client_fixture(session: Session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(name="query_budget")
+def query_budget_fixture():
+    """
+    Assert a query budget for the requests made inside a block:
+
+        with query_budget(5):
+            client.get("/posts")
+
+    Fails if more than `max_queries` statements run, or if any statement
+    shape repeats more than `max_repeats` times (a per-row query loop).
+    """
+    @contextmanager
+    def query_budget(max_queries: int, max_repeats: int = 2):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries ran, budget is {max_queries}: {list(stats.shapes)}"
+        )
+        repeated = stats.repeated(max_repeats)
+        assert not repeated, f"Statements repeated more than {max_repeats} times: {repeated}"
+
+    return query_budget
+
+
 @pytest.fixture(name="sample_data")
 def sample_data_fixture(session: Session):
     """Insert comprehensive sample data for testing."""
@@ -397,6 +445,13 @@ def sample_data_fixture(session: Session):
         Setting(key="social_github", value="techblogpro", type="string"),
     ]
     session.add_all(settings)
+    session.commit()
+    
+    # Posts, likes and comments above bypass the services, so rebuild the
+    # counters and the search index
+    BlogService(session).reconcile_post_counters()
+    get_search_index(session).rebuild()
+    session.commit()
     
     # Create themes
     default_theme = Theme(
@@ -570,6 +625,79 @@ class TestAuthentication:
         assert data["username"] == "Admin"
         assert data["email"] == "admin@example.com"
     
+    def test_login_rehashes_outdated_password(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test login upgrades hashes made with an outdated cost factor."""
+        from backend.utils.auth import pwd_context
+        
+        user = sample_data["regular_user"]
+        user.password_hash = pwd_context.hash("password123", rounds=4)
+        session.add(user)
+        session.commit()
+        assert pwd_context.needs_update(user.password_hash)
+        
+        response = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "password123"}
+        )
+        assert response.status_code == 200
+        
+        session.refresh(user)
+        assert not pwd_context.needs_update(user.password_hash)
+        assert pwd_context.verify("password123", user.password_hash)
+    
+    def test_password_pool_rejects_when_saturated(self):
+        """Test the password hasher pool returns 503 once its queue is full."""
+        import asyncio
+        import threading
+        from backend.utils.auth import PasswordHasherPool
+        from backend.utils import ServiceUnavailableError
+        
+        pool = PasswordHasherPool(max_workers=1, queue_limit=1)
+        release = threading.Event()
+        
+        async def run():
+            busy = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(ServiceUnavailableError) as error:
+                await pool.run(release.wait)
+            assert error.value.status_code == 503
+            release.set()
+            await asyncio.gather(*busy)
+            return await pool.run(lambda: "done")
+        
+        try:
+            assert asyncio.run(run()) == "done"
+        finally:
+            release.set()
+            pool.shutdown()
+    
+    def test_cached_user_skips_database(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that a resolved session token is served from the auth cache."""
+        token = client.post(
+            "/auth/login",
+            json={"username": "Admin", "password": "admin"}
+        ).json()["session_token"]
+        assert client.get("/auth/me", cookies={"session_token": token}).status_code == 200
+        
+        statements = []
+        engine = session.get_bind()
+        
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            response = client.get("/auth/me", cookies={"session_token": token})
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        assert response.status_code == 200
+        assert statements == []
+        
+        # Logging out drops the cached entry
+        client.post("/auth/logout", cookies={"session_token": token})
+        response = client.get("/auth/me", cookies={"session_token": token})
+        assert response.status_code == 401
+    
     def test_invalid_login(self, client: TestClient, sample_data: Dict[str, Any]):
         """Test invalid login."""
         response = client.post(
@@ -581,6 +709,118 @@ class TestAuthentication:
         )
         assert response.status_code == 401
 
+    def test_sliding_session_expiry(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that a session is extended only once it nears expiry."""
+        response = client.post("/auth/login", json={"username": "testuser", "password": "password123"})
+        assert response.status_code == 200
+        token = response.json()["session_token"]
+        lifetime = settings.session_expire_hours * 3600
+        max_age = int(response.headers["set-cookie"].split("Max-Age=")[1].split(";")[0])
+        assert lifetime - 5 <= max_age <= lifetime
+
+        user_session = session.exec(select(UserSession).where(UserSession.session_token == token)).one()
+        initial_expiry = user_session.expires_at
+
+        # Early in its lifetime the session is left alone
+        response = client.get("/auth/me", cookies={"session_token": token})
+        assert response.status_code == 200
+        assert "set-cookie" not in response.headers
+        session.refresh(user_session)
+        assert user_session.expires_at == initial_expiry
+
+        # Near the end it slides forward by a full lifetime, once
+        user_session.expires_at = datetime.utcnow() + timedelta(minutes=5)
+        session.add(user_session)
+        session.commit()
+        auth_user_cache.clear()
+
+        response = client.get("/auth/me", cookies={"session_token": token})
+        assert response.status_code == 200
+        assert "session_token=" in response.headers["set-cookie"]
+        session.refresh(user_session)
+        refreshed_expiry = user_session.expires_at
+        assert refreshed_expiry > datetime.utcnow() + timedelta(seconds=lifetime - 60)
+
+        response = client.get("/auth/me", cookies={"session_token": token})
+        assert "set-cookie" not in response.headers
+        session.refresh(user_session)
+        assert user_session.expires_at == refreshed_expiry
+
+    def test_session_slides_on_not_modified(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """A 304 still carries the refreshed session cookie."""
+        token = client.post(
+            "/auth/login", json={"username": "testuser", "password": "password123"}
+        ).json()["session_token"]
+        client.cookies.clear()
+        etag = client.get("/site/info", cookies={"session_token": token}).headers["etag"]
+
+        user_session = session.exec(select(UserSession).where(UserSession.session_token == token)).one()
+        user_session.expires_at = datetime.utcnow() + timedelta(minutes=5)
+        session.add(user_session)
+        session.commit()
+        auth_user_cache.clear()
+
+        response = client.get(
+            "/site/info", headers={"If-None-Match": etag}, cookies={"session_token": token}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert "session_token=" in response.headers["set-cookie"]
+        session.refresh(user_session)
+        assert user_session.expires_at > datetime.utcnow() + timedelta(hours=1)
+
+    def test_signed_session_tokens(self, client: TestClient, session: Session, sample_data: Dict[str, Any], monkeypatch):
+        """Test signed tokens: no stored session, tamper detection and per-user revocation."""
+        monkeypatch.setattr(settings, "session_token_mode", "signed")
+
+        response = client.post("/auth/login", json={"username": "testuser", "password": "password123"})
+        assert response.status_code == 200
+        token = response.json()["session_token"]
+        assert "." in token
+        assert session.exec(select(UserSession)).all() == []
+
+        response = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        assert response.json()["username"] == "testuser"
+
+        payload, signature = token.split(".")
+        forged = payload + "." + ("A" if signature[0] != "A" else "B") + signature[1:]
+        response = client.get("/auth/me", headers={"Authorization": f"Bearer {forged}"})
+        assert response.status_code == 401
+
+        response = client.post("/auth/logout", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        response = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+
+        # The revocation survives a reload of the list
+        token_revocations.clear()
+        response = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+
+        response = client.post("/auth/login", json={"username": "testuser", "password": "password123"})
+        new_token = response.json()["session_token"]
+        response = client.get("/auth/me", headers={"Authorization": f"Bearer {new_token}"})
+        assert response.status_code == 200
+
+    def test_expired_session_sweeper(self, session: Session, sample_data: Dict[str, Any]):
+        """Test that expired sessions are reaped in bounded batches."""
+        user_id = sample_data["regular_user"].id
+        expired = datetime.utcnow() - timedelta(hours=1)
+        for i in range(5):
+            session.add(UserSession(user_id=user_id, session_token=f"expired-{i}", expires_at=expired))
+        session.add(UserSession(user_id=user_id, session_token="live", expires_at=UserSession.get_expiry_time()))
+        session.commit()
+
+        sweeper = ExpiredSessionSweeper(batch_size=2, max_batches=2)
+        assert sweeper.sweep(session) == 4
+        assert sweeper.sweep(session) == 1
+        assert sweeper.sweep(session) == 0
+        assert (sweeper.runs, sweeper.last_reaped, sweeper.total_reaped) == (3, 0, 5)
+
+        tokens = session.exec(select(UserSession.session_token)).all()
+        assert tokens == ["live"]
+
 
 class TestBlogPosts:
     """Test blog post endpoints."""
@@ -609,6 +849,200 @@ class TestBlogPosts:
         assert "status" in post
         assert post["status"] == "published"
     
+    def test_list_posts_includes_relations(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that listed posts carry their categories, tags and likes count."""
+        post1 = sample_data["post1"]
+        session.add(PostCategory(post_id=post1.id, category_id=sample_data["tech_category"].id))
+        session.add(PostTag(post_id=post1.id, tag_id=sample_data["python_tag"].id))
+        session.add(PostTag(post_id=post1.id, tag_id=sample_data["tutorial_tag"].id))
+        session.commit()
+        
+        response = client.get("/posts")
+        assert response.status_code == 200
+        posts = {post["slug"]: post for post in response.json()}
+        
+        listed = posts["getting-started-fastapi"]
+        assert [c["slug"] for c in listed["categories"]] == ["technology"]
+        assert sorted(t["slug"] for t in listed["tags"]) == ["python", "tutorial"]
+        assert listed["likes_count"] == 1
+        assert posts["building-modern-web-apps"]["tags"] == []
+    
+    def test_list_posts_cursor_pagination(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test paging through posts with X-Next-Cursor."""
+        all_slugs = [post["slug"] for post in client.get("/posts").json()]
+        
+        paged_slugs = []
+        response = client.get("/posts", params={"limit": 2})
+        while True:
+            assert response.status_code == 200
+            paged_slugs.extend(post["slug"] for post in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            response = client.get("/posts", params={"limit": 2, "cursor": next_cursor})
+        
+        assert paged_slugs == all_slugs
+    
+    def test_list_posts_summary_view(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test the summary view and sparse fieldsets on the post listing."""
+        full = {post["slug"]: post for post in client.get("/posts").json()}
+
+        response = client.get("/posts", params={"view": "summary"})
+        assert response.status_code == 200
+        summaries = {post["slug"]: post for post in response.json()}
+        assert summaries.keys() == full.keys()
+        listed = summaries["getting-started-fastapi"]
+        assert "content" not in listed and "categories" not in listed
+        assert listed["excerpt"] == full["getting-started-fastapi"]["excerpt"]
+        assert listed["author_name"] == full["getting-started-fastapi"]["author_name"]
+
+        response = client.get("/posts", params={"fields": "slug,excerpt"})
+        assert response.status_code == 200
+        assert all(set(post) == {"slug", "excerpt"} for post in response.json())
+
+        response = client.get("/posts", params={"fields": "slug,tags"})
+        assert response.status_code == 200
+        assert all(set(post) == {"slug", "tags"} for post in response.json())
+
+        response = client.get("/posts", params={"view": "summary", "fields": "content"})
+        assert response.status_code == 422
+
+    def test_list_posts_invalid_cursor(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/posts", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 422
+    
+    def test_search_posts(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test full-text search ranks matches and highlights snippets."""
+        response = client.get("/posts", params={"search": "FastAPI"})
+        assert response.status_code == 200
+        data = response.json()
+        assert "getting-started-fastapi" in [post["slug"] for post in data]
+        assert "future-of-ai" not in [post["slug"] for post in data]
+        for post in data:
+            assert "<mark>FastAPI</mark>" in post["search_snippet"]
+        
+        # Operator characters in user input are treated as plain text
+        response = client.get("/posts", params={"search": 'fast" OR -('})
+        assert response.status_code == 200
+    
+    def test_search_index_follows_post_changes(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test that created, updated and deleted posts are kept in the search index."""
+        token = self.get_admin_token(client)
+        response = client.post(
+            "/posts",
+            json={
+                "title": "Quokka field notes",
+                "slug": "quokka-field-notes",
+                "content": "Observations of marsupials on Rottnest Island",
+                "feather_type": "text",
+                "status": "published"
+            },
+            cookies={"session_token": token}
+        )
+        post_id = response.json()["id"]
+        
+        def search_slugs(query):
+            return [p["slug"] for p in client.get("/posts", params={"search": query}).json()]
+        
+        assert search_slugs("marsupials") == ["quokka-field-notes"]
+        
+        client.put(
+            f"/posts/{post_id}",
+            json={"content": "Now about wombats instead"},
+            cookies={"session_token": token}
+        )
+        assert search_slugs("marsupials") == []
+        assert search_slugs("wombats") == ["quokka-field-notes"]
+        
+        client.delete(f"/posts/{post_id}", cookies={"session_token": token})
+        assert search_slugs("wombats") == []
+    
+    def test_search_snippet_is_escaped(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test snippets escape post text and only add the <mark> tags themselves."""
+        token = self.get_admin_token(client)
+        client.post(
+            "/posts",
+            json={
+                "title": "Escaping notes",
+                "slug": "escaping-notes",
+                "content": "Never trust <script>alert(1)</script> in a snippet about axolotls",
+                "feather_type": "text",
+                "status": "published"
+            },
+            cookies={"session_token": token}
+        )
+        
+        for view in ("full", "summary"):
+            response = client.get("/posts", params={"search": "axolotls", "view": view})
+            snippet = response.json()[0]["search_snippet"]
+            assert "<script>" not in snippet
+            assert "&lt;script&gt;" in snippet
+            assert "<mark>axolotls</mark>" in snippet
+    
+    def test_search_index_survives_rowid_changes(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test the index is keyed on post ids, not on posts rowids (which VACUUM may renumber)."""
+        token = self.get_admin_token(client)
+        response = client.post(
+            "/posts",
+            json={
+                "title": "Numbat sightings",
+                "slug": "numbat-sightings",
+                "content": "Notes on numbats and termites",
+                "feather_type": "text",
+                "status": "published"
+            },
+            cookies={"session_token": token}
+        )
+        post_id = response.json()["id"]
+        session.exec(
+            text("UPDATE posts SET rowid = rowid + 100000 WHERE slug = 'numbat-sightings'")
+        )
+        session.commit()
+        
+        client.put(
+            f"/posts/{post_id}",
+            json={"content": "Notes on bilbies instead"},
+            cookies={"session_token": token}
+        )
+        
+        def search_slugs(query):
+            return [p["slug"] for p in client.get("/posts", params={"search": query}).json()]
+        
+        assert search_slugs("termites") == []
+        assert search_slugs("bilbies") == ["numbat-sightings"]
+
+    def test_search_index_replaces_posts_by_rowid(self, session: Session, sample_data: Dict[str, Any]):
+        """Test re-indexing a post keeps its FTS rowid and removing it drops its rowid mapping."""
+        post = sample_data["post1"]
+        index = get_search_index(session)
+
+        def fts_rowids():
+            return session.exec(
+                text("SELECT rowid FROM posts_fts WHERE post_id = :post_id").bindparams(
+                    post_id=post.id.hex
+                )
+            ).all()
+
+        index.index_post(post.id)
+        [(fts_rowid,)] = fts_rowids()
+        index.index_post(post.id)
+        assert fts_rowids() == [(fts_rowid,)]
+        mapped = session.exec(
+            text("SELECT post_id FROM post_search_rowid WHERE fts_rowid = :fts_rowid").bindparams(
+                fts_rowid=fts_rowid
+            )
+        ).all()
+        assert mapped == [(post.id.hex,)]
+
+        index.remove_post(post.id)
+        assert fts_rowids() == []
+        assert session.exec(
+            text("SELECT count(*) FROM post_search_rowid WHERE fts_rowid = :fts_rowid").bindparams(
+                fts_rowid=fts_rowid
+            )
+        ).one()[0] == 0
+    
     def test_get_post_by_slug(self, client: TestClient, sample_data: Dict[str, Any]):
         """Test getting a specific post by ID."""
         post_id = sample_data["post1"].id
@@ -619,6 +1053,57 @@ class TestBlogPosts:
         assert data["slug"] == "getting-started-fastapi"
         assert "content" in data
     
+    def test_view_count_buffered(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that post views are buffered and written back on flush."""
+        post = sample_data["post1"]
+        view_counter.flush(session)
+        
+        for _ in range(3):
+            response = client.get(f"/posts/{post.slug}")
+            assert response.status_code == 200
+        
+        session.refresh(post)
+        assert post.view_count == 0
+        assert view_counter.pending(post.id) == 3
+        
+        view_counter.flush(session)
+        session.refresh(post)
+        assert post.view_count == 3
+        assert view_counter.pending(post.id) == 0
+    
+    def test_full_view_buffer_wakes_flusher(self):
+        """Test a full buffer is flushed by the periodic flusher in a worker thread, not inline."""
+        import asyncio
+        import threading
+        from backend.services.view_counter import ViewCountBuffer
+        
+        buffer = ViewCountBuffer(max_buffered=2)
+        flush_threads = []
+        flushed = threading.Event()
+        
+        def flush(session=None):
+            flush_threads.append(threading.get_ident())
+            flushed.set()
+            return 0
+        
+        buffer.flush = flush
+        
+        async def run():
+            flusher = asyncio.ensure_future(buffer.run_periodic_flush(3600))
+            await asyncio.sleep(0)
+            post_id = uuid.uuid4()
+            buffer.record(post_id)
+            buffer.record(post_id)
+            # Recording returned without flushing in the caller
+            assert flush_threads == []
+            await asyncio.wait_for(asyncio.to_thread(flushed.wait), 5)
+            flusher.cancel()
+            return threading.get_ident()
+        
+        loop_thread = asyncio.run(run())
+        assert len(flush_threads) == 1
+        assert flush_threads[0] != loop_thread
+    
     def test_create_post(self, client: TestClient, sample_data: Dict[str, Any]):
         """Test creating a new post."""
         token = self.get_admin_token(client)
@@ -663,6 +1148,85 @@ class TestBlogPosts:
         data = response.json()
         assert data["title"] == "Updated FastAPI Tutorial"
     
+    def test_post_rendered_on_save(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that markdown is rendered to sanitized HTML and a plain excerpt when saved."""
+        token = self.get_admin_token(client)
+
+        response = client.post(
+            "/posts",
+            json={
+                "title": "Markdown Post",
+                "slug": "markdown-post",
+                "feather_type": "text",
+                "status": "published",
+                "markdown_content": "# Hello\n\nSome **bold** text <script>alert(1)</script> " + "word " * 40,
+            },
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert "<h1>Hello</h1>" in data["rendered_html"]
+        assert "<strong>bold</strong>" in data["rendered_html"]
+        assert "<script>" not in data["rendered_html"]
+        assert data["excerpt"].startswith("Hello Some bold text <script>")
+        assert data["excerpt"].endswith("word…") and len(data["excerpt"]) <= 101
+
+        post_data = session.exec(select(PostData).where(PostData.post_id == uuid.UUID(data["id"]))).one()
+        stored_hash = post_data.content_hash
+        response = client.put(
+            f"/posts/{data['id']}",
+            json={"title": "Renamed"},
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 200
+        session.refresh(post_data)
+        assert post_data.content_hash == stored_hash
+
+    def test_rendering_matches_frontend_markdown(self):
+        """Test the server renderer handles what PostView's remark-gfm rendering does."""
+        from backend.utils.rendering import make_excerpt, render_markdown
+        
+        html = render_markdown(
+            "# Title\\n\\nSee https://example.com today\\n\\n"
+            "- [x] done\\n- [ ] todo\\n\\nNoted[^1]\\n\\n[^1]: A footnote"
+        )
+        # Escaped newlines are unescaped like PostView does
+        assert "<h1>Title</h1>" in html
+        assert '<a href="https://example.com">https://example.com</a>' in html
+        assert html.count('type="checkbox"') == 2
+        assert 'checked="checked"' in html
+        assert "footnote" in html
+        assert make_excerpt("# Title\\n\\nBody") == "Title Body"
+
+    def test_rendering_keeps_escaped_newlines_in_code(self):
+        """Test a "\\n" in code spans and fenced code blocks is left as written."""
+        from backend.utils.rendering import render_markdown
+
+        html = render_markdown(
+            'Call `print("a\\n")` first\\nthen:\n\n'
+            '```python\nprint("b\\n")\n```\n'
+        )
+        assert '<code>print(&quot;a\\n&quot;)</code> first\nthen:' in html
+        assert '<code class="language-python">print(&quot;b\\n&quot;)\n</code>' in html
+
+        # A fence stored with escaped newlines still becomes a code block
+        html = render_markdown("Intro\\n\\n```\\ncode\\n```")
+        assert "<pre><code>code\n</code></pre>" in html
+
+    def test_backfill_rendered_posts(self, session: Session, sample_data: Dict[str, Any]):
+        """Test that the backfill renders existing posts once."""
+        post_count = len(session.exec(select(PostData)).all())
+
+        service = BlogService(session)
+        assert service.backfill_rendered_posts(batch_size=2) == post_count
+        assert service.backfill_rendered_posts(batch_size=2) == 0
+
+        post_data = session.exec(
+            select(PostData).where(PostData.post_id == sample_data["post1"].id)
+        ).one()
+        assert post_data.rendered_html.startswith("<h1>Getting Started with FastAPI</h1>")
+        assert post_data.excerpt.startswith("Getting Started with FastAPI FastAPI is")
+
     def test_delete_post(self, client: TestClient, sample_data: Dict[str, Any]):
         """Test deleting a post."""
         token = self.get_admin_token(client)
@@ -675,6 +1239,384 @@ class TestBlogPosts:
         assert response.status_code == 204
 
 
+class TestQueryBudgets:
+    """Test per-request query counting and endpoint query budgets."""
+
+    def test_server_timing_header(self, client: TestClient, sample_data: Dict[str, Any], monkeypatch):
+        """Test that the query counter reports queries as Server-Timing."""
+        monkeypatch.setattr(settings, "query_counter_enabled", True)
+        response = client.get("/posts")
+        assert response.status_code == 200
+        timing = response.headers["server-timing"]
+        assert timing.startswith("db;dur=")
+        with track_queries() as stats:
+            client.get("/posts")
+        assert f'desc="{stats.count} queries"' in client.get("/posts").headers["server-timing"]
+
+        monkeypatch.setattr(settings, "query_counter_enabled", False)
+        assert "server-timing" not in client.get("/posts").headers
+
+    def test_repeated_statements_flagged(self, client: TestClient, session: Session, sample_data: Dict[str, Any], monkeypatch):
+        """Test that a per-row query loop is flagged, even when its IN-lists differ in size."""
+        threshold = 5
+        post_ids = session.exec(select(Post.id)).all()
+        
+        with track_queries() as stats:
+            session.exec(select(Post)).all()
+            for i in range(threshold + 1):
+                ids = post_ids[:i % len(post_ids) + 1]
+                session.exec(select(PostData).where(PostData.post_id.in_(ids))).all()
+        
+        repeated = stats.repeated(threshold)
+        assert len(repeated) == 1
+        shape, repeats = repeated[0]
+        assert repeats == threshold + 1
+        assert "IN (?)" in shape
+        assert 'db-repeat;desc="6x same statement"' in server_timing(stats, threshold)
+        assert stats.repeated(threshold + 1) == []
+        
+        # A normal listing stays under a realistic threshold
+        monkeypatch.setattr(settings, "query_counter_enabled", True)
+        monkeypatch.setattr(settings, "query_repeat_threshold", threshold)
+        response = client.get("/posts")
+        assert "db-repeat" not in response.headers["server-timing"]
+
+    def test_endpoint_query_budgets(self, client: TestClient, sample_data: Dict[str, Any], query_budget):
+        """Test that hot endpoints stay within their query budgets."""
+        token = client.post("/auth/login", json={"username": "Admin", "password": "admin"}).json()["session_token"]
+        client.cookies.clear()
+
+        with query_budget(4):
+            client.get("/posts")
+        with query_budget(7):
+            client.get("/posts", cookies={"session_token": token})
+        with query_budget(4):
+            client.get("/posts/getting-started-fastapi")
+        with query_budget(5):
+            client.get("/site/info")
+
+
+class TestPermissions:
+    """Test permission-gated endpoints."""
+    
+    def get_user_token(self, client: TestClient):
+        """Helper to get user session token."""
+        response = client.post(
+            "/auth/login",
+            json={"username": "testuser", "password": "password123"}
+        )
+        return response.json()["session_token"]
+    
+    def test_require_permission(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that role permission changes take effect for permission checks."""
+        assert client.get("/users/").status_code == 401
+        token = self.get_user_token(client)
+        assert client.get("/users/", cookies={"session_token": token}).status_code == 403
+        
+        session.add(Permission(name="update_site_settings"))
+        session.commit()
+        role_id = sample_data["regular_user"].role_id
+        PermissionService(session).update_role_permissions(role_id, ["update_site_settings"])
+        assert client.get("/users/", cookies={"session_token": token}).status_code == 200
+        
+        PermissionService(session).update_role_permissions(role_id, [])
+        assert client.get("/users/", cookies={"session_token": token}).status_code == 403
+
+
+class TestConditionalRequests:
+    """Test ETag / Last-Modified handling on read endpoints."""
+    
+    def get_admin_token(self, client: TestClient):
+        """Helper to get admin session token."""
+        response = client.post(
+            "/auth/login",
+            json={"username": "Admin", "password": "admin"}
+        )
+        return response.json()["session_token"]
+    
+    def test_post_not_modified(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test a post revalidates with 304 until it changes."""
+        post = sample_data["post1"]
+        view_counter.flush(session)
+        
+        response = client.get(f"/posts/{post.slug}")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        last_modified = response.headers["Last-Modified"]
+        
+        response = client.get(f"/posts/{post.slug}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert view_counter.pending(post.id) == 2
+        
+        response = client.get(f"/posts/{post.slug}", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+        
+        token = self.get_admin_token(client)
+        client.post(f"/posts/{post.id}/like", cookies={"session_token": token})
+        response = client.get(f"/posts/{post.slug}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+    
+    def test_post_list_not_modified(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test the post listing revalidates until a post is added."""
+        response = client.get("/posts")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        
+        response = client.get("/posts", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        
+        token = self.get_admin_token(client)
+        client.post(
+            "/posts",
+            json={"title": "Fresh", "slug": "fresh", "content": "New", "feather_type": "text", "status": "published"},
+            cookies={"session_token": token}
+        )
+        response = client.get("/posts", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+    
+    def test_post_list_revalidates_after_removal(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test deleting or unpublishing a listed post changes the listing validator."""
+        token = self.get_admin_token(client)
+        client.cookies.clear()
+        response = client.get("/posts")
+        etag = response.headers["ETag"]
+        # Newest updated_at on the page can't tell that a post left it
+        assert "Last-Modified" not in response.headers
+        
+        client.put(
+            f"/posts/{sample_data['post2'].id}",
+            json={"status": "draft"},
+            cookies={"session_token": token}
+        )
+        client.cookies.clear()
+        response = client.get("/posts", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert sample_data["post2"].slug not in [post["slug"] for post in response.json()]
+        
+        etag = response.headers["ETag"]
+        client.delete(f"/posts/{sample_data['post1'].id}", cookies={"session_token": token})
+        client.cookies.clear()
+        response = client.get("/posts", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert sample_data["post1"].slug not in [post["slug"] for post in response.json()]
+    
+    def test_post_update_changes_etag(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test updating a post invalidates its validators."""
+        post = sample_data["post1"]
+        etag = client.get(f"/posts/{post.slug}").headers["ETag"]
+        
+        token = self.get_admin_token(client)
+        response = client.put(
+            f"/posts/{post.id}",
+            json={"title": "Renamed"},
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 200
+        response = client.get(f"/posts/{post.slug}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+
+    def test_taxonomy_changes_etag_without_touching_posts(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test renaming a category or deleting a tag changes post validators, not the posts."""
+        post = sample_data["post1"]
+        session.add(PostCategory(post_id=post.id, category_id=sample_data["tech_category"].id))
+        session.add(PostTag(post_id=post.id, tag_id=sample_data["python_tag"].id))
+        session.commit()
+        updated_at = session.get(Post, post.id).updated_at
+        post_etag = client.get(f"/posts/{post.slug}").headers["ETag"]
+        list_etag = client.get("/posts").headers["ETag"]
+
+        token = self.get_admin_token(client)
+        response = client.put(
+            f"/categories/{sample_data['tech_category'].id}",
+            json={"name": "Tech"},
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 200
+        client.cookies.clear()
+
+        response = client.get(f"/posts/{post.slug}", headers={"If-None-Match": post_etag})
+        assert response.status_code == 200
+        assert [c["name"] for c in response.json()["categories"]] == ["Tech"]
+        post_etag = response.headers["ETag"]
+        assert client.get("/posts", headers={"If-None-Match": list_etag}).status_code == 200
+
+        client.delete(f"/tags/{sample_data['python_tag'].id}", cookies={"session_token": token})
+        client.cookies.clear()
+        response = client.get(f"/posts/{post.slug}", headers={"If-None-Match": post_etag})
+        assert response.status_code == 200
+        assert response.json()["tags"] == []
+
+        session.expire_all()
+        assert session.get(Post, post.id).updated_at == updated_at
+
+    def test_site_info_not_modified(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test site info revalidates per config version and user."""
+        etag = client.get("/site/info").headers["ETag"]
+        assert client.get("/site/info", headers={"If-None-Match": etag}).status_code == 304
+        
+        token = self.get_admin_token(client)
+        response = client.get(
+            "/site/info",
+            headers={"If-None-Match": etag},
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 200
+        
+        setting = session.exec(select(Setting).where(Setting.key == "blog_title")).one()
+        setting.value = "Changed"
+        session.add(setting)
+        session.commit()
+        site_config_cache.invalidate()
+        client.cookies.clear()
+        response = client.get("/site/info", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["blog_title"] == "Changed"
+    
+    def test_taxonomy_not_modified(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test category and tag listings revalidate."""
+        for path in ("/categories/", "/tags/"):
+            etag = client.get(path).headers["ETag"]
+            assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+            assert client.get(path, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+class TestRenderedPostCache:
+    """Test the rendered post cache for anonymous post reads."""
+    
+    def get_admin_token(self, client: TestClient):
+        """Helper to get admin session token."""
+        response = client.post(
+            "/auth/login",
+            json={"username": "Admin", "password": "admin"}
+        )
+        return response.json()["session_token"]
+    
+    def test_cache_hit_skips_database(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test repeat anonymous reads are served from cache and still counted."""
+        post = sample_data["post1"]
+        view_counter.flush(session)
+        first = client.get(f"/posts/{post.slug}")
+        assert first.status_code == 200
+        assert rendered_post_cache.get(post.slug) is not None
+        
+        statements = []
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            second = client.get(f"/posts/{post.slug}")
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
+        
+        assert second.status_code == 200
+        assert statements == []
+        assert second.json() == first.json()
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert view_counter.pending(post.id) == 2
+    
+    def test_cache_invalidated_by_writes(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test likes, post updates and author renames drop the cached post."""
+        post = sample_data["post1"]
+        token = self.get_admin_token(client)
+        client.cookies.clear()
+        
+        likes = client.get(f"/posts/{post.slug}").json()["likes_count"]
+        client.post(f"/posts/{post.id}/like", cookies={"session_token": token})
+        client.cookies.clear()
+        assert client.get(f"/posts/{post.slug}").json()["likes_count"] == likes + 1
+        
+        client.put(f"/posts/{post.id}", json={"title": "Cached Title"}, cookies={"session_token": token})
+        client.cookies.clear()
+        assert client.get(f"/posts/{post.slug}").json()["title"] == "Cached Title"
+        
+        author_id = sample_data["admin_user"].id
+        client.put(f"/users/{author_id}", json={"display_name": "Renamed Author"}, cookies={"session_token": token})
+        client.cookies.clear()
+        assert client.get(f"/posts/{post.slug}").json()["author_name"] == "Renamed Author"
+    
+    def test_reader_cannot_recache_after_invalidation(self, client: TestClient, session: Session, sample_data: Dict[str, Any], monkeypatch):
+        """Test a reader that loaded the old row can't cache it after the writer commits."""
+        post = sample_data["post1"]
+        original_get = BlogService.get_post_by_slug
+        
+        def get_then_update(self, slug, current_user=None):
+            # The reader loads the post, then a writer commits before it caches
+            loaded = original_get(self, slug, current_user)
+            with Session(session.get_bind()) as writer:
+                writer_post = writer.get(Post, post.id)
+                rendered_post_cache.mark_stale(writer, Post.id == post.id)
+                writer_post.title = "Updated Meanwhile"
+                writer.add(writer_post)
+                writer.commit()
+            return loaded
+        
+        monkeypatch.setattr(BlogService, "get_post_by_slug", get_then_update)
+        assert client.get(f"/posts/{post.slug}").json()["title"] == post.title
+        assert rendered_post_cache.get(post.slug) is None
+        
+        monkeypatch.setattr(BlogService, "get_post_by_slug", original_get)
+        session.expire_all()
+        assert client.get(f"/posts/{post.slug}").json()["title"] == "Updated Meanwhile"
+        assert rendered_post_cache.get(post.slug) is not None
+    
+    def test_authenticated_reads_bypass_cache(self, client: TestClient, sample_data: Dict[str, Any]):
+        """Test only anonymous responses are cached."""
+        post = sample_data["post1"]
+        token = self.get_admin_token(client)
+        assert client.get(f"/posts/{post.slug}", cookies={"session_token": token}).status_code == 200
+        assert rendered_post_cache.get(post.slug) is None
+    
+    def test_shared_backend(self, client: TestClient, sample_data: Dict[str, Any], monkeypatch):
+        """Test the shared backend with an in-memory stand-in client."""
+        class StandInClient:
+            def __init__(self):
+                self.data = {}
+            def get(self, key):
+                return self.data.get(key)
+            def set(self, key, value, ex=None):
+                self.data[key] = value
+            def incr(self, key):
+                self.data[key] = int(self.data.get(key) or 0) + 1
+                return self.data[key]
+            def delete(self, key):
+                self.data.pop(key, None)
+            def scan_iter(self, match):
+                return [key for key in list(self.data) if key.startswith(match.rstrip("*"))]
+        
+        stand_in = StandInClient()
+        monkeypatch.setattr(rendered_post_cache, "backend", SharedPostCacheBackend(stand_in, ttl_seconds=60))
+        post = sample_data["post1"]
+        
+        first = client.get(f"/posts/{post.slug}")
+        assert f"post:{post.slug}" in stand_in.data
+        assert client.get(f"/posts/{post.slug}").json() == first.json()
+        
+        stale = rendered_post_cache.get(post.slug)
+        generation = rendered_post_cache.generation()
+        rendered_post_cache.invalidate([post.slug])
+        assert not rendered_post_cache.set(post.slug, stale, generation)
+        assert f"post:{post.slug}" not in stand_in.data
+        
+        rendered_post_cache.clear()
+        assert [key for key in stand_in.data if key.startswith("post:")] == []
+
+    def test_shared_backend_requires_redis(self, monkeypatch):
+        """Test a shared cache URL without the redis extra fails with a configuration error."""
+        import sys
+        from backend.services.post_cache import _create_backend
+
+        monkeypatch.setattr(settings, "post_cache_url", "redis://localhost:6379/0")
+        monkeypatch.setitem(sys.modules, "redis", None)
+        with pytest.raises(RuntimeError, match="'redis' extra"):
+            _create_backend()
+
+
 class TestCategories:
     """Test category endpoints."""
     
@@ -835,6 +1777,84 @@ class TestLikes:
         )
         assert response.status_code == 201
     
+    def test_like_counters(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that liking and unliking keep the post likes_count in step."""
+        token = self.get_user_token(client)
+        post = sample_data["post2"]
+        assert post.likes_count == 1
+        
+        client.post(f"/posts/{post.id}/like", cookies={"session_token": token})
+        session.refresh(post)
+        assert post.likes_count == 2
+        
+        client.delete(f"/posts/{post.id}/like", cookies={"session_token": token})
+        session.refresh(post)
+        assert post.likes_count == 1
+
+    def test_comment_counters_count_approved_comments(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Test that comments_count only counts approved comments."""
+        post = sample_data["post1"]
+        BlogService(session).reconcile_post_counters()
+        session.refresh(post)
+        assert post.comments_count == 2
+
+        token = self.get_user_token(client)
+        response = client.post(
+            f"/posts/{post.id}/comments",
+            json={"post_id": str(post.id), "content": "Waiting for moderation"},
+            cookies={"session_token": token}
+        )
+        comment_id = response.json()["id"]
+        session.refresh(post)
+        assert post.comments_count == 2
+
+        # Reconciling doesn't count the pending comment either
+        BlogService(session).reconcile_post_counters()
+        session.refresh(post)
+        assert post.comments_count == 2
+
+        session.add(Permission(name="update_site_settings"))
+        session.commit()
+        PermissionService(session).update_role_permissions(
+            sample_data["admin_user"].role_id, ["update_site_settings"]
+        )
+        admin_token = client.post(
+            "/auth/login", json={"username": "Admin", "password": "admin"}
+        ).json()["session_token"]
+        client.cookies.clear()
+
+        def moderate(status):
+            response = client.put(
+                f"/comments/{comment_id}/moderation",
+                json={"status": status},
+                cookies={"session_token": admin_token}
+            )
+            assert response.status_code == 200
+            session.refresh(post)
+            return post.comments_count
+
+        assert moderate("approved") == 3
+        assert moderate("approved") == 3
+        assert moderate("spam") == 2
+        assert moderate("approved") == 3
+
+        client.delete(f"/comments/{comment_id}", cookies={"session_token": token})
+        session.refresh(post)
+        assert post.comments_count == 2
+
+    def test_reconcile_post_counters(self, session: Session, sample_data: Dict[str, Any]):
+        """Test that reconciliation rebuilds drifted counters."""
+        post = sample_data["post1"]
+        post.likes_count = 42
+        post.comments_count = 0
+        session.add(post)
+        session.commit()
+        
+        BlogService(session).reconcile_post_counters()
+        session.refresh(post)
+        assert post.likes_count == 1
+        assert post.comments_count == 2
+    
     def test_unlike_post(self, client: TestClient, sample_data: Dict[str, Any]):
         """Test unliking a post."""
         token = self.get_user_token(client)
@@ -884,6 +1904,43 @@ class TestSiteEndpoints:
         assert "file_uploads" in data
         assert "themes" in data
 
+    def test_site_info_served_from_snapshot(self, client: TestClient, sample_data: Dict[str, Any], session: Session):
+        """Test site info comes from the config snapshot and refreshes on updates."""
+        client.get("/site/info")
+        version = site_config_cache.version
+
+        statements = []
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            if "settings" in statement or "extensions" in statement or "themes" in statement:
+                statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            response = client.get("/site/info")
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
+        assert response.status_code == 200
+        assert statements == []
+
+        session.add(Permission(name="update_site_settings"))
+        session.commit()
+        PermissionService(session).update_role_permissions(
+            sample_data["admin_user"].role_id, ["update_site_settings"]
+        )
+        login = client.post("/auth/login", json={"username": "Admin", "password": "admin"})
+        token = login.json()["session_token"]
+        response = client.patch(
+            "/site/settings",
+            json={"blog_title": "Renamed Blog"},
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 200
+        assert site_config_cache.version > version
+
+        response = client.get("/site/info")
+        assert response.json()["blog_title"] == "Renamed Blog"
+
 
 class TestThemes:
     """Test theme endpoints."""
@@ -937,6 +1994,193 @@ class TestUploads:
         assert response.status_code == 200
         # This endpoint might need authentication, but let's try without first
 
+    def test_upload_streams_to_disk(self, client: TestClient, sample_data: Dict[str, Any], tmp_path, monkeypatch):
+        """Test uploads are written in chunks with size and hash recorded."""
+        import hashlib
+        from backend.config import settings
+
+        monkeypatch.setattr(settings, "media_dir", str(tmp_path))
+        monkeypatch.setattr(settings, "upload_chunk_size", 4)
+        monkeypatch.setattr(settings, "upload_max_bytes", 32)
+        token = self.get_admin_token(client)
+
+        content = b"hello streaming upload"
+        response = client.post(
+            "/upload",
+            files={"files": ("notes.txt", content, "text/plain")},
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 201
+        data = response.json()[0]
+        assert data["file_size"] == len(content)
+        assert data["content_hash"] == hashlib.sha256(content).hexdigest()
+        assert (tmp_path / data["filename"]).read_bytes() == content
+
+        response = client.post(
+            "/upload",
+            files=[
+                ("files", ("small.txt", b"ok", "text/plain")),
+                ("files", ("big.txt", b"x" * 64, "text/plain")),
+            ],
+            cookies={"session_token": token}
+        )
+        assert response.status_code == 413
+        assert sorted(p.name for p in tmp_path.iterdir()) == [data["filename"]]
+
+    def test_oversized_upload_rejected_before_body_is_read(self, client: TestClient, monkeypatch):
+        """Test oversized upload bodies are refused without reading them to the end."""
+        import asyncio
+        from backend.config import settings
+
+        monkeypatch.setattr(settings, "upload_max_request_bytes", 1024)
+        preamble = (
+            b"--limit\r\n"
+            b'Content-Disposition: form-data; name="files"; filename="big.bin"\r\n'
+            b"Content-Type: application/octet-stream\r\n\r\n"
+        )
+        chunk = b"x" * 256
+
+        def run(headers):
+            consumed = []
+            sent = []
+
+            async def receive():
+                # An endless file part: the request only finishes if it is cut off
+                body = chunk if consumed else preamble
+                consumed.append(body)
+                return {"type": "http.request", "body": body, "more_body": True}
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "POST",
+                "scheme": "http",
+                "path": "/upload",
+                "raw_path": b"/upload",
+                "root_path": "",
+                "query_string": b"",
+                "headers": [
+                    (b"content-type", b"multipart/form-data; boundary=limit"),
+                    *headers,
+                ],
+                "client": ("testclient", 50000),
+                "server": ("testserver", 80),
+            }
+            asyncio.run(client.app(scope, receive, send))
+            return sent[0]["status"], len(consumed)
+
+        # Declared size over the limit: nothing is read
+        status, chunks_read = run([(b"content-length", str(10 * 1024 * 1024).encode())])
+        assert (status, chunks_read) == (413, 0)
+
+        # No declared size: reading stops just past the limit
+        status, chunks_read = run([])
+        assert status == 413
+        assert chunks_read <= 1024 // len(chunk) + 1
+
+
+class TestAsyncDatabase:
+    """Test the async engine mode."""
+    
+    def test_async_database_url(self):
+        """Test async drivers are picked from the database URL."""
+        from backend.config.database import get_async_database_url
+        
+        assert get_async_database_url("sqlite:///./blog.db") == "sqlite+aiosqlite:///./blog.db"
+        assert get_async_database_url("postgresql://u:p@db:5432/blog") == "postgresql+asyncpg://u:p@db:5432/blog"
+        assert get_async_database_url("postgresql+psycopg2://u:p@db/blog") == "postgresql+asyncpg://u:p@db/blog"
+        with pytest.raises(ValueError):
+            get_async_database_url("mysql://u:p@db/blog")
+    
+    def test_async_services(self, tmp_path):
+        """Test async services run the same logic on an AsyncSession."""
+        import asyncio
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlmodel.ext.asyncio.session import AsyncSession
+        from backend.services.async_services import AsyncBlogService, AsyncSiteService
+        
+        database_path = tmp_path / "async.db"
+        sync_engine = create_engine(f"sqlite:///{database_path}")
+        SQLModel.metadata.create_all(sync_engine)
+        with Session(sync_engine) as session:
+            session.add(Setting(key="blog_title", value="Async Blog", type="string"))
+            session.commit()
+        sync_engine.dispose()
+        site_config_cache.invalidate()
+        
+        async def run():
+            async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+            try:
+                async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                    site_info = await AsyncSiteService(session).get_site_info(None)
+                    posts = await AsyncBlogService(session).list_posts()
+                    missing = await AsyncBlogService(session).get_post_by_slug("missing")
+                    return site_info, posts, missing
+            finally:
+                await async_engine.dispose()
+        
+        site_info, posts, missing = asyncio.run(run())
+        assert site_info["blog_title"] == "Async Blog"
+        assert posts == []
+        assert missing is None
+
+    def test_login_and_logout_on_async_session(self, tmp_path):
+        """Test the auth endpoints work when requests get an AsyncSession."""
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlalchemy.pool import NullPool
+        from sqlmodel.ext.asyncio.session import AsyncSession
+
+        database_path = tmp_path / "async.db"
+        sync_engine = create_engine(f"sqlite:///{database_path}")
+        SQLModel.metadata.create_all(sync_engine)
+        with Session(sync_engine) as session:
+            session.add(Role(name="public", description="Public role"))
+            session.commit()
+        sync_engine.dispose()
+        role_permission_cache.invalidate()
+        auth_user_cache.clear()
+
+        # Each TestClient request runs on its own event loop, so don't pool connections
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+
+        async def get_async_session_override():
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = get_async_session_override
+        try:
+            client = TestClient(app)
+            response = client.post("/auth/register", json={
+                "username": "asyncuser",
+                "email": "async@example.com",
+                "password": "async-password",
+            })
+            assert response.status_code == 200
+            assert response.json()["role_name"] == "public"
+
+            response = client.post(
+                "/auth/login", json={"username": "asyncuser", "password": "async-password"}
+            )
+            assert response.status_code == 200
+            token = response.json()["session_token"]
+            client.cookies.clear()
+            headers = {"Authorization": f"Bearer {token}"}
+
+            response = client.get("/auth/me", headers=headers)
+            assert response.status_code == 200
+            assert response.json()["username"] == "asyncuser"
+
+            response = client.post("/auth/logout", headers=headers)
+            assert response.status_code == 200
+            auth_user_cache.clear()
+            assert client.get("/auth/me", headers=headers).status_code == 401
+        finally:
+            app.dependency_overrides.clear()
+
 
 class TestHealth:
     """Test health and utility endpoints."""
@@ -958,6 +2202,311 @@ class TestHealth:
 
 
 # Integration tests
+class TestDataGenerator:
+    """Test the bulk data generator."""
+
+    @staticmethod
+    def _generate(seed: int):
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        counts = BulkDataGenerator(engine, posts=300, seed=seed, users=20, batch_size=100).generate()
+        return engine, counts
+
+    @staticmethod
+    def _rows(engine):
+        """Every generated row that should be identical for the same seed."""
+        with Session(engine) as session:
+            return {
+                "users": session.exec(select(User.id, User.username, User.created_at).order_by(User.username)).all(),
+                "posts": session.exec(
+                    select(
+                        Post.id, Post.slug, Post.title, Post.author_id, Post.created_at,
+                        Post.published_at, Post.likes_count, Post.comments_count,
+                    ).order_by(Post.slug)
+                ).all(),
+                "post_data": session.exec(select(PostData.post_id, PostData.content).order_by(PostData.post_id)).all(),
+                "post_tags": session.exec(select(PostTag.post_id, PostTag.tag_id).order_by(PostTag.post_id, PostTag.tag_id)).all(),
+                "likes": session.exec(select(Like.id, Like.post_id, Like.user_id, Like.created_at).order_by(Like.id)).all(),
+                "comments": session.exec(select(Comment.id, Comment.post_id, Comment.content).order_by(Comment.id)).all(),
+            }
+
+    def test_generated_data_is_reproducible_and_skewed(self):
+        """Same seed, same rows; counters match; tag usage is skewed."""
+        engine, counts = self._generate(seed=7)
+        same_engine, same_counts = self._generate(seed=7)
+        assert counts == same_counts
+        assert counts["posts"] == 300
+        rows = self._rows(engine)
+        assert rows == self._rows(same_engine)
+        assert all(len(table_rows) > 0 for table_rows in rows.values())
+        # Timestamps come from the fixed epoch, not the clock
+        assert max(post.created_at for post in rows["posts"]) < EPOCH
+
+        with Session(engine) as session:
+            posts = session.exec(select(Post).order_by(Post.slug)).all()
+            assert len(posts) == 300
+            assert sum(post.likes_count for post in posts) == counts["likes"]
+            assert sum(post.comments_count for post in posts) == counts["comments"]
+            assert all(post.likes_count <= 20 for post in posts)
+
+            # Counters written inline agree with a full reconcile
+            before = {post.id: (post.likes_count, post.comments_count) for post in posts}
+            BlogService(session).reconcile_post_counters()
+            for post in posts:
+                session.refresh(post)
+                assert (post.likes_count, post.comments_count) == before[post.id]
+
+            # Zipf rank 1 tag is used far more than a tail tag
+            top = session.exec(select(Tag).where(Tag.slug == "tag-0")).one()
+            tail = session.exec(select(Tag).where(Tag.slug == "tag-150")).one()
+            usage = lambda tag: len(session.exec(select(PostTag).where(PostTag.tag_id == tag.id)).all())
+            assert usage(top) > 5 * max(1, usage(tail))
+
+            data = session.exec(select(PostData).where(PostData.post_id == posts[0].id)).one()
+            assert data.rendered_html and data.excerpt and data.content_hash
+
+        with Session(self._generate(seed=8)[0]) as session:
+            other = session.exec(select(Post.title).order_by(Post.slug)).all()
+        assert other != [post.title for post in posts]
+
+
+class TestSqliteProfile:
+    """Test the SQLite connection profile."""
+
+    def test_pragmas_applied_to_new_connections(self, tmp_path):
+        """Every connection gets the profile; WAL lets readers run during a write."""
+        engine = configure_sqlite(create_engine(f"sqlite:///{tmp_path / 'profile.db'}"))
+        SQLModel.metadata.create_all(engine)
+
+        with engine.connect() as connection:
+            pragma = lambda name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("busy_timeout") == settings.sqlite_busy_timeout_ms
+            assert pragma("cache_size") == settings.sqlite_cache_size
+            assert pragma("temp_store") == 2  # MEMORY
+            assert pragma("foreign_keys") == int(settings.sqlite_foreign_keys)
+
+        # An open write transaction doesn't block readers on other connections
+        with engine.connect() as writer, engine.connect() as reader:
+            writer.exec_driver_sql("BEGIN IMMEDIATE")
+            writer.exec_driver_sql("INSERT INTO tags (name, slug) VALUES ('Pending', 'pending')")
+            assert reader.exec_driver_sql("SELECT count(*) FROM tags").scalar() == 0
+            writer.rollback()
+
+        optimize_database(engine)
+        engine.dispose()
+
+    def test_optimize_runs_once_on_shutdown(self, tmp_path):
+        """PRAGMA optimize runs over every table at shutdown, not as pooled connections close."""
+        import sqlite3
+
+        engine = configure_sqlite(create_engine(f"sqlite:///{tmp_path / 'optimize.db'}"))
+        statements = []
+
+        @event.listens_for(engine, "connect")
+        def trace(dbapi_connection, connection_record):
+            dbapi_connection.set_trace_callback(statements.append)
+
+        with engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE readings (sensor INTEGER, value INTEGER)")
+            connection.exec_driver_sql("CREATE INDEX idx_readings_sensor ON readings (sensor)")
+            connection.exec_driver_sql(
+                "INSERT INTO readings SELECT value % 50, value FROM "
+                "(WITH RECURSIVE n(value) AS (SELECT 1 UNION ALL SELECT value + 1 FROM n LIMIT 5000) "
+                "SELECT value FROM n)"
+            )
+        with engine.connect() as busy, engine.connect() as idle:
+            idle.exec_driver_sql("SELECT 1")
+            busy.exec_driver_sql("SELECT * FROM readings WHERE sensor = 3").all()
+        engine.dispose()
+
+        optimize = lambda: [s for s in statements if s.startswith("PRAGMA optimize")]
+        assert optimize() == []
+
+        optimize_database(engine)
+        assert optimize() == ["PRAGMA optimize=0x10002"]
+
+        # Older SQLite ignores the flag that extends optimize to unqueried tables
+        if sqlite3.sqlite_version_info >= (3, 46, 0):
+            with engine.connect() as connection:
+                stats = connection.exec_driver_sql("SELECT tbl, idx FROM sqlite_stat1").all()
+            assert ("readings", "idx_readings_sensor") in stats
+        engine.dispose()
+
+
+class TestPoolMetrics:
+    """Test connection pool configuration and metrics."""
+
+    def test_pool_checkouts_and_timeouts_recorded(self, tmp_path, monkeypatch):
+        """Pool sizing comes from settings; checkouts, waits and timeouts are counted."""
+        from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+        monkeypatch.setattr(settings, "database_pool_size", 1)
+        monkeypatch.setattr(settings, "database_max_overflow", 0)
+        monkeypatch.setattr(settings, "database_pool_timeout", 0.05)
+        url = f"sqlite:///{tmp_path / 'pool.db'}"
+        engine = create_engine(url, **engine_options(url))
+        registry = PoolMetricsRegistry()
+        registry.register("primary", engine)
+
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+            stats = registry.snapshot()["primary"]
+            assert stats["pool"] == "InstrumentedQueuePool"
+            assert stats["size"] == 1
+            assert stats["checked_out"] == 1
+            assert stats["max_overflow"] == 0
+
+        with engine.connect():
+            pass
+
+        stats = registry.snapshot()["primary"]
+        assert stats["checkouts"] == 2
+        assert stats["timeouts"] == 1
+        assert stats["connections_created"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["wait_ms_max"] >= 50
+
+        # dispose() swaps the pool; metrics carry over
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert registry.snapshot()["primary"]["checkouts"] == 3
+
+    def test_pool_metrics_endpoint_requires_admin(self, client: TestClient, session: Session, sample_data: Dict[str, Any]):
+        """Only admins can read pool metrics."""
+        token = client.post(
+            "/auth/login", json={"username": "testuser", "password": "password123"}
+        ).json()["session_token"]
+        client.cookies.clear()
+        response = client.get("/metrics/pool", cookies={"session_token": token})
+        assert response.status_code == 403
+
+        session.add(Permission(name="update_site_settings"))
+        session.commit()
+        PermissionService(session).update_role_permissions(
+            sample_data["admin_user"].role_id, ["update_site_settings"]
+        )
+        token = client.post(
+            "/auth/login", json={"username": "Admin", "password": "admin"}
+        ).json()["session_token"]
+        response = client.get("/metrics/pool", cookies={"session_token": token})
+        assert response.status_code == 200
+        assert "checkouts" in response.json()["primary"]
+
+
+class TestReadReplicas:
+    """Test read replica routing, using two SQLite files as primary and replica."""
+
+    @staticmethod
+    def _database(path):
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+        SQLModel.metadata.create_all(engine)
+        return engine
+
+    def test_reads_use_replica_until_client_writes(self, tmp_path):
+        """GETs read the replica; after a write the client reads the primary for a while."""
+        primary = self._database(tmp_path / "primary.db")
+        replica = self._database(tmp_path / "replica.db")
+        router = SessionRouter(primary, ReplicaSet([replica]))
+        with Session(primary) as session:
+            session.add(User(username="reader", email="reader@example.com", password_hash=hash_password("secret123")))
+            session.add(Tag(name="Primary Only", slug="primary-only"))
+            session.commit()
+
+        def get_routed_session():
+            with router.session() as session:
+                yield session
+
+        app.dependency_overrides[get_session] = get_routed_session
+        try:
+            client = TestClient(app)
+            # The replica hasn't caught up with the tag yet
+            assert client.get("/tags/").json() == []
+
+            response = client.post("/auth/login", json={"username": "reader", "password": "secret123"})
+            assert response.status_code == 200
+            assert "primary_reads_until" in response.cookies
+
+            # Within the sticky window the client reads its own writes
+            assert [tag["slug"] for tag in client.get("/tags/").json()] == ["primary-only"]
+
+            client.cookies.clear()
+            assert client.get("/tags/").json() == []
+
+            # A failed write leaves no stickiness
+            response = client.post("/auth/login", json={"username": "reader", "password": "wrong"})
+            assert response.status_code == 401
+            assert "primary_reads_until" not in response.cookies
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_shared_caches_not_filled_from_replica(self, tmp_path):
+        """A revoked permission isn't re-cached from a replica that hasn't caught up."""
+        primary = self._database(tmp_path / "primary.db")
+        replica = self._database(tmp_path / "replica.db")
+        for engine in (primary, replica):
+            with Session(engine) as session:
+                role = Role(id=2, name="writer")
+                session.add(role)
+                session.add_all([Permission(id=1, name="read_all_posts"), Permission(id=2, name="create_post")])
+                session.add_all([RolePermission(role_id=2, permission_id=1), RolePermission(role_id=2, permission_id=2)])
+                session.commit()
+        role_permission_cache.invalidate()
+
+        with Session(primary) as session:
+            PermissionService(session).update_role_permissions(2, ["read_all_posts"])
+
+        router = SessionRouter(primary, ReplicaSet([replica]))
+        with route_request(read_only=True), router.session() as session:
+            # Ordinary reads still come from the lagging replica
+            assert len(session.exec(select(RolePermission)).all()) == 2
+            assert PermissionService(session).get_role_permission_set(2) == {"read_all_posts"}
+        assert role_permission_cache.get(2) == {"read_all_posts"}
+        role_permission_cache.invalidate()
+
+    def test_routing_session_sends_writes_to_primary(self, tmp_path):
+        """Writes go to the primary and later reads in the session follow them."""
+        primary = self._database(tmp_path / "primary.db")
+        replica = self._database(tmp_path / "replica.db")
+        with RoutingSession(primary, replica) as session:
+            assert session.exec(select(Tag)).all() == []
+            session.add(Tag(name="Written", slug="written"))
+            session.commit()
+            assert session.exec(select(Tag.slug)).all() == ["written"]
+        with Session(replica) as session:
+            assert session.exec(select(Tag)).all() == []
+
+    def test_round_robin_skips_unhealthy_replicas(self, tmp_path):
+        """Replicas rotate; one that fails its health check is skipped until it recovers."""
+        first = self._database(tmp_path / "first.db")
+        second = self._database(tmp_path / "second.db")
+        broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        replicas = ReplicaSet([first, second, broken])
+
+        assert replicas.check() == 2
+        assert [replicas.choose() for _ in range(4)] == [first, second, first, second]
+
+        replicas.mark_down(first)
+        assert {replicas.choose() for _ in range(3)} == {second}
+        replicas.mark_down(second)
+        assert replicas.choose() is None
+
+        # Nothing healthy: read-only requests fall back to the primary
+        primary = self._database(tmp_path / "primary.db")
+        with route_request(read_only=True), SessionRouter(primary, replicas).session() as session:
+            assert session.exec(select(Tag)).all() == []
+            assert session.get_bind(clause=select(Tag)) is primary
+
+        assert replicas.check() == 2
+
+
 class TestIntegration:
     """Integration tests for complex workflows."""
     
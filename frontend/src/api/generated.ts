@@ -248,6 +248,8 @@ export type PostFileFileType = string | null;
 
 export type PostFileFileSize = number | null;
 
+export type PostFileContentHash = string | null;
+
 export type PostFileDescription = string | null;
 
 /**
@@ -262,6 +264,7 @@ export interface PostFile {
   filename: string;
   file_type?: PostFileFileType;
   file_size?: PostFileFileSize;
+  content_hash?: PostFileContentHash;
   description?: PostFileDescription;
   uploaded_at?: string;
 }
@@ -276,6 +279,8 @@ export type PostFileReadMimeType = string | null;
 
 export type PostFileReadFileSize = number | null;
 
+export type PostFileReadContentHash = string | null;
+
 export type PostFileReadDescription = string | null;
 
 export type PostFileReadCreatedAt = string | null;
@@ -292,6 +297,7 @@ export interface PostFileRead {
   file_path: PostFileReadFilePath;
   mime_type: PostFileReadMimeType;
   file_size: PostFileReadFileSize;
+  content_hash: PostFileReadContentHash;
   description: PostFileReadDescription;
   created_at: PostFileReadCreatedAt;
   updated_at: PostFileReadUpdatedAt;
@@ -307,6 +313,10 @@ export type PostReadTagsItem = { [key: string]: unknown };
 
 export type PostReadContent = string | null;
 
+export type PostReadMarkdownContent = string | null;
+
+export type PostReadRenderedHtml = string | null;
+
 export type PostReadExcerpt = string | null;
 
 export type PostReadMediaUrl = string | null;
@@ -317,6 +327,8 @@ export type PostReadQuoteSource = string | null;
 
 export type PostReadLinkUrl = string | null;
 
+export type PostReadSearchSnippet = string | null;
+
 /**
  * Model for post response.
  */
@@ -336,12 +348,16 @@ export interface PostRead {
   categories?: PostReadCategoriesItem[];
   tags?: PostReadTagsItem[];
   likes_count?: number;
+  comments_count?: number;
   content?: PostReadContent;
+  markdown_content?: PostReadMarkdownContent;
+  rendered_html?: PostReadRenderedHtml;
   excerpt?: PostReadExcerpt;
   media_url?: PostReadMediaUrl;
   media_type?: PostReadMediaType;
   quote_source?: PostReadQuoteSource;
   link_url?: PostReadLinkUrl;
+  search_snippet?: PostReadSearchSnippet;
 }
 
 /**
@@ -358,6 +374,33 @@ export const PostStatus = {
   private: 'private',
 } as const;
 
+export type PostSummaryTitle = string | null;
+
+export type PostSummaryPublishedAt = string | null;
+
+export type PostSummaryExcerpt = string | null;
+
+export type PostSummarySearchSnippet = string | null;
+
+/**
+ * Model for post summary/listing.
+ */
+export interface PostSummary {
+  id: string;
+  slug: string;
+  title: PostSummaryTitle;
+  feather_type: string;
+  status: PostStatus;
+  published_at: PostSummaryPublishedAt;
+  view_count: number;
+  created_at: string;
+  author_name: string;
+  likes_count?: number;
+  comments_count?: number;
+  excerpt?: PostSummaryExcerpt;
+  search_snippet?: PostSummarySearchSnippet;
+}
+
 export type PostUpdateTitle = string | null;
 
 export type PostUpdateStatus = PostStatus | null;
@@ -579,7 +622,7 @@ category?: string | null;
  */
 tag?: string | null;
 /**
- * Search in title and content
+ * Full-text search in title and content, ranked by relevance
  */
 search?: string | null;
 /**
@@ -590,8 +633,31 @@ status?: string | null;
  * Filter by author ID
  */
 author_id?: string | null;
+/**
+ * Opaque cursor from X-Next-Cursor; replaces skip
+ */
+cursor?: string | null;
+/**
+ * `summary` returns PostSummary objects without the post body
+ */
+view?: ListPostsPostsGetView;
+/**
+ * Comma-separated fields to return, e.g. id,slug,title,excerpt
+ */
+fields?: string | null;
 };
 
+export type ListPostsPostsGetView = typeof ListPostsPostsGetView[keyof typeof ListPostsPostsGetView];
+
+
+// eslint-disable-next-line @typescript-eslint/no-redeclare
+export const ListPostsPostsGetView = {
+  full: 'full',
+  summary: 'summary',
+} as const;
+
+export type ListPostsPostsGet200 = PostRead[] | PostSummary[];
+
 export type ListCategoriesCategoriesGetParams = {
 /**
  * @minimum 0
@@ -675,6 +741,8 @@ export type UpdateRoleRolesRoleIdPut200 = { [key: string]: unknown };
 
 export type GetAllPermissionsRolesPermissionsGet200Item = { [key: string]: unknown };
 
+export type GetPoolMetricsMetricsPoolGet200 = {[key: string]: { [key: string]: unknown }};
+
 type SecondParameter<T extends (...args: never) => unknown> = Parameters<T>[1];
 
 
@@ -1129,12 +1197,26 @@ export const useDeleteUserUsersUserIdDelete = <TError = HTTPValidationError>(
 
 Returns posts with joined categories, tags, likes, and view counts.
 Private/draft posts are only visible to authenticated users.
+
+When a full page is returned, the X-Next-Cursor header holds a cursor
+for the following page. Passing it back as `cursor` gives stable keyset
+pagination; `skip` keeps working for offset pagination.
+
+Search results are ordered by relevance and include a `search_snippet`
+with matches wrapped in <mark> tags. They are paged with `skip` only.
+
+`view=summary` selects only the listing columns and returns the stored
+excerpt instead of the content. `fields` trims each post to the given
+fields; when they are all summary fields the summary query is used.
+
+Supports conditional requests: a matching If-None-Match gets a 304
+without loading the page.
  * @summary List Posts
  */
 export const listPostsPostsGet = (
     params?: ListPostsPostsGetParams,
  options?: SecondParameter<typeof customInstance>) => {
-    return customInstance<PostRead[]>(
+    return customInstance<ListPostsPostsGet200>(
     {url: `/posts`, method: 'GET',
         params
     },
@@ -1223,6 +1305,12 @@ export const useCreatePostPostsPost = <TError = HTTPValidationError>(
 
 Automatically increments view count when post is accessed.
 Private/draft posts require authentication.
+
+Supports conditional requests: a matching If-None-Match or
+If-Modified-Since gets a 304 (still counted as a view).
+
+Anonymous responses are served from the rendered post cache when
+possible, without touching the database.
  * @summary Get Post
  */
 export const getPostPostsSlugGet = (
@@ -2311,7 +2399,8 @@ export const useGetActiveThemeThemesActiveGet = <TError = unknown>(
  * Upload single or multiple files.
 
 Files are stored in the media directory configured via MEDIA_DIR env variable.
-Supports associating files with a specific post.
+Supports associating files with a specific post. Each file is limited to
+UPLOAD_MAX_BYTES; if any file is too large, none of the batch is kept.
  * @summary Upload Files
  */
 export const uploadFilesUploadPost = (
@@ -2547,7 +2636,7 @@ export const useDownloadFileUploadFileIdDownloadGet = <TError = HTTPValidationEr
 - Enabled features
 
 This endpoint provides all the essential information needed
-to configure the frontend application.
+to configure the frontend application. Supports If-None-Match.
  * @summary Get Site Info
  */
 export const getSiteInfoSiteInfoGet = (
@@ -3086,6 +3175,47 @@ export const useGetAllPermissionsRolesPermissionsGet = <TError = unknown>(
   }
 }
 
+/**
+ * Connection pool status and checkout counters for this worker process,
+one entry per engine. Requires admin permissions.
+ * @summary Get Pool Metrics
+ */
+export const getPoolMetricsMetricsPoolGet = (
+    
+ options?: SecondParameter<typeof customInstance>) => {
+    return customInstance<GetPoolMetricsMetricsPoolGet200>(
+    {url: `/metrics/pool`, method: 'GET'
+    },
+    options);
+  }
+
+
+
+export const getGetPoolMetricsMetricsPoolGetKey = () => [`/metrics/pool`] as const;
+
+export type GetPoolMetricsMetricsPoolGetQueryResult = NonNullable<Awaited<ReturnType<typeof getPoolMetricsMetricsPoolGet>>>
+export type GetPoolMetricsMetricsPoolGetQueryError = unknown
+
+/**
+ * @summary Get Pool Metrics
+ */
+export const useGetPoolMetricsMetricsPoolGet = <TError = unknown>(
+   options?: { swr?:SWRConfiguration<Awaited<ReturnType<typeof getPoolMetricsMetricsPoolGet>>, TError> & { swrKey?: Key, enabled?: boolean }, request?: SecondParameter<typeof customInstance> }
+) => {
+  const {swr: swrOptions, request: requestOptions} = options ?? {}
+
+  const isEnabled = swrOptions?.enabled !== false
+  const swrKey = swrOptions?.swrKey ?? (() => isEnabled ? getGetPoolMetricsMetricsPoolGetKey() : null);
+  const swrFn = () => getPoolMetricsMetricsPoolGet(requestOptions)
+
+  const query = useSwr<Awaited<ReturnType<typeof swrFn>>, TError>(swrKey, swrFn, swrOptions)
+
+  return {
+    swrKey,
+    ...query
+  }
+}
+
 /**
  * @summary Health Check
  */
@@ -7,6 +7,57 @@ import remarkGfm from "remark-gfm";
 import { useInView } from "react-intersection-observer"
 import { useEffect, useRef } from "react";
 
+// Unescape literal "\n" sequences outside code, like the backend's _prepare in
+// utils/rendering.py, so the fallback renders the same as rendered_html
+function unescapeNewlines(source: string): string {
+    const unescapeProse = (text: string) => {
+        let result = "";
+        let position = 0;
+        const backticks = /`+/g;
+        let opening: RegExpExecArray | null;
+        while ((opening = backticks.exec(text))) {
+            const start = opening.index;
+            const run = opening[0];
+            const escaped = text[start - 1] === "\\";
+            const fence = run.length >= 3 && (
+                /(\n|\\n) {0,3}$/.test(text.slice(Math.max(0, start - 5), start))
+                || (start <= 3 && text.slice(0, start).trim() === "")
+            );
+            let end = start + run.length;
+            if (!escaped && !fence) {
+                const closing = new RegExp(`(?<!\`)${run}(?!\`)`, "g");
+                closing.lastIndex = end;
+                const match = closing.exec(text);
+                if (match) end = match.index + match[0].length;
+            }
+            result += text.slice(position, start).replace(/\\n/g, "\n") + text.slice(start, end);
+            position = end;
+            backticks.lastIndex = end;
+        }
+        return result + text.slice(position).replace(/\\n/g, "\n");
+    };
+
+    let result = "";
+    let prose = "";
+    let fence: string | null = null;
+    for (const line of source.match(/[^\n]*\n|[^\n]+$/g) ?? []) {
+        if (fence) {
+            result += line;
+            if (new RegExp(`^ {0,3}${fence[0]}{${fence.length},}\\s*$`).test(line)) fence = null;
+            continue;
+        }
+        const opening = /^ {0,3}(`{3,}|~{3,})/.exec(line);
+        if (opening && !(opening[1][0] === "`" && line.slice(opening[0].length).includes("`"))) {
+            result += unescapeProse(prose) + line;
+            prose = "";
+            fence = opening[1];
+        } else {
+            prose += line;
+        }
+    }
+    return result + unescapeProse(prose);
+}
+
 export default function PostView({
     post,
     handleLike
@@ -32,8 +83,10 @@ export default function PostView({
     //     }
     // }, [inView, post.id, authStore.extensions.views]);
 
-    const fixedContent = post.content
-        ? post.content.replace(/\\n/g, "\n") // 🔑 unescape \n into real newlines
+    // Same source as the server rendering: markdown_content, else content
+    const source = post.markdown_content || post.content;
+    const fixedContent = source
+        ? unescapeNewlines(source) // 🔑 unescape \n into real newlines
         : "No content available";
     return <article
         key={post.slug}
@@ -95,7 +148,14 @@ export default function PostView({
                     {post.link_url}
                 </a>
             }
-            {post.feather_type !== "quote" &&
+            {post.feather_type !== "quote" && post.rendered_html &&
+                // Rendered and sanitized by the backend when the post was saved, with the
+                // same \n unescaping and GFM extensions as the fallback below
+                <div
+                    className="markdown-body bg-white! text-black!"
+                    dangerouslySetInnerHTML={{ __html: post.rendered_html }}
+                />}
+            {post.feather_type !== "quote" && !post.rendered_html &&
                 <div className="markdown-body bg-white! text-black!">
                     <Markdown remarkPlugins={[remarkGfm]}>
                         {fixedContent}
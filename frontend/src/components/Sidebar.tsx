@@ -1,9 +1,10 @@
 import { Link } from "wouter";
-import { useListPostsPostsGet } from "../api/generated";
+import { useListPostsPostsGet, type PostRead } from "../api/generated";
 import { useState } from "react";
 
 export default function Sidebar() {
-    const { data: posts } = useListPostsPostsGet()
+    const { data } = useListPostsPostsGet()
+    const posts = data as PostRead[] | undefined
 
     const archiveData = posts?.reduce((acc, post) => {
         const date = new Date(post.published_at ?? 0);
@@ -1,7 +1,7 @@
 import { useState } from "react";
 import { Link, useLocation } from "wouter";
 import AdminNav from "./AdminNav";
-import { useGetAllRolesRolesGet, useListPostsPostsGet, useListUsersUsersGet } from "../api/generated";
+import { useGetAllRolesRolesGet, useListPostsPostsGet, useListUsersUsersGet, type PostRead } from "../api/generated";
 import dayjs from "dayjs";
 import ManageUsers from "../components/ManageUsers";
 import ManageRoles from "../components/ManageRoles";
@@ -11,7 +11,8 @@ export default function ManagePage() {
   const [activeTab, setActiveTab] = useState("Posts");
   const [showNewUserForm, setShowNewUserForm] = useState(false);
 
-  const { data: posts, isLoading, error } = useListPostsPostsGet();
+  const { data, isLoading, error } = useListPostsPostsGet();
+  const posts = data as PostRead[] | undefined;
 
 
   return (
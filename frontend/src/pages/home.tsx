@@ -1,6 +1,6 @@
 "use client";
 
-import { useListPostsPostsGet } from "../api/generated";
+import { useListPostsPostsGet, type PostRead } from "../api/generated";
 import { useAuthStore } from "../state/auth";
 import dayjs from "dayjs";
 import Markdown from "react-markdown";
@@ -18,7 +18,8 @@ export default function HomePage() {
   const [searchText, setSearchText] = useState("");
 
   const { data, isLoading, error } = useListPostsPostsGet();
-  const posts = data ?? [];
+  // The default "full" view returns PostRead objects
+  const posts = (data ?? []) as PostRead[];
 
   // fuse.js search for posts by search text
   const filteredPosts = posts.filter((post) => {